@@ -0,0 +1,76 @@
+"""Benchmark of the startup of festim.MeshFromVertices: bulk build from the
+vertices array vs the former vertex-by-vertex build with a fenics.MeshEditor
+
+Usage:
+    python benchmarks/benchmark_mesh_from_vertices.py [nb_vertices ...]
+"""
+
+import sys
+import time
+
+import fenics as f
+import numpy as np
+
+import festim
+
+
+def vertex_by_vertex_mesh(vertices):
+    """Builds a 1D mesh by adding the vertices and cells one by one on rank
+    0 and distributing it (former MeshFromVertices.generate_mesh_from_vertices)
+
+    Args:
+        vertices (list): the mesh vertices
+
+    Returns:
+        fenics.Mesh: the mesh
+    """
+    mesh = f.Mesh()
+    if f.MPI.comm_world.rank == 0:
+        vertices = sorted(np.unique(vertices))
+        nb_points = len(vertices)
+        nb_cells = nb_points - 1
+        editor = f.MeshEditor()
+        editor.open(mesh, "interval", 1, 1)
+        editor.init_vertices(nb_points)
+        editor.init_cells(nb_cells)
+        for i in range(0, nb_points):
+            editor.add_vertex(i, np.array([vertices[i]]))
+        for j in range(0, nb_cells):
+            editor.add_cell(j, np.array([j, j + 1]))
+        editor.close()
+    f.MeshPartitioning.build_distributed_mesh(mesh)
+    return mesh
+
+
+if __name__ == "__main__":
+    sizes = [int(float(arg)) for arg in sys.argv[1:]] or [10**5, 10**6, 10**7]
+    comm = f.MPI.comm_world
+    if comm.rank == 0:
+        print(
+            "{:>10} {:>17} {:>15} {:>10}".format(
+                "vertices", "vertex-by-vertex", "bulk", "speedup"
+            )
+        )
+    for nb_vertices in sizes:
+        vertices = np.sort(np.random.default_rng(0).random(nb_vertices))
+
+        comm.barrier()
+        start = time.perf_counter()
+        old_mesh = vertex_by_vertex_mesh(vertices)
+        comm.barrier()
+        old_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        new_mesh = festim.MeshFromVertices(vertices).mesh
+        comm.barrier()
+        new_time = time.perf_counter() - start
+
+        assert old_mesh.num_entities_global(1) == new_mesh.num_entities_global(1)
+        if comm.size == 1:
+            assert np.array_equal(old_mesh.coordinates(), new_mesh.coordinates())
+        if comm.rank == 0:
+            print(
+                "{:>10} {:>16.3f}s {:>14.3f}s {:>9.1f}x".format(
+                    nb_vertices, old_time, new_time, old_time / new_time
+                )
+            )
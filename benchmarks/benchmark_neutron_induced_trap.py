@@ -0,0 +1,78 @@
+"""Benchmark of the density update of festim.NeutronInducedTrap: nodewise
+closed-form implicit Euler step vs variational problem (neutron damage with
+annealing)
+
+Usage:
+    python benchmarks/benchmark_neutron_induced_trap.py
+"""
+
+import time
+
+import fenics as f
+import numpy as np
+
+import festim
+
+
+def run(nb_cells, nodewise, nb_steps=20):
+    """Solves the density of a NeutronInducedTrap on a 1D mesh
+
+    Args:
+        nb_cells (int): the number of cells of the mesh
+        nodewise (bool): the nodewise argument of the trap
+        nb_steps (int, optional): the number of time steps. Defaults to 20.
+
+    Returns:
+        float, np.ndarray: the time spent in the density updates (s) and the
+            final density at the dofs
+    """
+    mesh = f.UnitIntervalMesh(nb_cells)
+    V = f.FunctionSpace(mesh, "P", 1)
+    T = festim.Temperature(value=800)
+    T.T = f.interpolate(f.Constant(800), V)
+    dt = festim.Stepsize(initial_value=1e4)
+    trap = festim.NeutronInducedTrap(
+        1,
+        1,
+        1,
+        1,
+        "mat_name",
+        phi=9.64e-7,
+        K=3.5e28,
+        n_max=1e40,
+        A_0=6.18e-3,
+        E_A=0.24,
+        nodewise=nodewise,
+    )
+    trap.density = [f.Function(V)]
+    trap.density_previous_solution = f.Function(V)
+    trap.density_test_function = f.TestFunction(V)
+    trap.create_form_density(f.dx, dt, T)
+
+    start = time.perf_counter()
+    for i in range(nb_steps):
+        trap.solve_density(dt, T)
+        trap.density_previous_solution.assign(trap.density[0])
+    elapsed = time.perf_counter() - start
+    return elapsed, trap.density[0].vector().get_local()
+
+
+if __name__ == "__main__":
+    f.set_log_level(f.LogLevel.WARNING)
+    print(
+        "{:>10} {:>15} {:>15} {:>10}".format(
+            "cells", "variational", "nodewise", "speedup"
+        )
+    )
+    for nb_cells in [10**3, 10**4, 10**5]:
+        variational_time, variational = run(nb_cells, nodewise=False)
+        nodewise_time, nodewise = run(nb_cells, nodewise=True)
+        assert np.allclose(nodewise, variational, rtol=1e-8)
+        print(
+            "{:>10} {:>14.3f}s {:>14.3f}s {:>9.1f}x".format(
+                nb_cells,
+                variational_time,
+                nodewise_time,
+                variational_time / nodewise_time,
+            )
+        )
@@ -0,0 +1,63 @@
+"""Benchmark of the volume markers of 1D meshes: vectorised
+Mesh1D.define_volume_markers vs the former loop over the cells calling
+Materials.find_subdomain_from_x_coordinate
+
+Usage:
+    python benchmarks/benchmark_volume_markers_1d.py [nb_cells ...]
+"""
+
+import sys
+import time
+
+import fenics as f
+import numpy as np
+
+import festim
+
+
+def cell_by_cell_volume_markers(mesh, materials):
+    """Marks the cells one by one from their midpoints (former
+    Mesh1D.define_volume_markers)
+
+    Args:
+        mesh (fenics.Mesh): the mesh
+        materials (festim.Materials): the materials
+
+    Returns:
+        fenics.MeshFunction: the volume markers
+    """
+    volume_markers = f.MeshFunction("size_t", mesh, mesh.topology().dim(), 0)
+    for cell in f.cells(mesh):
+        x = cell.midpoint().x()
+        volume_markers[cell] = materials.find_subdomain_from_x_coordinate(x)
+    return volume_markers
+
+
+if __name__ == "__main__":
+    sizes = [int(float(arg)) for arg in sys.argv[1:]] or [10**4, 10**5, 10**6]
+    materials = festim.Materials(
+        [
+            festim.Material([1, 2], 1, 0, borders=[[0, 0.3], [0.6, 1]]),
+            festim.Material(3, 1, 0, borders=[0.3, 0.6]),
+        ]
+    )
+    print(
+        "{:>10} {:>15} {:>15} {:>10}".format("cells", "loop", "vectorised", "speedup")
+    )
+    for nb_cells in sizes:
+        my_mesh = festim.MeshFromVertices(np.linspace(0, 1, num=nb_cells + 1))
+
+        start = time.perf_counter()
+        expected = cell_by_cell_volume_markers(my_mesh.mesh, materials)
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        produced = my_mesh.define_volume_markers(materials)
+        vectorised_time = time.perf_counter() - start
+
+        assert np.array_equal(produced.array(), expected.array())
+        print(
+            "{:>10} {:>14.3f}s {:>14.3f}s {:>9.1f}x".format(
+                nb_cells, loop_time, vectorised_time, loop_time / vectorised_time
+            )
+        )
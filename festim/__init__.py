@@ -27,12 +27,14 @@ from .helpers import (
     as_constant,
     as_expression,
     as_constant_or_expression,
+    is_DG1_function,
+    set_quadrature_degree,
 )
 
 from .meshing.mesh import Mesh
 from .meshing.mesh_1d import Mesh1D
-from .meshing.mesh_from_refinements import MeshFromRefinements
 from .meshing.mesh_from_vertices import MeshFromVertices
+from .meshing.mesh_from_refinements import MeshFromRefinements
 from .meshing.mesh_from_xdmf import MeshFromXDMF
 
 from .temperature.temperature import Temperature
@@ -105,5 +107,6 @@ from .concentration.traps.extrinsic_trap import ExtrinsicTrap
 from .concentration.traps.neutron_induced_trap import NeutronInducedTrap
 
 from .h_transport_problem import HTransportProblem
+from .h_transport_problem_1d import HTransportProblem1D
 
 from .generic_simulation import Simulation
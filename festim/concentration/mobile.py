@@ -108,7 +108,7 @@ class Mobile(Concentration):
         # add the traps transient terms
         if dt is not None:
             if traps is not None:
-                for trap in traps.traps:
+                for trap in traps.fields:
                     F += (
                         ((trap.solution - trap.previous_solution) / dt.value)
                         * self.test_function
@@ -12,6 +12,7 @@ class Theta(Mobile):
         super().__init__()
         self.S = None
         self.F = None
+        self.post_processing_solver = None
 
     def initialise(self, V, value, label=None, time_step=None):
         """Assign a value to self.previous_solution
@@ -88,14 +89,10 @@ class Theta(Mobile):
         The attribute post_processing_solution is fenics.Product (if self.S is
         festim.ArheniusCoeff)
         """
-        problem = f.LinearVariationalProblem(
-            a=f.lhs(self.form_post_processing),
-            L=f.rhs(self.form_post_processing),
-            u=self.post_processing_solution,
-            bcs=[],
-        )
-        solver = f.LinearVariationalSolver(problem)
-        solver.solve()
+        if isinstance(self.post_processing_solver, f.LocalSolver):
+            self.post_processing_solver.solve_local_rhs(self.post_processing_solution)
+        else:
+            self.post_processing_solver.solve()
 
     def create_form_post_processing(self, V, materials, dx):
         """Creates a variational formulation for c = theta * S or theta**2 * S
@@ -120,3 +117,18 @@ class Theta(Mobile):
 
         self.form_post_processing = F
         self.post_processing_solution = f.Function(V)
+
+        # the solver is created once, for DG spaces the mass matrix is block
+        # diagonal and the problem is solved cell by cell
+        if V.ufl_element().family() == "Discontinuous Lagrange":
+            solver = f.LocalSolver(f.lhs(F), f.rhs(F), f.LocalSolver.SolverType.LU)
+            solver.factorize()
+        else:
+            problem = f.LinearVariationalProblem(
+                a=f.lhs(F),
+                L=f.rhs(F),
+                u=self.post_processing_solution,
+                bcs=[],
+            )
+            solver = f.LinearVariationalSolver(problem)
+        self.post_processing_solver = solver
@@ -1,7 +1,18 @@
 from festim import Trap, as_constant_or_expression
+import fenics as f
 
 
 class ExtrinsicTrapBase(Trap):
+    """Base class of the traps whose density evolves in time.
+
+    Attributes:
+        supports_closed_form (bool): True if the subclass defines
+            closed_form_density(n_old, dt, T), which returns the density at
+            the dofs after one implicit Euler step (needed for nodewise=True)
+    """
+
+    supports_closed_form = False
+
     def __init__(
         self,
         k_0,
@@ -14,6 +25,8 @@ class ExtrinsicTrapBase(Trap):
         relative_tolerance=1e-10,
         maximum_iterations=30,
         linear_solver=None,
+        nodewise=False,
+        monolithic=False,
         **kwargs,
     ):
         """Inits ExtrinsicTrap
@@ -36,17 +49,116 @@ class ExtrinsicTrapBase(Trap):
                 If None, the default fenics linear solver will be used ("umfpack").
                 More information can be found at: https://fenicsproject.org/pub/tutorial/html/._ftut1017.html.
                 Defaults to None.
+            nodewise (bool, optional): if True, the density ODE is
+                integrated at each dof with the closed-form solution of the
+                implicit Euler scheme (see update_density_nodewise) instead
+                of solving the variational problem. The two only differ when
+                the coefficients vary within the cells (the variational
+                problem uses a consistent mass matrix). Defaults to False.
+            monolithic (bool, optional): if True, the density is an extra
+                component of the mixed function space of the H transport
+                problem and is solved implicitly with the concentrations
+                instead of after them. Defaults to False.
+
+        Raises:
+            ValueError: if both nodewise and monolithic are True
+            ValueError: if nodewise is True and the trap has no closed-form
+                density update
         """
         super().__init__(k_0, E_k, p_0, E_p, materials, density=None, id=id)
+        # the density is solved at each time step
+        self.density_is_time_dependent = True
         self.absolute_tolerance = absolute_tolerance
         self.relative_tolerance = relative_tolerance
         self.maximum_iterations = maximum_iterations
         self.linear_solver = linear_solver
+        self.nodewise = nodewise
+        self.monolithic = monolithic
+        if self.nodewise and self.monolithic:
+            raise ValueError("nodewise and monolithic can't both be True")
+        if self.nodewise and not self.supports_closed_form:
+            raise ValueError(
+                "{} has no closed-form density update, nodewise must be False".format(
+                    type(self).__name__
+                )
+            )
 
         for name, val in kwargs.items():
             setattr(self, name, as_constant_or_expression(val))
         self.density_previous_solution = None
         self.density_test_function = None
+        self.density_solver = None
+        self._nodal_functions = {}
+
+    def solve_density(self, dt=None, T=None):
+        """Computes the density at the current time step, either nodewise
+        (if self.nodewise is True) or by solving the variational problem.
+        The solver of the variational problem is created once.
+
+        Args:
+            dt (festim.Stepsize, optional): the stepsize of the simulation,
+                only needed if self.nodewise is True. Defaults to None.
+            T (festim.Temperature, optional): the temperature of the
+                simulation, only needed if self.nodewise is True. Defaults to
+                None.
+        """
+        if self.nodewise:
+            self.update_density_nodewise(dt, T)
+            return
+
+        form = self.form_density
+        if self.density_solver is None or self.density_solver[0] is not form:
+            du_t = f.TrialFunction(self.density[0].function_space())
+            J_t = f.derivative(form, self.density[0], du_t)
+            problem = f.NonlinearVariationalProblem(form, self.density[0], [], J_t)
+            solver = f.NonlinearVariationalSolver(problem)
+            solver.parameters["newton_solver"][
+                "absolute_tolerance"
+            ] = self.absolute_tolerance
+            solver.parameters["newton_solver"][
+                "relative_tolerance"
+            ] = self.relative_tolerance
+            solver.parameters["newton_solver"][
+                "maximum_iterations"
+            ] = self.maximum_iterations
+            solver.parameters["newton_solver"]["linear_solver"] = self.linear_solver
+            self.density_solver = (form, solver)
+        self.density_solver[1].solve()
+
+    def update_density_nodewise(self, dt, T):
+        """Integrates the density ODE at each dof with the implicit Euler
+        scheme solved in closed form (closed_form_density of the subclasses
+        supporting it) and assigns the result to the density
+
+        Args:
+            dt (festim.Stepsize): the stepsize of the simulation
+            T (festim.Temperature): the temperature of the simulation
+        """
+        density = self.density[0]
+        n_old = self.density_previous_solution.vector().get_local()
+        n = self.closed_form_density(n_old, float(dt.value), T)
+        density.vector().set_local(n)
+        density.vector().apply("insert")
+
+    def nodal_values(self, coefficient):
+        """Returns the values of a coefficient (fenics.Constant, Expression,
+        Function...) at the dofs of the density
+
+        Args:
+            coefficient (ufl.Coefficient): the coefficient
+
+        Returns:
+            float or np.ndarray: the values
+        """
+        if isinstance(coefficient, f.Constant):
+            return float(coefficient)
+        V = self.density[0].function_space()
+        key = id(coefficient)
+        if key not in self._nodal_functions:
+            self._nodal_functions[key] = f.Function(V)
+        function = self._nodal_functions[key]
+        function.interpolate(coefficient)
+        return function.vector().get_local()
 
 
 class ExtrinsicTrap(ExtrinsicTrapBase):
@@ -63,6 +175,8 @@ class ExtrinsicTrap(ExtrinsicTrapBase):
         id (int, optional): The trap id. Defaults to None.
     """
 
+    supports_closed_form = True
+
     def __init__(
         self,
         k_0,
@@ -127,3 +241,28 @@ class ExtrinsicTrap(ExtrinsicTrapBase):
             * dx
         )
         self.form_density = F
+
+    def closed_form_density(self, n_old, dt, T):
+        """Returns the density at the dofs after one implicit Euler step of
+        dn/dt = phi_0 * ((1 - n/n_amax) * eta_a * f_a
+        + (1 - n/n_bmax) * eta_b * f_b)
+        which is linear in n and therefore solved in closed form
+
+        Args:
+            n_old (np.ndarray): the density at the previous time step
+            dt (float): the stepsize
+            T (festim.Temperature): the temperature of the simulation
+                (unused)
+
+        Returns:
+            np.ndarray: the density
+        """
+        phi_0 = self.nodal_values(self.phi_0)
+        source_a = self.nodal_values(self.eta_a) * self.nodal_values(self.f_a)
+        source_b = self.nodal_values(self.eta_b) * self.nodal_values(self.f_b)
+        n_amax = self.nodal_values(self.n_amax)
+        n_bmax = self.nodal_values(self.n_bmax)
+
+        numerator = n_old + dt * phi_0 * (source_a + source_b)
+        denominator = 1 + dt * phi_0 * (source_a / n_amax + source_b / n_bmax)
+        return numerator / denominator
@@ -1,5 +1,6 @@
 from festim import ExtrinsicTrapBase, k_B
 import fenics as f
+import numpy as np
 
 
 class NeutronInducedTrap(ExtrinsicTrapBase):
@@ -28,6 +29,8 @@ class NeutronInducedTrap(ExtrinsicTrapBase):
         id (int, optional): The trap id. Defaults to None.
     """
 
+    supports_closed_form = True
+
     def __init__(
         self,
         k_0,
@@ -92,3 +95,26 @@ class NeutronInducedTrap(ExtrinsicTrapBase):
         )
 
         self.form_density = F
+
+    def closed_form_density(self, n_old, dt, T):
+        """Returns the density at the dofs after one implicit Euler step of
+        dn/dt = phi*K*(1 - n/n_max) - A_0*exp(-E_A/(k_B*T))*n
+        which is linear in n and therefore solved in closed form
+
+        Args:
+            n_old (np.ndarray): the density at the previous time step
+            dt (float): the stepsize
+            T (festim.Temperature): the temperature of the simulation
+
+        Returns:
+            np.ndarray: the density
+        """
+        creation = self.nodal_values(self.phi) * self.nodal_values(self.K)
+        n_max = self.nodal_values(self.n_max)
+        annealing = self.nodal_values(self.A_0) * np.exp(
+            -self.nodal_values(self.E_A) / (k_B * self.nodal_values(T.T))
+        )
+
+        numerator = n_old + dt * creation
+        denominator = 1 + dt * (creation / n_max + annealing)
+        return numerator / denominator
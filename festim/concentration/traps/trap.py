@@ -1,4 +1,4 @@
-from festim import Concentration, k_B, Material, Theta
+from festim import Concentration, k_B, Material, Theta, t as t_symbol
 from fenics import *
 import sympy as sp
 import numpy as np
@@ -16,6 +16,21 @@ class Trap(Concentration):
         density (sp.Add, float, list, fenics.Expresion, fenics.UserExpression):
             the trap density (m-3)
         id (int, optional): The trap id. Defaults to None.
+        quasi_steady_state (bool, optional): if True, the trap is assumed
+            in equilibrium with the mobile concentration and is eliminated
+            from the mixed function space (see create_equilibrium_form).
+            Suited for traps detrapping much faster than the stepsize.
+            Defaults to False.
+
+    Attributes:
+        density (list): the trap densities (fenics.Expression). Created from
+            input_density when first accessed
+        input_density (list): the trap densities as given (sympy
+            expressions, floats...), used by the native 1D engine
+        quasi_steady_state (bool): trap in quasi-steady state or not
+        density_is_time_dependent (bool): True if one of the densities may
+            depend on time (fenics Expressions and UserExpressions are
+            assumed to), else False
 
     Raises:
         ValueError: if duplicates are found in materials
@@ -36,21 +51,43 @@ class Trap(Concentration):
         This will act as a singular trap but with seperate properties for
         respective materials. Parameters k_0, E_k, p_0, E_p, materials and
         density MUST have the same length for this method to be valid.
+        festim.Traps does this automatically for traps living in disjoint
+        materials (see festim.Traps.conglomerate_traps).
     """
 
-    def __init__(self, k_0, E_k, p_0, E_p, materials, density, id=None):
+    def __init__(
+        self, k_0, E_k, p_0, E_p, materials, density, id=None, quasi_steady_state=False
+    ):
         super().__init__()
         self.id = id
+        self.quasi_steady_state = quasi_steady_state
         self.k_0 = k_0
         self.E_k = E_k
         self.p_0 = p_0
         self.E_p = E_p
         self.materials = materials
 
-        self.density = []
+        self._density = None
+        self.input_density = []
+        self.density_is_time_dependent = False
         self.make_density(density)
         self.sources = []
 
+    @property
+    def density(self):
+        # the fenics Expressions are only compiled when the densities are
+        # needed (never with the native 1D engine)
+        if self._density is None:
+            self._density = [
+                self.create_density_expression(density, i)
+                for i, density in enumerate(self.input_density)
+            ]
+        return self._density
+
+    @density.setter
+    def density(self, value):
+        self._density = value
+
     @property
     def materials(self):
         return self._materials
@@ -86,25 +123,48 @@ class Trap(Concentration):
             raise ValueError("Duplicate materials in trap")
 
     def make_density(self, densities):
+        """Stores the densities in self.input_density and checks if they
+        depend on time. The fenics Expressions are created later (see
+        self.density).
+
+        Args:
+            densities (list, sp.Add, float, fenics.Expression...): the
+                densities
+        """
         if type(densities) is not list:
             densities = [densities]
 
-        for i, density in enumerate(densities):
+        for density in densities:
             if density is not None:
-                # if density is already a fenics Expression, use it as is
+                self.input_density.append(density)
                 if isinstance(density, (Expression, UserExpression)):
-                    self.density.append(density)
-                # else assume it's a sympy expression
-                else:
-                    density_expr = sp.printing.ccode(density)
-                    self.density.append(
-                        Expression(
-                            density_expr,
-                            degree=2,
-                            t=0,
-                            name="density_{}_{}".format(self.id, i),
-                        )
-                    )
+                    self.density_is_time_dependent = True
+                elif t_symbol in sp.sympify(density).free_symbols:
+                    self.density_is_time_dependent = True
+        self._density = None
+
+    def create_density_expression(self, density, i):
+        """Returns the fenics Expression of a density
+
+        Args:
+            density (sp.Add, float, fenics.Expression, fenics.UserExpression):
+                the density
+            i (int): the index of the density
+
+        Returns:
+            fenics.Expression, fenics.UserExpression: the density
+        """
+        # if density is already a fenics Expression, use it as is
+        if isinstance(density, (Expression, UserExpression)):
+            return density
+        # else assume it's a sympy expression
+        density_expr = sp.printing.ccode(density)
+        return Expression(
+            density_expr,
+            degree=2,
+            t=0,
+            name="density_{}_{}".format(self.id, i),
+        )
 
     def create_form(self, mobile, materials, T, dx, dt=None):
         """Creates the general form associated with the trap
@@ -156,22 +216,13 @@ class Trap(Concentration):
                     F_trapping += solution * test_function * dx(mat.id)
 
         for i, mat in enumerate(self.materials):
-            if type(self.k_0) is list:
-                k_0 = self.k_0[i]
-                E_k = self.E_k[i]
-                p_0 = self.p_0[i]
-                E_p = self.E_p[i]
-                density = self.density[i]
-            else:
-                k_0 = self.k_0
-                E_k = self.E_k
-                p_0 = self.p_0
-                E_p = self.E_p
-                density = self.density[0]
+            k_0, E_k, p_0, E_p, density = self.get_properties(i)
 
             # add the density to the list of
-            # expressions to be updated
-            expressions_trap.append(density)
+            # expressions to be updated (densities of extrinsic traps are
+            # solved and not updated)
+            if isinstance(density, (Expression, UserExpression)):
+                expressions_trap.append(density)
 
             if isinstance(mobile, Theta) and mat.solubility_law == "henry":
                 raise NotImplementedError(
@@ -197,6 +248,121 @@ class Trap(Concentration):
         self.F += self.F_trapping
         self.sub_expressions += expressions_trap
 
+    def get_properties(self, i):
+        """Returns the properties of the trap in its i-th material
+
+        Args:
+            i (int): the index of the material in self.materials
+
+        Returns:
+            k_0, E_k, p_0, E_p, density: the properties
+        """
+        if type(self.k_0) is list:
+            return (
+                self.k_0[i],
+                self.E_k[i],
+                self.p_0[i],
+                self.E_p[i],
+                self.density[i],
+            )
+        return self.k_0, self.E_k, self.p_0, self.E_p, self.density[0]
+
+    def slowest_detrapping_rate(self, T):
+        """Returns the slowest detrapping rate of the trap in its materials
+
+        Args:
+            T (float): the temperature (K)
+
+        Returns:
+            float: the detrapping rate (s-1), None if p_0 or E_p isn't a
+                scalar constant (eg. a sympy expression or a
+                fenics.Expression)
+        """
+        rates = []
+        for i in range(len(self.materials)):
+            _, _, p_0, E_p, _ = self.get_properties(i)
+            if not (is_scalar_constant(p_0) and is_scalar_constant(E_p)):
+                return None
+            rates.append(float(p_0) * np.exp(-float(E_p) / k_B / T))
+        return min(rates)
+
+    def equilibrium_concentration(self, c_0, T, i):
+        """Returns the trapped concentration in equilibrium with the mobile
+        concentration (k c_m (n - c_t) = p c_t) in the i-th material
+
+        Args:
+            c_0 (ufl.Expr): the mobile concentration
+            T (fenics.Function): the temperature
+            i (int): the index of the material in self.materials
+
+        Returns:
+            ufl.Expr: the trapped concentration
+        """
+        k_0, E_k, p_0, E_p, density = self.get_properties(i)
+        k = k_0 * exp(-E_k / k_B / T)
+        p = p_0 * exp(-E_p / k_B / T)
+        return density * k * c_0 / (k * c_0 + p)
+
+    def create_equilibrium_form(self, mobile, materials, T, dx, dt=None):
+        """Creates the contribution of the trap to the mobile equation when
+        the trap is in local equilibrium with the mobile concentration:
+        d c_t(c_m)/dt, tested with the test function of mobile. This is
+        equivalent to an effective diffusivity D/(1 + dc_t/dc_m) with the
+        capacity 1 + dc_t/dc_m.
+
+        Args:
+            mobile (festim.Mobile): the mobile concentration of the simulation
+            materials (festim.Materials): the materials of the simulation
+            T (festim.Temperature): the temperature of the simulation
+            dx (fenics.Measure): the dx measure of the sim
+            dt (festim.Stepsize, optional): If None assuming steady state.
+                Defaults to None.
+        """
+        if not all(isinstance(mat, Material) for mat in self.materials):
+            self.make_materials(materials)
+
+        test_function = mobile.test_function
+        F = 0
+        for i, mat in enumerate(self.materials):
+            density = self.get_properties(i)[4]
+            if isinstance(density, (Expression, UserExpression)):
+                self.sub_expressions.append(density)
+
+            if isinstance(mobile, Theta) and mat.solubility_law == "henry":
+                raise NotImplementedError(
+                    "Henry law of solubility is not implemented with traps"
+                )
+
+            if dt is not None:
+                c_0, c_0_n = mobile.get_concentration_for_a_given_material(mat, T)
+                c_t = self.equilibrium_concentration(c_0, T.T, i)
+                c_t_n = self.equilibrium_concentration(c_0_n, T.T_n, i)
+                F += ((c_t - c_t_n) / dt.value) * test_function * dx(mat.id)
+        self.F = F
+
+    def create_equilibrium_projection(self, mobile, T, dx, V):
+        """Creates self.post_processing_solution and the fenics.LocalSolver
+        (self.equilibrium_projector) projecting the equilibrium trapped
+        concentration on it
+
+        Args:
+            mobile (festim.Mobile): the mobile concentration of the simulation
+            T (festim.Temperature): the temperature of the simulation
+            dx (fenics.Measure): the dx measure of the sim
+            V (fenics.FunctionSpace): a DG function space
+        """
+        u = TrialFunction(V)
+        v = TestFunction(V)
+        L = 0
+        for i, mat in enumerate(self.materials):
+            c_0, _ = mobile.get_concentration_for_a_given_material(mat, T)
+            L += self.equilibrium_concentration(c_0, T.T, i) * v * dx(mat.id)
+        self.equilibrium_projector = LocalSolver(
+            u * v * dx, L, LocalSolver.SolverType.Cholesky
+        )
+        self.equilibrium_projector.factorize()
+        self.post_processing_solution = Function(V)
+
     def create_source_form(self, dx):
         """Create the source form for the trap
 
@@ -207,3 +373,17 @@ class Trap(Concentration):
             self.F_source = -source.value * self.test_function * dx(source.volume)
             self.F += self.F_source
             self.sub_expressions.append(source.value)
+
+
+def is_scalar_constant(value):
+    """Checks if a value is a number or a scalar fenics.Constant
+
+    Args:
+        value (object): the value
+
+    Returns:
+        bool: True if the value is a scalar constant
+    """
+    if isinstance(value, Constant):
+        return value.ufl_shape == ()
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
@@ -1,13 +1,41 @@
 import festim
 import fenics as f
+import numpy as np
+import warnings
 
 
 class Traps:
-    def __init__(self, traps=[]) -> None:
+    """
+    Args:
+        traps (list, optional): list of festim.Trap. Defaults to [].
+        conglomerate (bool, optional): if True, the traps living in
+            disjoint materials are automatically merged into as few fields
+            (components of the mixed function space) as possible when the
+            simulation is initialised. Defaults to False.
+
+    Attributes:
+        traps (list): the traps
+        conglomerate (bool): merge the traps or not
+        quasi_steady_state (bool): if True, all the traps are in
+            quasi-steady state (see festim.Settings.equilibrium_traps), else
+            only the traps with quasi_steady_state=True
+        fields (list): the festim.Trap objects holding the trap components
+            of the function space (either traps of self.traps or the
+            conglomerates of several of them). The traps in quasi-steady
+            state have no component.
+        quasi_steady_state_traps (list): the traps in quasi-steady state
+    """
+
+    def __init__(self, traps=[], conglomerate=False) -> None:
         self.traps = traps
+        self.conglomerate = conglomerate
+        self.quasi_steady_state = False
         self.F = None
         self.extrinsic_formulations = []
         self.sub_expressions = []
+        self._fields = None
+        self._members = {}
+        self._members_dofs = []
 
         # add ids if unspecified
         for i, trap in enumerate(self.traps, 1):
@@ -27,16 +55,199 @@ class Traps:
         else:
             raise TypeError("traps must be a list")
 
+    @property
+    def fields(self):
+        fields = self.traps if self._fields is None else self._fields
+        quasi_steady_state_traps = self.quasi_steady_state_traps
+        return [field for field in fields if field not in quasi_steady_state_traps]
+
+    @property
+    def quasi_steady_state_traps(self):
+        return [
+            trap
+            for trap in self.traps
+            if self.quasi_steady_state or trap.quasi_steady_state
+        ]
+
     def make_traps_materials(self, materials):
         for trap in self.traps:
             trap.make_materials(materials)
 
+    def conglomerate_traps(self, mesh, element_type="CG", excluded=[]):
+        """Merges the traps living in disjoint materials into as few fields
+        as possible (greedy colouring of the conflicts between traps, in the
+        order of self.traps). Only festim.Trap objects (not extrinsic traps)
+        are merged. With CG elements, the materials of merged traps can't
+        share vertices since the field is continuous.
+        The materials of the traps must be festim.Material objects (see
+        make_traps_materials).
+        Each conglomerate is given a new id, following the largest integer
+        id of the traps.
+
+        Args:
+            mesh (festim.Mesh): the mesh
+            element_type (str, optional): the finite element of the traps
+                ("CG" or "DG"). Defaults to "CG".
+            excluded (list, optional): the traps that can't be merged (eg.
+                traps with initial conditions). Defaults to [].
+        """
+        self._fields = None
+        self._members = {}
+        if not self.conglomerate:
+            return
+
+        candidates = [
+            trap
+            for trap in self.traps
+            if type(trap) is festim.Trap
+            and trap not in excluded
+            and trap not in self.quasi_steady_state_traps
+        ]
+        conflicts = traps_conflicts(candidates, mesh, element_type)
+        groups = []
+        for i, trap in enumerate(candidates):
+            for group in groups:
+                if not any(conflicts[i, j] for j, _ in group):
+                    group.append((i, trap))
+                    break
+            else:
+                groups.append([(i, trap)])
+        group_of = {
+            trap: [member for _, member in group]
+            for group in groups
+            for _, trap in group
+        }
+        if all(len(group) == 1 for group in groups):
+            return
+
+        int_ids = [trap.id for trap in self.traps if isinstance(trap.id, int)]
+        new_id = max(int_ids, default=0)
+        fields = []
+        for trap in self.traps:
+            members = group_of.get(trap, [trap])
+            if len(members) == 1:
+                fields.append(trap)
+            elif trap is members[0]:
+                new_id += 1
+                merged_trap = merge_traps(members)
+                merged_trap.id = new_id
+                self._members[merged_trap] = members
+                fields.append(merged_trap)
+        self._fields = fields
+
+    def create_members_functions(self, V, mesh):
+        """Creates the post-processing functions of the traps merged in
+        conglomerates. Each of them holds the values of the conglomerate
+        at the dofs of the cells of the trap's materials, zero elsewhere.
+
+        Args:
+            V (fenics.FunctionSpace): the function space of the H transport
+                problem
+            mesh (festim.Mesh): the mesh
+        """
+        self._members_dofs = []
+        for k, field in enumerate(self.fields, 1):
+            if field not in self._members:
+                continue
+            V_k, collapsed_to_mixed = V.sub(k).collapse(collapsed_dofs=True)
+            dofmap = V_k.dofmap()
+            nb_owned = dofmap.ownership_range()[1] - dofmap.ownership_range()[0]
+            nb_owned_mixed = (
+                V.dofmap().ownership_range()[1] - V.dofmap().ownership_range()[0]
+            )
+            # collapsed to mixed local dofs map as an array
+            keys = np.fromiter(collapsed_to_mixed.keys(), dtype=np.int64)
+            to_mixed = np.zeros(keys.max(initial=-1) + 1, dtype=np.int64)
+            to_mixed[keys] = np.fromiter(collapsed_to_mixed.values(), dtype=np.int64)
+            tdim = mesh.mesh.topology().dim()
+            for trap in self._members[field]:
+                ids = materials_ids(trap)
+                cells = np.where(np.isin(mesh.volume_markers.array(), ids))[0]
+                collapsed = np.unique(
+                    dofmap.entity_closure_dofs(mesh.mesh, tdim, cells)
+                ).astype(np.int64)
+                mixed = to_mixed[collapsed]
+                # only the owned dofs are set
+                owned = (collapsed < nb_owned) & (mixed < nb_owned_mixed)
+                collapsed, mixed = collapsed[owned], mixed[owned]
+                trap.post_processing_solution = f.Function(V_k)
+                self._members_dofs.append((trap, collapsed, mixed))
+
+    def assign_members_solutions(self):
+        """Gives the solution, previous solution and test function of each
+        conglomerate to its members. On the materials of a member, they are
+        the member's ones.
+        """
+        for field, members in self._members.items():
+            for trap in members:
+                trap.solution = field.solution
+                trap.previous_solution = field.previous_solution
+                trap.test_function = field.test_function
+
+    def update_members_post_processing_solutions(self, u):
+        """Updates the post-processing functions of the traps merged in
+        conglomerates (see create_members_functions)
+
+        Args:
+            u (fenics.Function): the concentrations
+        """
+        if not self._members:
+            return
+        values = u.vector().get_local()
+        for trap, collapsed, mixed in self._members_dofs:
+            vector = trap.post_processing_solution.vector()
+            member_values = np.zeros(vector.local_size())
+            member_values[collapsed] = values[mixed]
+            vector.set_local(member_values)
+            vector.apply("insert")
+
     def create_forms(self, mobile, materials, T, dx, dt=None):
         self.F = 0
-        for trap in self.traps:
+        for trap in self.fields:
             trap.create_form(mobile, materials, T, dx, dt=dt)
             self.F += trap.F
             self.sub_expressions += trap.sub_expressions
+        # the traps in quasi-steady state contribute to the mobile equation
+        for trap in self.quasi_steady_state_traps:
+            trap.create_equilibrium_form(mobile, materials, T, dx, dt=dt)
+            self.F += trap.F
+            self.sub_expressions += trap.sub_expressions
+
+    def suggest_quasi_steady_state(self, T, dt, ratio=1e3):
+        """Warns about the kinetic traps whose slowest detrapping rate
+        p_0 exp(-E_p/k_B T) (at the lowest temperature) is more than ratio
+        times faster than the stepsize, since they could be set in
+        quasi-steady state. Only the traps whose p_0 and E_p are scalar
+        constants are considered.
+
+        Args:
+            T (festim.Temperature): the temperature of the simulation
+            dt (festim.Stepsize): the stepsize of the simulation
+            ratio (float, optional): the minimum ratio between the
+                detrapping rate and the inverse of the stepsize. Defaults to
+                1e3.
+
+        Returns:
+            list: the suggested traps
+        """
+        T_min = T.T.vector().min()
+        stepsize = float(dt.value)
+        suggested = []
+        for trap in self.traps:
+            if trap in self.quasi_steady_state_traps:
+                continue
+            if isinstance(trap, festim.ExtrinsicTrapBase):
+                continue
+            rate = trap.slowest_detrapping_rate(T_min)
+            if rate is not None and rate * stepsize > ratio:
+                warnings.warn(
+                    "Trap {} detraps in {:.1e} s (stepsize {:.1e} s), ".format(
+                        trap.id, 1 / rate, stepsize
+                    )
+                    + "consider setting quasi_steady_state=True"
+                )
+                suggested.append(trap)
+        return suggested
 
     def get_trap(self, id):
         for trap in self.traps:
@@ -44,10 +255,22 @@ class Traps:
                 return trap
         raise ValueError("Couldn't find trap {}".format(id))
 
+    @property
+    def monolithic_traps(self):
+        """list: the extrinsic traps whose densities are solved with the
+        concentrations in the mixed function space"""
+        return [
+            trap
+            for trap in self.traps
+            if isinstance(trap, festim.ExtrinsicTrapBase) and trap.monolithic
+        ]
+
     def initialise_extrinsic_traps(self, V):
-        """Add functions to ExtrinsicTrapBase objects for density form"""
+        """Add functions to ExtrinsicTrapBase objects for density form (the
+        densities of monolithic traps are components of the mixed function
+        and are not concerned)"""
         for trap in self.traps:
-            if isinstance(trap, festim.ExtrinsicTrapBase):
+            if isinstance(trap, festim.ExtrinsicTrapBase) and not trap.monolithic:
                 trap.density = [f.Function(V)]
                 trap.density_test_function = f.TestFunction(V)
                 trap.density_previous_solution = f.project(f.Constant(0), V)
@@ -64,33 +287,105 @@ class Traps:
         self.extrinsic_formulations = []
         expressions_extrinsic = []
         for trap in self.traps:
-            if isinstance(trap, festim.ExtrinsicTrapBase):
+            if isinstance(trap, festim.ExtrinsicTrapBase) and not trap.monolithic:
                 trap.create_form_density(dx, dt, T)
                 self.extrinsic_formulations.append(trap.form_density)
         self.sub_expressions.extend(expressions_extrinsic)
 
-    def solve_extrinsic_traps(self):
+    def solve_extrinsic_traps(self, dt=None, T=None):
+        """Computes the densities of the extrinsic traps at the current time
+        step
+
+        Args:
+            dt (festim.Stepsize, optional): the stepsize of the simulation,
+                needed by nodewise traps. Defaults to None.
+            T (festim.Temperature, optional): the temperature of the
+                simulation, needed by nodewise traps. Defaults to None.
+        """
         for trap in self.traps:
-            if isinstance(trap, festim.ExtrinsicTrapBase):
-                du_t = f.TrialFunction(trap.density[0].function_space())
-                J_t = f.derivative(trap.form_density, trap.density[0], du_t)
-                problem = f.NonlinearVariationalProblem(
-                    trap.form_density, trap.density[0], [], J_t
-                )
-                solver = f.NonlinearVariationalSolver(problem)
-                solver.parameters["newton_solver"][
-                    "absolute_tolerance"
-                ] = trap.absolute_tolerance
-                solver.parameters["newton_solver"][
-                    "relative_tolerance"
-                ] = trap.relative_tolerance
-                solver.parameters["newton_solver"][
-                    "maximum_iterations"
-                ] = trap.maximum_iterations
-                solver.parameters["newton_solver"]["linear_solver"] = trap.linear_solver
-                solver.solve()
+            if isinstance(trap, festim.ExtrinsicTrapBase) and not trap.monolithic:
+                trap.solve_density(dt, T)
 
     def update_extrinsic_traps_density(self):
         for trap in self.traps:
-            if isinstance(trap, festim.ExtrinsicTrapBase):
+            if isinstance(trap, festim.ExtrinsicTrapBase) and not trap.monolithic:
                 trap.density_previous_solution.assign(trap.density[0])
+
+
+def materials_ids(trap):
+    """Returns the ids of the materials of a trap
+
+    Args:
+        trap (festim.Trap): the trap
+
+    Returns:
+        list: the ids
+    """
+    ids = []
+    for mat in trap.materials:
+        ids += mat.id if isinstance(mat.id, list) else [mat.id]
+    return ids
+
+
+def traps_conflicts(traps, mesh, element_type="CG"):
+    """Finds the pairs of traps that can't share a field: traps with common
+    materials, and with CG elements, traps whose materials share vertices
+
+    Args:
+        traps (list): the festim.Trap objects
+        mesh (festim.Mesh): the mesh
+        element_type (str, optional): the finite element of the traps
+            ("CG" or "DG"). Defaults to "CG".
+
+    Returns:
+        np.ndarray: the symmetric boolean matrix of the conflicts
+    """
+    ids = [set(materials_ids(trap)) for trap in traps]
+    if element_type != "DG":
+        comm = f.MPI.comm_world
+        cells = mesh.mesh.cells()
+        global_vertices = mesh.mesh.topology().global_indices(0)
+        vertices = []
+        for trap_ids in ids:
+            in_trap = np.isin(mesh.volume_markers.array(), list(trap_ids))
+            local = global_vertices[np.unique(cells[in_trap])]
+            if comm.size > 1:
+                local = np.unique(np.concatenate(comm.allgather(local)))
+            vertices.append(local)
+
+    conflicts = np.zeros((len(traps), len(traps)), dtype=bool)
+    for i in range(len(traps)):
+        for j in range(i + 1, len(traps)):
+            conflict = len(ids[i] & ids[j]) > 0
+            if element_type != "DG":
+                conflict = conflict or len(np.intersect1d(vertices[i], vertices[j])) > 0
+            conflicts[i, j] = conflicts[j, i] = conflict
+    return conflicts
+
+
+def merge_traps(traps):
+    """Creates a single trap with per-material properties from traps living
+    in disjoint materials
+
+    Args:
+        traps (list): the festim.Trap objects (with festim.Material objects
+            as materials)
+
+    Returns:
+        festim.Trap: the conglomerate
+    """
+    properties = {"k_0": [], "E_k": [], "p_0": [], "E_p": [], "density": []}
+    materials = []
+    sources = []
+    for trap in traps:
+        for i, mat in enumerate(trap.materials):
+            for name in ["k_0", "E_k", "p_0", "E_p"]:
+                value = getattr(trap, name)
+                properties[name].append(value[i] if type(value) is list else value)
+            density = trap.density[i] if len(trap.density) > 1 else trap.density[0]
+            properties["density"].append(density)
+            materials.append(mat)
+        sources += trap.sources
+    merged_trap = festim.Trap(materials=materials, **properties)
+    merged_trap.sources = sources
+    return merged_trap
@@ -6,8 +6,20 @@ class AverageSurface(SurfaceQuantity):
     def __init__(self, field, surface) -> None:
         super().__init__(field=field, surface=surface)
         self.title = "Average {} surface {}".format(self.field, self.surface)
+        self._size = None
+        self._size_measure = None
+
+    def make_form(self):
+        return self.function * self.ds(self.surface)
+
+    def normalise(self, value):
+        """Divides the integral of the function by the size of the surface.
+        The size of the surface is computed once.
+        """
+        if self._size_measure is not self.ds:
+            self._size = f.assemble(1 * self.ds(self.surface))
+            self._size_measure = self.ds
+        return value / self._size
 
     def compute(self):
-        return f.assemble(self.function * self.ds(self.surface)) / f.assemble(
-            1 * self.ds(self.surface)
-        )
+        return self.normalise(f.assemble(self.make_form()))
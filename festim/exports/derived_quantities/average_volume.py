@@ -6,8 +6,20 @@ class AverageVolume(VolumeQuantity):
     def __init__(self, field, volume: int) -> None:
         super().__init__(field, volume)
         self.title = "Average {} volume {}".format(self.field, self.volume)
+        self._size = None
+        self._size_measure = None
+
+    def make_form(self):
+        return self.function * self.dx(self.volume)
+
+    def normalise(self, value):
+        """Divides the integral of the function by the size of the volume.
+        The size of the volume is computed once.
+        """
+        if self._size_measure is not self.dx:
+            self._size = f.assemble(1 * self.dx(self.volume))
+            self._size_measure = self.dx
+        return value / self._size
 
     def compute(self):
-        return f.assemble(self.function * self.dx(self.volume)) / f.assemble(
-            1 * self.dx(self.volume)
-        )
+        return self.normalise(f.assemble(self.make_form()))
@@ -1,9 +1,12 @@
 from festim import (
     MinimumVolume,
     MaximumVolume,
+    MinimumSurface,
+    MaximumSurface,
     DerivedQuantity,
 )
 import fenics as f
+import ufl
 import os
 import numpy as np
 from typing import Union
@@ -21,6 +24,13 @@ class DerivedQuantities:
             Defaults to 1.
         nb_iterations_between_exports (int, optional): number of
             iterations between each export. Defaults to None.
+        times (list, optional): if provided, the derived quantities are
+            computed at these times (nb_iterations_between_compute is then
+            ignored) and the stepsize will be adapted to hit them (see
+            festim.Stepsize.milestones). Defaults to None.
+        fsync (bool, optional): if True, the csv file is synchronised
+            with the disk (os.fsync) after each export. Else, it is only
+            flushed. Defaults to False.
     """
 
     def __init__(
@@ -29,8 +39,15 @@ class DerivedQuantities:
         filename: str = None,
         nb_iterations_between_compute: int = 1,
         nb_iterations_between_exports: int = None,
+        times: list = None,
+        fsync: bool = False,
     ) -> None:
         self.filename = filename
+        if times:
+            self.times = sorted(times)
+        else:
+            self.times = times
+        self.fsync = fsync
         self.nb_iterations_between_compute = nb_iterations_between_compute
         self.nb_iterations_between_exports = nb_iterations_between_exports
 
@@ -41,6 +58,15 @@ class DerivedQuantities:
         self.data = [self.make_header()]
         self.t = []
 
+        self._form = None
+        self._form_quantities = []
+        self._form_dofs = None
+        self._form_dependencies = None
+
+        self._file = None
+        self._written_data = None
+        self._nb_rows_written = 0
+
     @property
     def filename(self):
         return self._filename
@@ -62,6 +88,7 @@ class DerivedQuantities:
 
     def assign_measures_to_quantities(self, dx, ds):
         self.volume_markers = dx.subdomain_data()
+        self.surface_markers = ds.subdomain_data()
         for quantity in self.derived_quantities:
             quantity.dx = dx
             quantity.ds = ds
@@ -82,30 +109,177 @@ class DerivedQuantities:
 
     def compute(self, t):
         # TODO need to support for soret flag in surface flux
-        row = [t]
+        integrals = self.assemble_integral_quantities()
+        values = []
         for quantity in self.derived_quantities:
-            if isinstance(quantity, (MaximumVolume, MinimumVolume)):
+            if quantity in integrals:
+                value = integrals[quantity]
+            elif isinstance(quantity, (MaximumVolume, MinimumVolume)):
                 value = quantity.compute(self.volume_markers)
+            elif isinstance(quantity, (MaximumSurface, MinimumSurface)):
+                value = quantity.compute(self.surface_markers)
             else:
                 value = quantity.compute()
+            values.append(value)
+        self.add_row(t, values)
+
+    def add_row(self, t, values):
+        """Appends the values of the quantities at time t to self.data and
+        to the data of each quantity
+
+        Args:
+            t (float): the time
+            values (list): the values of the quantities (in the order of
+                self.derived_quantities)
+        """
+        for quantity, value in zip(self.derived_quantities, values):
             quantity.data.append(value)
             quantity.t.append(t)
-            row.append(value)
-        self.data.append(row)
+        self.data.append([t] + list(values))
         self.t.append(t)
 
+    def form_dependencies(self):
+        """Returns the objects the compiled form of the integral quantities
+        depends on (quantities, functions, measures and properties)
+
+        Returns:
+            list: the dependencies
+        """
+        return [
+            (
+                quantity,
+                quantity.function,
+                quantity.dx,
+                quantity.ds,
+                quantity.D,
+                quantity.S,
+                quantity.thermal_cond,
+                quantity.H,
+            )
+            for quantity in self.derived_quantities
+        ]
+
+    def compile_forms(self):
+        """Gathers the forms of the integral quantities (fluxes, totals,
+        averages...) in one vector form by multiplying each of them by a
+        component of a test function of a Real vector space. The form is
+        compiled once and reused as long as the functions, measures and
+        properties of the quantities are unchanged.
+        """
+        self._form_dependencies = self.form_dependencies()
+        self._form_quantities, forms = [], []
+        for quantity in self.derived_quantities:
+            form = quantity.make_form()
+            if form is not None:
+                self._form_quantities.append(quantity)
+                forms.append(form)
+        if len(forms) == 0:
+            self._form = None
+            return
+
+        mesh = forms[0].ufl_domain().ufl_cargo()
+        V = f.VectorFunctionSpace(mesh, "R", 0, dim=len(forms))
+        v = f.TestFunction(V)
+        integrals = [
+            integral.reconstruct(integrand=integral.integrand() * v[i])
+            for i, form in enumerate(forms)
+            for integral in form.integrals()
+        ]
+        self._form = f.Form(ufl.Form(integrals))
+
+        # global dofs of the components, to gather the values on all processes
+        local_dofs = [V.sub(i).dofmap().cell_dofs(0)[0] for i in range(len(forms))]
+        global_dofs = [V.dofmap().local_to_global_index(dof) for dof in local_dofs]
+        self._form_dofs = np.array(global_dofs, dtype=np.intc)
+
+    def forms_are_outdated(self):
+        """Checks if the compiled form has to be rebuilt
+
+        Returns:
+            bool: True if the form has never been compiled or if one of its
+            dependencies has changed, else False
+        """
+        if self._form_dependencies is None:
+            return True
+        dependencies = self.form_dependencies()
+        if len(dependencies) != len(self._form_dependencies):
+            return True
+        return any(
+            new is not old
+            for new_deps, old_deps in zip(dependencies, self._form_dependencies)
+            for new, old in zip(new_deps, old_deps)
+        )
+
+    def assemble_integral_quantities(self):
+        """Assembles all the quantities that are integrals (fluxes, totals,
+        averages...) in a single pass over the mesh. The form is only
+        compiled if needed (see compile_forms).
+
+        Returns:
+            dict: the values of the integral quantities
+        """
+        if self.forms_are_outdated():
+            self.compile_forms()
+        if self._form is None:
+            return {}
+
+        vector = f.assemble(self._form)
+        # the values are gathered on all processes
+        values = vector.gather(self._form_dofs)
+
+        return {
+            quantity: quantity.normalise(float(value))
+            for quantity, value in zip(self._form_quantities, values)
+        }
+
     def write(self):
-        if self.filename is not None:
-            # if the directory doesn't exist
-            # create it
-            dirname = os.path.dirname(self.filename)
-            if not os.path.exists(dirname):
-                os.makedirs(dirname, exist_ok=True)
-
-            # save the data to csv
-            np.savetxt(self.filename, np.array(self.data), fmt="%s", delimiter=",")
+        """Writes the rows of self.data that haven't been written yet to the
+        csv file. The file is kept open between calls so that only the new
+        rows are appended. It is (re)written from scratch if self.data or
+        self.filename have been replaced.
+
+        Returns:
+            bool: True
+        """
+        if self.filename is not None and f.MPI.comm_world.rank == 0:
+            if (
+                self._file is None
+                or self._file.closed
+                or self._file.name != self.filename
+                or self._written_data is not self.data
+                or len(self.data) < self._nb_rows_written
+            ):
+                self.open_file()
+
+            for row in self.data[self._nb_rows_written :]:
+                self._file.write(",".join("%s" % value for value in row) + "\n")
+            self._nb_rows_written = len(self.data)
+
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
         return True
 
+    def open_file(self):
+        """Opens (and truncates) the csv file, creating its directory if
+        needed"""
+        self.close()
+        # if the directory doesn't exist
+        # create it
+        dirname = os.path.dirname(self.filename)
+        if dirname and not os.path.exists(dirname):
+            os.makedirs(dirname, exist_ok=True)
+
+        self._file = open(self.filename, "w")
+        self._written_data = self.data
+        self._nb_rows_written = 0
+
+    def close(self):
+        """Closes the csv file if it is open"""
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+        self._file = None
+
     def is_export(self, t, final_time, nb_iterations):
         """Checks if the derived quantities should be exported or not based on
         the current time, the final time of simulation and the current number
@@ -131,16 +305,20 @@ class DerivedQuantities:
             # if steady state, export
             return True
 
-    def is_compute(self, nb_iterations):
+    def is_compute(self, nb_iterations, t=None):
         """Checks if the derived quantities should be computed or not based on
-        the current number of iterations
+        the current number of iterations (or the current time if self.times
+        is not None)
 
         Args:
             nb_iterations (int): the current number of time steps
+            t (float, optional): the current time. Defaults to None.
 
         Returns:
             bool: True if it's time to compute, else False
         """
+        if self.times is not None:
+            return t is not None and any(np.isclose(t, time) for time in self.times)
         return nb_iterations % self.nb_iterations_between_compute == 0
 
     def filter(
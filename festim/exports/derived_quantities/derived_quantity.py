@@ -1,4 +1,6 @@
 from festim import Export
+import fenics as f
+import numpy as np
 
 
 class DerivedQuantity(Export):
@@ -18,6 +20,100 @@ class DerivedQuantity(Export):
         self.H = None
         self.data = []
         self.t = []
+        self._subdomain_dofs = {}
+
+    def subdomain_dofs(self, markers, subdomain):
+        """Returns the local dofs of self.function owned by the process on the
+        mesh entities tagged with subdomain. The dofs are computed once per
+        (function space, markers, subdomain) and then cached.
+
+        Args:
+            markers (fenics.MeshFunction): the volume or surface markers
+            subdomain (int): the subdomain id
+
+        Raises:
+            ValueError: if no dofs were found on the subdomain
+
+        Returns:
+            np.ndarray: the local dofs
+        """
+        V = self.function.function_space()
+        key = (V.id(), markers.id(), subdomain)
+        if key not in self._subdomain_dofs:
+            entities = np.where(markers.array() == subdomain)[0]
+            dofs = V.dofmap().entity_closure_dofs(V.mesh(), markers.dim(), entities)
+            tdim = V.mesh().topology().dim()
+            if markers.dim() == tdim - 1 and V.ufl_element().family() in [
+                "Discontinuous Lagrange",
+                "DG",
+            ]:
+                # discontinuous functions have no dofs on the facets
+                dofs = self.facet_dofs_from_cells(V, entities)
+            dofs = np.unique(dofs).astype(np.intc)
+            # only keep the dofs owned by this process (no ghosts)
+            nb_owned_dofs = self.function.vector().local_size()
+            dofs = dofs[dofs < nb_owned_dofs]
+            comm = V.mesh().mpi_comm()
+            if f.MPI.sum(comm, dofs.size) == 0:
+                raise ValueError(
+                    "no dofs of field {} were found on subdomain {}".format(
+                        self.field, subdomain
+                    )
+                )
+            self._subdomain_dofs[key] = dofs
+        return self._subdomain_dofs[key]
+
+    def facet_dofs_from_cells(self, V, facets):
+        """Returns the dofs of the cells adjacent to some facets that are
+        located on these facets. Used for discontinuous function spaces whose
+        dofs all belong to the cells.
+
+        Args:
+            V (fenics.FunctionSpace): the function space
+            facets (np.ndarray): the facets indices
+
+        Returns:
+            np.ndarray: the dofs
+        """
+        mesh = V.mesh()
+        tdim = mesh.topology().dim()
+        mesh.init(tdim - 1, tdim)
+        dof_coordinates = V.tabulate_dof_coordinates()
+        dofs = []
+        for facet_index in facets:
+            facet = f.Facet(mesh, facet_index)
+            vertex = mesh.coordinates()[facet.entities(0)[0]]
+            normal = facet.normal().array()[: mesh.geometry().dim()]
+            for cell_index in facet.entities(tdim):
+                cell_dofs = V.dofmap().cell_dofs(cell_index)
+                # the dofs of a cell in the plane of one of its facets lie
+                # on this facet
+                distance = np.abs((dof_coordinates[cell_dofs] - vertex).dot(normal))
+                tol = 1e-10 * f.Cell(mesh, cell_index).h()
+                dofs.append(cell_dofs[distance <= tol])
+        if len(dofs) == 0:
+            return np.array([], dtype=np.intc)
+        return np.concatenate(dofs)
+
+    def make_form(self):
+        """Returns the form whose assembly gives the quantity (before
+        normalisation). Quantities that are not integrals return None.
+
+        Returns:
+            ufl.Form: the form of the quantity
+        """
+        return None
+
+    def normalise(self, value):
+        """Converts the assembled form of the quantity to the quantity
+
+        Args:
+            value (float): the assembled form
+
+        Returns:
+            float: the quantity
+        """
+        return value
 
 
 class VolumeQuantity(DerivedQuantity):
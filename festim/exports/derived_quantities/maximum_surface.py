@@ -18,17 +18,8 @@ class MaximumSurface(DerivedQuantity):
 
     def compute(self, surface_markers):
         """Maximum of f over subdomains facets marked with self.surface"""
-        V = self.function.function_space()
-
-        dm = V.dofmap()
-
-        subd_dofs = np.unique(
-            np.hstack(
-                [
-                    dm.cell_dofs(c.index())
-                    for c in f.SubsetIterator(surface_markers, self.surface)
-                ]
-            )
-        )
-
-        return np.max(self.function.vector().get_local()[subd_dofs])
+        subd_dofs = self.subdomain_dofs(surface_markers, self.surface)
+        values = self.function.vector().get_local()[subd_dofs]
+        # reduce over all the processes
+        comm = self.function.function_space().mesh().mpi_comm()
+        return f.MPI.max(comm, np.max(values, initial=-np.inf))
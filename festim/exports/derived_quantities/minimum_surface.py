@@ -18,17 +18,8 @@ class MinimumSurface(DerivedQuantity):
 
     def compute(self, surface_markers):
         """Minimum of f over subdomains facets marked with self.surface"""
-        V = self.function.function_space()
-
-        dm = V.dofmap()
-
-        subd_dofs = np.unique(
-            np.hstack(
-                [
-                    dm.cell_dofs(c.index())
-                    for c in f.SubsetIterator(surface_markers, self.surface)
-                ]
-            )
-        )
-
-        return np.min(self.function.vector().get_local()[subd_dofs])
+        subd_dofs = self.subdomain_dofs(surface_markers, self.surface)
+        values = self.function.vector().get_local()[subd_dofs]
+        # reduce over all the processes
+        comm = self.function.function_space().mesh().mpi_comm()
+        return f.MPI.min(comm, np.min(values, initial=np.inf))
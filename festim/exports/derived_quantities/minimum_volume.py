@@ -10,17 +10,8 @@ class MinimumVolume(VolumeQuantity):
 
     def compute(self, volume_markers):
         """Minimum of f over subdomains cells marked with self.volume"""
-        V = self.function.function_space()
-
-        dm = V.dofmap()
-
-        subd_dofs = np.unique(
-            np.hstack(
-                [
-                    dm.cell_dofs(c.index())
-                    for c in f.SubsetIterator(volume_markers, self.volume)
-                ]
-            )
-        )
-
-        return np.min(self.function.vector().get_local()[subd_dofs])
+        subd_dofs = self.subdomain_dofs(volume_markers, self.volume)
+        values = self.function.vector().get_local()[subd_dofs]
+        # reduce over all the processes
+        comm = self.function.function_space().mesh().mpi_comm()
+        return f.MPI.min(comm, np.min(values, initial=np.inf))
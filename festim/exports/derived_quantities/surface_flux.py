@@ -7,7 +7,7 @@ class SurfaceFlux(SurfaceQuantity):
         super().__init__(field=field, surface=surface)
         self.title = "Flux surface {}: {}".format(self.surface, self.field)
 
-    def compute(self, soret=False):
+    def make_form(self, soret=False):
         field_to_prop = {
             "0": self.D,
             "solute": self.D,
@@ -15,16 +15,23 @@ class SurfaceFlux(SurfaceQuantity):
             "T": self.thermal_cond,
         }
         self.prop = field_to_prop[self.field]
-        flux = f.assemble(
-            self.prop * f.dot(f.grad(self.function), self.n) * self.ds(self.surface)
+        form = self.prop * f.dot(f.grad(self.function), self.n) * self.ds(self.surface)
+        if soret and self.field in [0, "0", "solute"]:
+            form += self.make_soret_form()
+        return form
+
+    def make_soret_form(self):
+        return (
+            self.prop
+            * self.function
+            * self.H
+            / (R * self.T**2)
+            * f.dot(f.grad(self.T), self.n)
+            * self.ds(self.surface)
         )
+
+    def compute(self, soret=False):
+        flux = f.assemble(self.make_form())
         if soret and self.field in [0, "0", "solute"]:
-            flux += f.assemble(
-                self.prop
-                * self.function
-                * self.H
-                / (R * self.T**2)
-                * f.dot(f.grad(self.T), self.n)
-                * self.ds(self.surface)
-            )
+            flux += f.assemble(self.make_soret_form())
         return flux
@@ -7,5 +7,8 @@ class TotalSurface(SurfaceQuantity):
         super().__init__(field, surface=surface)
         self.title = "Total {} surface {}".format(self.field, self.surface)
 
+    def make_form(self):
+        return self.function * self.ds(self.surface)
+
     def compute(self):
-        return f.assemble(self.function * self.ds(self.surface))
+        return f.assemble(self.make_form())
@@ -7,5 +7,8 @@ class TotalVolume(VolumeQuantity):
         super().__init__(field, volume=volume)
         self.title = "Total {} volume {}".format(self.field, self.volume)
 
+    def make_form(self):
+        return self.function * self.dx(self.volume)
+
     def compute(self):
-        return f.assemble(self.function * self.dx(self.volume))
+        return f.assemble(self.make_form())
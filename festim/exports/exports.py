@@ -1,5 +1,6 @@
 import festim
 import fenics as f
+import numpy as np
 
 
 class Exports:
@@ -10,8 +11,14 @@ class Exports:
         self.final_time = None
         self.nb_iterations = 0
 
+        self._projections = {}
+        self._projections_time = None
+        self._projectors = {}
+
     def write(self, label_to_function, dx):
-        """writes to file
+        """writes to file. The functions are only projected onto V_DG1 if an
+        export actually needs it at this step and each field is projected at
+        most once per step.
 
         Args:
             label_to_function (dict): dictionary of labels mapped to solutions
@@ -20,19 +27,18 @@ class Exports:
         for export in self.exports:
             if isinstance(export, festim.DerivedQuantities):
                 # compute derived quantities
-                if export.is_compute(self.nb_iterations):
+                if export.is_compute(self.nb_iterations, self.t):
                     # check if function has to be projected
                     for quantity in export.derived_quantities:
+                        function = label_to_function[quantity.field]
                         if isinstance(
                             quantity, (festim.MaximumVolume, festim.MinimumVolume)
                         ):
-                            if not isinstance(
-                                label_to_function[quantity.field], f.Function
-                            ):
-                                label_to_function[quantity.field] = f.project(
-                                    label_to_function[quantity.field], self.V_DG1
+                            if not isinstance(function, f.Function):
+                                function = self.project_on_DG1(
+                                    quantity.field, label_to_function
                                 )
-                        quantity.function = label_to_function[quantity.field]
+                        quantity.function = function
                     export.compute(self.t)
                 # export derived quantities
                 if export.is_export(self.t, self.final_time, self.nb_iterations):
@@ -40,13 +46,14 @@ class Exports:
 
             elif isinstance(export, festim.XDMFExport):
                 if export.is_export(self.t, self.final_time, self.nb_iterations):
+                    function = label_to_function[export.field]
                     if export.field == "retention":
                         # if not a Function, project it onto V_DG1
-                        if not isinstance(label_to_function["retention"], f.Function):
-                            label_to_function["retention"] = f.project(
-                                label_to_function["retention"], self.V_DG1
+                        if not isinstance(function, f.Function):
+                            function = self.project_on_DG1(
+                                "retention", label_to_function
                             )
-                    export.function = label_to_function[export.field]
+                    export.function = function
                     if isinstance(export, festim.TrapDensityXDMF):
                         export.write(self.t, dx)
                     else:
@@ -54,27 +61,167 @@ class Exports:
                     export.append = True
 
             elif isinstance(export, festim.TXTExport):
-                # if not a Function, project it onto V_DG1
-                if not isinstance(label_to_function[export.field], f.Function):
-                    label_to_function[export.field] = f.project(
-                        label_to_function[export.field], self.V_DG1
+                steady = self.final_time == None
+                if export.is_it_time_to_export(self.t):
+                    # the function is projected onto V_DG1 (if needed)
+                    export.function = self.project_on_DG1(
+                        export.field, label_to_function
                     )
-                export.function = label_to_function[export.field]
+                    export.write(self.t, steady)
+                # write the buffered columns at the end of the simulation
+                if steady or np.isclose(self.t, self.final_time):
+                    export.flush()
+        self.nb_iterations += 1
+
+    def write_native(self, problem):
+        """Computes the derived quantities and writes the exports from the
+        values at the vertices of a problem solved by the native 1D engine
+
+        Args:
+            problem (festim.HTransportProblem1D): the H transport problem
+        """
+        for export in self.exports:
+            if isinstance(export, festim.DerivedQuantities):
+                if export.is_compute(self.nb_iterations, self.t):
+                    values = [
+                        problem.compute_derived_quantity(quantity)
+                        for quantity in export.derived_quantities
+                    ]
+                    export.add_row(self.t, values)
+                if export.is_export(self.t, self.final_time, self.nb_iterations):
+                    export.write()
+
+            elif isinstance(export, festim.TXTExport):
                 steady = self.final_time == None
-                export.write(self.t, steady)
+                if export.is_it_time_to_export(self.t):
+                    export.write_values(
+                        self.t,
+                        steady,
+                        problem.get_DG1_field(export.field),
+                        problem.get_DG1_field("x"),
+                    )
+                if steady or np.isclose(self.t, self.final_time):
+                    export.flush()
         self.nb_iterations += 1
 
-    def initialise_derived_quantities(self, dx, ds, materials):
+    def initialise_native(self):
+        """Creates the headers of the derived quantities for the native 1D
+        engine (no measure or form is needed)"""
+        for export in self.exports:
+            if isinstance(export, festim.DerivedQuantities):
+                export.data = [export.make_header()]
+
+    def export_times(self):
+        """Gathers the times at which the exports are made (XDMFExport,
+        TXTExport and DerivedQuantities with times)
+
+        Returns:
+            list: the sorted export times
+        """
+        times = []
+        for export in self.exports:
+            if isinstance(
+                export, (festim.XDMFExport, festim.TXTExport, festim.DerivedQuantities)
+            ):
+                if export.times is not None:
+                    times += list(export.times)
+        return sorted(set(times))
+
+    def flush(self):
+        """Writes the data buffered by the exports (columns of TXTExport)
+        and closes the files kept open by DerivedQuantities"""
+        for export in self.exports:
+            if isinstance(export, festim.TXTExport):
+                export.flush()
+            elif isinstance(export, festim.DerivedQuantities):
+                export.close()
+
+    def reset_projections(self):
+        """Empties the cached projections and projectors. Must be called
+        when V_DG1 or the functions to project are replaced."""
+        self._projections = {}
+        self._projections_time = None
+        self._projectors = {}
+
+    def project_on_DG1(self, field, label_to_function):
+        """Projects the function of a field onto V_DG1. The projections are
+        cached per field for the current time so that each field is projected
+        at most once per step and shared by all the exports. The cache is
+        invalidated when the time changes. Functions that are already DG1
+        are not projected.
+
+        Args:
+            field (str): the field
+            label_to_function (dict): dictionary of labels mapped to solutions
+
+        Returns:
+            fenics.Function: the projected function (or the function itself if
+            V_DG1 is None or if it is already DG1)
+        """
+        if self._projections_time != self.t:
+            self._projections = {}
+            self._projections_time = self.t
+        if field not in self._projections:
+            function = label_to_function[field]
+            if self.V_DG1 is not None and not festim.is_DG1_function(function):
+                function = self.local_projection(field, function)
+            self._projections[field] = function
+        return self._projections[field]
+
+    def local_projection(self, field, function):
+        """Projects a function onto V_DG1 with a fenics.LocalSolver. As the
+        DG1 mass matrix is block diagonal, the projection is solved cell by
+        cell. The solver (with its factorised local matrices) and the
+        projected function are created once per field and reused.
+
+        Args:
+            field (str): the field
+            function (fenics.Function or ufl.Expr): the function to project
+
+        Returns:
+            fenics.Function: the projected function
+        """
+        projector = self._projectors.get(field)
+        if (
+            projector is None
+            or projector[0] is not function
+            or projector[1] is not self.V_DG1
+        ):
+            u = f.TrialFunction(self.V_DG1)
+            v = f.TestFunction(self.V_DG1)
+            solver = f.LocalSolver(
+                u * v * f.dx, function * v * f.dx, f.LocalSolver.SolverType.Cholesky
+            )
+            solver.factorize()
+            projection = f.Function(self.V_DG1)
+            projector = (function, self.V_DG1, solver, projection)
+            self._projectors[field] = projector
+        _, _, solver, projection = projector
+        solver.solve_local_rhs(projection)
+        return projection
+
+    def initialise_derived_quantities(self, dx, ds, materials, label_to_function=None):
         """If derived quantities in exports, creates header and adds measures
-        and properties
+        and properties. If label_to_function is given, the functions are
+        assigned to the integral quantities and their forms are compiled once
+        and reused at every time step.
 
         Args:
             dx (fenics.Measure): the measure for dx
             ds (fenics.Measure): the measure for ds
             materials (festim.Materials): the materials
+            label_to_function (dict, optional): dictionary of labels mapped
+                to solutions. Defaults to None.
         """
         for export in self.exports:
             if isinstance(export, festim.DerivedQuantities):
                 export.data = [export.make_header()]
                 export.assign_measures_to_quantities(dx, ds)
                 export.assign_properties_to_quantities(materials)
+                if label_to_function is not None:
+                    for quantity in export.derived_quantities:
+                        if not isinstance(
+                            quantity, (festim.MaximumVolume, festim.MinimumVolume)
+                        ):
+                            quantity.function = label_to_function[quantity.field]
+                    export.compile_forms()
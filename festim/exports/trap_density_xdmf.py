@@ -7,6 +7,10 @@ class TrapDensityXDMF(XDMFExport):
     Args:
         trap (festim.Trap): the trap to export density
         kwargs (): See XDMFExport
+
+    Notes:
+        If the density of the trap doesn't depend on time
+        (see festim.Trap.density_is_time_dependent), it is only written once.
     """
 
     def __init__(self, trap, **kwargs) -> None:
@@ -15,6 +19,7 @@ class TrapDensityXDMF(XDMFExport):
         )  # field is "1" just to make the code not crash
 
         self.trap = trap
+        self._projection = None
 
     def write(self, t, dx):
         """Writes to file
@@ -23,15 +28,56 @@ class TrapDensityXDMF(XDMFExport):
             t (float): the time
             dx (fenics.Measure): the measure for dx
         """
-        functionspace = self.function.function_space().collapse()
-        u = f.Function(functionspace)
-        v = f.TestFunction(functionspace)
-        F = f.inner(u, v) * dx
-
-        for mat in self.trap.materials:
-            F -= f.inner(self.trap.density[0], v) * dx(mat.id)
+        # a static density is only written once
+        if self.append and not self.trap.density_is_time_dependent:
+            return
 
-        f.solve(F == 0, u, bcs=[])
+        if (
+            self._projection is None
+            or self._projection["function"] is not self.function
+            or self._projection["dx"] is not dx
+        ):
+            self.create_projection(dx)
+        u = self._projection["density"]
+        if self._projection["local"]:
+            self._projection["solver"].solve_local_rhs(u)
+        else:
+            b = f.assemble(self._projection["L"])
+            self._projection["solver"].solve(u.vector(), b)
         self.function = u
 
         super().write(t)
+
+    def create_projection(self, dx):
+        """Sets up the projection of the trap density on the (collapsed)
+        function space of self.function. The matrix is factorised once: cell
+        by cell with a fenics.LocalSolver for DG spaces, else with a
+        fenics.LUSolver.
+
+        Args:
+            dx (fenics.Measure): the measure for dx
+        """
+        function = self.function
+        functionspace = function.function_space().collapse()
+        u = f.TrialFunction(functionspace)
+        v = f.TestFunction(functionspace)
+        a = f.inner(u, v) * dx
+        L = 0
+        for mat in self.trap.materials:
+            L += f.inner(self.trap.density[0], v) * dx(mat.id)
+
+        local = functionspace.ufl_element().family() == "Discontinuous Lagrange"
+        if local:
+            solver = f.LocalSolver(a, L, f.LocalSolver.SolverType.Cholesky)
+            solver.factorize()
+        else:
+            solver = f.LUSolver(f.assemble(a))
+
+        self._projection = {
+            "function": function,
+            "dx": dx,
+            "local": local,
+            "solver": solver,
+            "L": L,
+            "density": f.Function(functionspace),
+        }
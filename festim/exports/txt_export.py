@@ -18,9 +18,17 @@ class TXTExport(festim.Export):
         times (list, optional): if provided, the field will be
             exported at these timesteps. Otherwise exports at all
             timesteps. Defaults to None.
+        nb_exports_between_writes (int, optional): the exported columns are
+            stored in memory and the file is written every
+            nb_exports_between_writes exports. It is also written at the
+            last export time and at the end of the simulation. If None, the
+            file is only written at the last export time and at the end of
+            the simulation. Defaults to None.
     """
 
-    def __init__(self, field, label, folder, times=None) -> None:
+    def __init__(
+        self, field, label, folder, times=None, nb_exports_between_writes=None
+    ) -> None:
         super().__init__(field=field)
         if times:
             self.times = sorted(times)
@@ -28,8 +36,15 @@ class TXTExport(festim.Export):
             self.times = times
         self.label = label
         self.folder = folder
+        self.nb_exports_between_writes = nb_exports_between_writes
         self._first_time = True
 
+        self.V_DG1 = None
+        self._header = []
+        self._columns = None
+        self._nb_columns = 0
+        self._nb_columns_written = 0
+
     @property
     def filename(self):
         return f"{self.folder}/{self.label}.txt"
@@ -50,47 +65,144 @@ class TXTExport(festim.Export):
                 return time
         return None
 
+    def is_last_time(self, current_time):
+        """Checks if current_time is the last export time
+
+        Args:
+            current_time (float): the current time
+
+        Returns:
+            bool: True if current_time is the last of self.times, else False
+        """
+        return self.times is not None and np.isclose(self.times[-1], current_time)
+
     def write(self, current_time, steady):
-        # create a DG1 functionspace
-        V_DG1 = f.FunctionSpace(self.function.function_space().mesh(), "DG", 1)
-
-        solution = f.project(self.function, V_DG1)
-        solution_column = np.transpose(solution.vector()[:])
-        if self.is_it_time_to_export(current_time):
-            if steady:
-                header = "x,t=steady"
-            else:
-                header = "x,t={}s".format(current_time)
-
-            # if the directory doesn't exist
-            # create it
-            dirname = os.path.dirname(self.filename)
-            if not os.path.exists(dirname):
-                os.makedirs(dirname, exist_ok=True)
-
-            # if steady or it is the first time to export
-            # write data
-            # else append new column to the existing file
-            if steady or self._first_time:
-                x = f.interpolate(f.Expression("x[0]", degree=1), V_DG1)
-                x_column = np.transpose([x.vector()[:]])
-                data = np.column_stack([x_column, solution_column])
-                self._first_time = False
-            else:
-                # Update the header
-                old_file = open(self.filename)
-                old_header = old_file.readline().split("\n")[0]
-                old_file.close()
-                header = old_header + ",t={}s".format(current_time)
-                # Append new column
-                old_columns = np.loadtxt(self.filename, delimiter=",", skiprows=1)
-                data = np.column_stack([old_columns, solution_column])
-
-            np.savetxt(self.filename, data, header=header, delimiter=",", comments="")
+        if not self.is_it_time_to_export(current_time):
+            return
+
+        if festim.is_DG1_function(self.function):
+            # already projected (by festim.Exports)
+            solution = self.function
+        else:
+            mesh = self.function.function_space().mesh()
+            if self.V_DG1 is None or self.V_DG1.mesh().id() != mesh.id():
+                # create a DG1 functionspace
+                self.V_DG1 = f.FunctionSpace(mesh, "DG", 1)
+            solution = f.project(self.function, self.V_DG1)
+
+        # if steady or it is the first time to export
+        # start a new file
+        # else add a new column
+        if steady or self._first_time:
+            x = f.interpolate(f.Expression("x[0]", degree=1), solution.function_space())
+            self.reset_columns(x.vector()[:])
+        self.add_column(current_time, steady, solution.vector()[:])
+
+    def write_values(self, current_time, steady, column, x_column):
+        """Writes values that are already computed (by the native 1D engine,
+        see festim.HTransportProblem1D)
+
+        Args:
+            current_time (float): the current time
+            steady (bool): True if the simulation is steady state
+            column (np.ndarray): the values of the field
+            x_column (np.ndarray): the x coordinates of the values
+        """
+        if not self.is_it_time_to_export(current_time):
+            return
+
+        if steady or self._first_time:
+            self.reset_columns(x_column)
+        self.add_column(current_time, steady, column)
+
+    def add_column(self, current_time, steady, column):
+        """Adds the column of the current time to the columns buffer and
+        writes the file if needed
+
+        Args:
+            current_time (float): the current time
+            steady (bool): True if the simulation is steady state
+            column (np.ndarray): the values of the field
+        """
+        if steady:
+            header = "t=steady"
+        else:
+            header = "t={}s".format(current_time)
+        self.append_column(header, column)
+
+        nb_new_columns = self._nb_columns - self._nb_columns_written
+        if (
+            steady
+            or self.is_last_time(current_time)
+            or (
+                self.nb_exports_between_writes is not None
+                and nb_new_columns >= self.nb_exports_between_writes
+            )
+        ):
+            self.flush()
+
+    def reset_columns(self, x_column):
+        """Empties the columns buffer and stores the x column in it. A new
+        file will be started.
+
+        Args:
+            x_column (np.ndarray): the x coordinates of the exported values
+        """
+        nb_columns = 1 + (len(self.times) if self.times else 1)
+        self._columns = np.empty((len(x_column), nb_columns))
+        self._columns[:, 0] = x_column
+        self._header = ["x"]
+        self._nb_columns = 1
+        self._nb_columns_written = 0
+        self._first_time = False
+
+    def append_column(self, header, column):
+        """Adds a column to the columns buffer. The capacity of the buffer is
+        doubled if it is full.
+
+        Args:
+            header (str): the header of the column
+            column (np.ndarray): the values
+        """
+        if self._nb_columns == self._columns.shape[1]:
+            new_columns = np.empty((self._columns.shape[0], 2 * self._nb_columns))
+            new_columns[:, : self._nb_columns] = self._columns
+            self._columns = new_columns
+        self._columns[:, self._nb_columns] = column
+        self._header.append(header)
+        self._nb_columns += 1
+
+    def flush(self):
+        """Writes the buffered columns to the file if some haven't been
+        written yet"""
+        if self._columns is None or self._nb_columns_written == self._nb_columns:
+            return
+
+        # if the directory doesn't exist
+        # create it
+        dirname = os.path.dirname(self.filename)
+        if not os.path.exists(dirname):
+            os.makedirs(dirname, exist_ok=True)
+
+        np.savetxt(
+            self.filename,
+            self._columns[:, : self._nb_columns],
+            header=",".join(self._header),
+            delimiter=",",
+            comments="",
+        )
+        self._nb_columns_written = self._nb_columns
 
 
 class TXTExports:
-    def __init__(self, fields=[], times=[], labels=[], folder=None) -> None:
+    def __init__(
+        self,
+        fields=[],
+        times=[],
+        labels=[],
+        folder=None,
+        nb_exports_between_writes=None,
+    ) -> None:
         self.fields = fields
         if len(self.fields) != len(labels):
             raise ValueError(
@@ -102,4 +214,6 @@ class TXTExports:
         self.folder = folder
         self.exports = []
         for function, label in zip(self.fields, self.labels):
-            self.exports.append(TXTExport(function, label, folder, times))
+            self.exports.append(
+                TXTExport(function, label, folder, times, nb_exports_between_writes)
+            )
@@ -1,6 +1,7 @@
 import warnings
 from festim import Export
 import fenics as f
+import numpy as np
 
 
 field_to_label = {
@@ -27,10 +28,21 @@ class XDMFExport(Export):
             fenics.XDMFFile.write_checkpoint will be use, else
             fenics.XDMFFile.write. Defaults to True.
         folder (str, optional): path of the export folder. Defaults to None.
+        times (list, optional): if provided, the field will be exported at
+            these times (mode is then ignored) and the stepsize will be
+            adapted to hit them (see festim.Stepsize.milestones). Defaults to
+            None.
     """
 
     def __init__(
-        self, field, label=None, filename=None, mode=1, checkpoint=True, folder=None
+        self,
+        field,
+        label=None,
+        filename=None,
+        mode=1,
+        checkpoint=True,
+        folder=None,
+        times=None,
     ) -> None:
         super().__init__(field=field)
         self.label = label
@@ -45,6 +57,10 @@ class XDMFExport(Export):
             raise TypeError("checkpoint must be a bool")
 
         self.append = False
+        if times:
+            self.times = sorted(times)
+        else:
+            self.times = times
 
     @property
     def label(self):
@@ -151,6 +167,8 @@ class XDMFExport(Export):
         Returns:
             bool: True if export should be exported, else False
         """
+        if self.times is not None:
+            return any(np.isclose(t, time) for time in self.times)
         if self.mode == "last" and t >= final_time:
             return True
         elif isinstance(self.mode, int):
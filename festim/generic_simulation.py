@@ -2,6 +2,7 @@ import festim
 from festim.h_transport_problem import HTransportProblem
 from fenics import *
 import numpy as np
+import warnings
 
 
 class Simulation:
@@ -70,6 +71,8 @@ class Simulation:
         mobile (festim.Mobile): the mobile concentration (c_m or theta)
         t (fenics.Constant): the current time of simulation
         timer (fenics.timer): the elapsed time of simulation
+        label_to_function (dict): a mapping of the fields ("solute", "T",
+            "retention"...) to their post-processing functions
     """
 
     def __init__(
@@ -105,6 +108,8 @@ class Simulation:
         self.h_transport_problem = None
         self.t = 0  # Initialising time to 0s
         self.timer = None
+        self.label_to_function = None
+        self._post_processing_functions = []
 
     @property
     def traps(self):
@@ -228,8 +233,14 @@ class Simulation:
 
         # initialise dt
         if self.settings.transient:
+            # the stepsize must hit the export times
+            self.dt.export_times = self.exports.export_times()
             self.dt.initialise_value()
 
+        if self.settings.engine == "native_1d":
+            self.initialise_native_1d()
+            return
+
         self.h_transport_problem = HTransportProblem(
             self.mobile, self.traps, self.T, self.settings, self.initial_conditions
         )
@@ -246,6 +257,8 @@ class Simulation:
 
         self.V_DG1 = FunctionSpace(self.mesh.mesh, "DG", 1)
         self.exports.V_DG1 = self.V_DG1
+        # the projections of a previous initialisation are outdated
+        self.exports.reset_projections()
 
         # Define temperature
         if isinstance(self.T, festim.HeatTransferProblem):
@@ -269,9 +282,31 @@ class Simulation:
 
         self.h_transport_problem.initialise(self.mesh, self.materials, self.dt)
 
+        # the forms of the derived quantities are compiled once on the
+        # post-processing functions
+        self.label_to_function = None
+        self.update_post_processing_solutions()
         self.exports.initialise_derived_quantities(
-            self.mesh.dx, self.mesh.ds, self.materials
+            self.mesh.dx, self.mesh.ds, self.materials, self.label_to_function
+        )
+
+    def initialise_native_1d(self):
+        """Initialises the model for the native 1D engine (see
+        festim.HTransportProblem1D). No function space, form or fenics
+        function is created.
+        """
+        self.h_transport_problem = festim.HTransportProblem1D(
+            self.mobile, self.traps, self.T, self.settings, self.initial_conditions
         )
+        self.attribute_source_terms()
+        self.attribute_boundary_conditions()
+
+        self.materials.check_materials(self.T, derived_quantities=[])
+        self.h_transport_problem.check_exports(self.exports)
+        self.h_transport_problem.initialise(self.mesh, self.materials, self.dt)
+
+        self.label_to_function = None
+        self.exports.initialise_native()
 
     def run(self, completion_tone=False):
         """Runs the model.
@@ -285,10 +320,19 @@ class Simulation:
         """
         self.timer = Timer()  # start timer
 
-        if self.settings.transient:
-            self.run_transient()
-        else:
-            self.run_steady()
+        try:
+            if self.settings.transient:
+                self.run_transient()
+            else:
+                self.run_steady()
+        except BaseException:
+            # write the buffered exports without hiding the original error
+            try:
+                self.exports.flush()
+            except Exception as error:
+                warnings.warn("the exports couldn't be flushed: {}".format(error))
+            raise
+        self.exports.flush()
 
         # End
         if completion_tone:
@@ -332,8 +376,10 @@ class Simulation:
         """Advance the model by one iteration"""
         # Update current time
         self.t += float(self.dt.value)
-        # update temperature
-        self.T.update(self.t)
+        # update temperature (evaluated by the H problem with the native
+        # 1D engine)
+        if self.settings.engine == "fenics":
+            self.T.update(self.t)
         # update H problem
         self.h_transport_problem.update(self.t, self.dt)
 
@@ -362,14 +408,22 @@ class Simulation:
 
     def run_post_processing(self):
         """Create post processing functions and compute/write the exports"""
-        self.update_post_processing_solutions()
-
+        # the time spent in post-processing is reported by fenics.list_timings
+        timer = Timer("FESTIM post-processing")
         self.exports.t = self.t
-        self.exports.write(self.label_to_function, self.mesh.dx)
+        if self.settings.engine == "native_1d":
+            self.exports.write_native(self.h_transport_problem)
+        else:
+            self.update_post_processing_solutions()
+            self.exports.write(self.label_to_function, self.mesh.dx)
+        timer.stop()
 
     def update_post_processing_solutions(self):
         """Creates the post-processing functions by splitting self.u. Projects
         the function on a suitable functionspace if needed.
+        The mapping is only rebuilt if the post-processing functions have
+        changed so that the same objects (and the forms built on them) are
+        reused across time steps.
 
         Returns:
             dict: a mapping of the field ("solute", "T", "retention") to its
@@ -377,6 +431,18 @@ class Simulation:
         """
         self.h_transport_problem.update_post_processing_solutions(self.exports)
 
+        functions = [self.mobile.post_processing_solution, self.T.T] + [
+            trap.post_processing_solution for trap in self.traps.traps
+        ]
+        if self.label_to_function is not None and len(functions) == len(
+            self._post_processing_functions
+        ):
+            if all(
+                new is old
+                for new, old in zip(functions, self._post_processing_functions)
+            ):
+                return self.label_to_function
+
         label_to_function = {
             "solute": self.mobile.post_processing_solution,
             "0": self.mobile.post_processing_solution,
@@ -391,4 +457,6 @@ class Simulation:
             label_to_function[trap.id] = trap.post_processing_solution
             label_to_function[str(trap.id)] = trap.post_processing_solution
 
+        self._post_processing_functions = functions
         self.label_to_function = label_to_function
+        return self.label_to_function
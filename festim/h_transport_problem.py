@@ -1,5 +1,7 @@
 from fenics import *
 import festim
+import ufl
+import warnings
 
 
 class HTransportProblem:
@@ -22,6 +24,11 @@ class HTransportProblem:
             ct2, ...)
         v (fenics.TestFunction): the test function
         u_n (fenics.Function): the "previous" function
+        u_split (tuple): u and the list of its sub-functions used for
+            post-processing
+        quadrature_degrees (dict): the highest estimated and used quadrature
+            degrees of each term of the formulation ("solute", "traps",
+            "densities")
         bcs (list): list of fenics.DirichletBC for H transport
     """
 
@@ -36,12 +43,14 @@ class HTransportProblem:
         self.u = None
         self.v = None
         self.u_n = None
+        self.u_split = None
 
         self.boundary_conditions = []
         self.bcs = None
         self.V = None
         self.V_CG1 = None
         self.expressions = []
+        self.quadrature_degrees = {}
 
     def initialise(self, mesh, materials, dt=None):
         """Assigns BCs, create suitable function space, initialise
@@ -59,10 +68,18 @@ class HTransportProblem:
             self.mobile.volume_markers = mesh.volume_markers
             self.mobile.T = self.T
         self.attribute_flux_boundary_conditions()
+        self.traps.make_traps_materials(materials)
+        self.traps.quasi_steady_state = self.settings.equilibrium_traps
+        self.check_quasi_steady_state_traps()
+        if self.settings.transient and self.settings.suggest_quasi_steady_state:
+            self.traps.suggest_quasi_steady_state(self.T, dt)
+        self.traps.conglomerate_traps(
+            mesh, self.settings.traps_element_type, excluded=self.unmergeable_traps()
+        )
         # Define functions
         self.define_function_space(mesh)
         self.initialise_concentrations()
-        self.traps.make_traps_materials(materials)
+        self.traps.create_members_functions(self.V, mesh)
         self.traps.initialise_extrinsic_traps(self.V_CG1)
 
         # Define variational problem H transport
@@ -71,6 +88,8 @@ class HTransportProblem:
             self.mobile.create_form_post_processing(self.V_DG1, materials, mesh.dx)
 
         self.define_variational_problem(materials, mesh, dt)
+        for trap in self.traps.quasi_steady_state_traps:
+            trap.create_equilibrium_projection(self.mobile, self.T, mesh.dx, self.V_DG1)
 
         # Boundary conditions
         print("Defining boundary conditions")
@@ -78,6 +97,57 @@ class HTransportProblem:
         if self.settings.transient:
             self.traps.define_variational_problem_extrinsic_traps(mesh.dx, dt, self.T)
 
+    def check_quasi_steady_state_traps(self):
+        """Checks that the traps in quasi-steady state can be assumed in
+        equilibrium with the mobile concentration
+
+        Raises:
+            ValueError: if a trap in quasi-steady state is extrinsic or has
+                sources or initial conditions, or if boundary conditions are
+                set on trap fields
+        """
+        traps = self.traps.quasi_steady_state_traps
+        if not traps:
+            return
+        ids = []
+        for trap in traps:
+            if isinstance(trap, festim.ExtrinsicTrapBase):
+                raise ValueError("extrinsic traps can't be in quasi-steady state")
+            # the equilibrium concentration doesn't account for trap sources
+            if trap.sources:
+                raise ValueError("sources can't be set on traps in quasi-steady state")
+            ids += [trap.id, str(trap.id)]
+        for ini in self.initial_conditions:
+            if ini.field in ids:
+                raise ValueError(
+                    "initial conditions can't be set on traps in quasi-steady state"
+                )
+        # trap fields are given by their index
+        for bc in self.boundary_conditions:
+            if bc.field not in ["T", 0, "0", "solute"]:
+                raise ValueError(
+                    "boundary conditions can't be set on trap fields with traps "
+                    + "in quasi-steady state"
+                )
+
+    def unmergeable_traps(self):
+        """Lists the traps that can't be conglomerated: traps with initial
+        conditions, or all the traps if boundary conditions are set on trap
+        fields (since these fields are given by their index)
+
+        Returns:
+            list: the festim.Trap objects
+        """
+        for bc in self.boundary_conditions:
+            if bc.field not in ["T", 0, "0", "solute"]:
+                return self.traps.traps
+        fields = [ini.field for ini in self.initial_conditions]
+        return [
+            trap
+            for trap in self.traps.traps
+            if trap.id in fields or str(trap.id) in fields
+        ]
+
     def define_function_space(self, mesh):
         """Creates a suitable function space for H transport problem
 
@@ -88,7 +158,7 @@ class HTransportProblem:
         element_solute, order_solute = "CG", 1
 
         # function space for H concentrations
-        nb_traps = len(self.traps.traps)
+        nb_traps = len(self.traps.fields)
         if nb_traps == 0:
             V = FunctionSpace(mesh.mesh, element_solute, order_solute)
         else:
@@ -96,7 +166,10 @@ class HTransportProblem:
             traps = FiniteElement(
                 self.settings.traps_element_type, mesh.mesh.ufl_cell(), order_trap
             )
-            element = [solute] + [traps] * nb_traps
+            # densities of monolithic extrinsic traps are extra components
+            density = FiniteElement("CG", mesh.mesh.ufl_cell(), 1)
+            nb_densities = len(self.traps.monolithic_traps)
+            element = [solute] + [traps] * nb_traps + [density] * nb_densities
             V = FunctionSpace(mesh.mesh, MixedElement(element))
         self.V = V
         self.V_CG1 = FunctionSpace(mesh.mesh, "CG", 1)
@@ -120,11 +193,12 @@ class HTransportProblem:
             self.mobile.previous_solution = self.u_n
             self.mobile.test_function = self.v
         else:
-            for i, concentration in enumerate([self.mobile, *self.traps.traps]):
+            for i, concentration in enumerate([self.mobile, *self.traps.fields]):
                 concentration.solution = self.u.sub(i)
                 # concentration.solution = list(split(self.u))[i]
                 concentration.previous_solution = self.u_n.sub(i)
                 concentration.test_function = list(split(self.v))[i]
+            self.initialise_monolithic_densities()
 
         print("Defining initial values")
         field_to_component = {
@@ -132,7 +206,7 @@ class HTransportProblem:
             "0": 0,
             0: 0,
         }
-        for i, trap in enumerate(self.traps.traps, 1):
+        for i, trap in enumerate(self.traps.fields, 1):
             field_to_component[trap.id] = i
             field_to_component[str(trap.id)] = i
         # TODO refactore this, attach the initial conditions to the objects directly
@@ -150,7 +224,7 @@ class HTransportProblem:
                     functionspace, value, label=ini.label, time_step=ini.time_step
                 )
             else:
-                trap = self.traps.get_trap(component)
+                trap = self.traps.fields[component - 1]
                 trap.initialise(
                     functionspace, value, label=ini.label, time_step=ini.time_step
                 )
@@ -168,9 +242,22 @@ class HTransportProblem:
         # this is needed to correctly create the formulation
         # TODO: write a test for this?
         if self.V.num_sub_spaces() != 0:
-            for i, concentration in enumerate([self.mobile, *self.traps.traps]):
+            for i, concentration in enumerate([self.mobile, *self.traps.fields]):
                 concentration.previous_solution = list(split(self.u_n))[i]
                 concentration.solution = list(split(self.u))[i]
+            self.initialise_monolithic_densities()
+            self.traps.assign_members_solutions()
+
+    def initialise_monolithic_densities(self):
+        """Assigns the components of self.u, self.u_n and self.v following
+        the concentrations to the densities of the monolithic extrinsic traps
+        """
+        nb_concentrations = 1 + len(self.traps.fields)
+        u, u_n, v = split(self.u), split(self.u_n), split(self.v)
+        for i, trap in enumerate(self.traps.monolithic_traps, nb_concentrations):
+            trap.density = [u[i]]
+            trap.density_previous_solution = u_n[i]
+            trap.density_test_function = v[i]
 
     def define_variational_problem(self, materials, mesh, dt=None):
         """Creates the variational problem for hydrogen transport (form,
@@ -184,23 +271,75 @@ class HTransportProblem:
         """
         print("Defining variational problem")
         expressions = []
-        F = 0
 
         # diffusion + transient terms
 
         self.mobile.create_form(
             materials, mesh, self.T, dt, traps=self.traps, soret=self.settings.soret
         )
-        F += self.mobile.F
         expressions += self.mobile.sub_expressions
 
         # Add traps
         self.traps.create_forms(self.mobile, materials, self.T, mesh.dx, dt)
-        F += self.traps.F
         expressions += self.traps.sub_expressions
-        self.F = F
+
+        # densities of monolithic extrinsic traps
+        F_densities = 0
+        for trap in self.traps.monolithic_traps:
+            if self.settings.transient:
+                trap.create_form_density(mesh.dx, dt, self.T)
+                F_densities += trap.form_density
+            else:
+                # no evolution in steady state: the density stays zero
+                F_densities += trap.density[0] * trap.density_test_function * mesh.dx
+
+        self.F = self.set_quadrature_degrees(
+            {
+                "solute": self.mobile.F,
+                "traps": self.traps.F,
+                "densities": F_densities,
+            }
+        )
         self.expressions = expressions
 
+    def set_quadrature_degrees(self, terms):
+        """Sets the quadrature degrees of the terms of the formulation
+        according to the settings (see festim.set_quadrature_degree), warns
+        about the capped degrees and reports the degrees in
+        self.quadrature_degrees
+
+        Args:
+            terms (dict): the forms of the terms ("solute", "traps",
+                "densities")
+
+        Returns:
+            ufl.Form: the sum of the forms
+        """
+        max_degree = self.settings.max_quadrature_degree
+        self.quadrature_degrees = {}
+        F = 0
+        for term, form in terms.items():
+            if not isinstance(form, ufl.Form):
+                continue
+            form, estimated, used = festim.set_quadrature_degree(
+                form, self.settings.get_quadrature_degree(term), max_degree
+            )
+            if max_degree is not None and estimated > max_degree:
+                warnings.warn(
+                    "quadrature degree of the {} form capped from {} to {}".format(
+                        term, estimated, max_degree
+                    ),
+                    UserWarning,
+                )
+            print(
+                "Quadrature degree of the {} form: {} (estimated {})".format(
+                    term, used, estimated
+                )
+            )
+            self.quadrature_degrees[term] = {"estimated": estimated, "used": used}
+            F += form
+        return F
+
     def attribute_flux_boundary_conditions(self):
         """Iterates through self.boundary_conditions, checks if it's a FluxBC
         and its field is 0, and assign fluxes to self.mobile
@@ -248,14 +387,14 @@ class HTransportProblem:
         while converged is False:
             self.u.assign(u_)
             nb_it, converged = self.solve_once()
-            if dt.adaptive_stepsize is not None or dt.milestones is not None:
+            if dt.adaptive_stepsize is not None or dt.all_milestones:
                 dt.adapt(t, nb_it, converged)
 
         # Update previous solutions
         self.update_previous_solutions()
 
         # Solve extrinsic traps formulation
-        self.traps.solve_extrinsic_traps()
+        self.traps.solve_extrinsic_traps(dt, self.T)
 
     def solve_once(self):
         """Solves non linear problem
@@ -294,13 +433,22 @@ class HTransportProblem:
         self.traps.update_extrinsic_traps_density()
 
     def update_post_processing_solutions(self, exports):
-        if self.u.function_space().num_sub_spaces() == 0:
-            res = [self.u]
-        else:
-            res = list(self.u.split())
+        # u is split only once so that the post-processing functions (and
+        # the forms of the derived quantities built on them) persist across
+        # time steps
+        if self.u_split is None or self.u_split[0] is not self.u:
+            if self.u.function_space().num_sub_spaces() == 0:
+                res = [self.u]
+            else:
+                res = list(self.u.split())
+            self.u_split = (self.u, res)
+        res = self.u_split[1]
 
-        for i, trap in enumerate(self.traps.traps, 1):
+        for i, trap in enumerate(self.traps.fields, 1):
             trap.post_processing_solution = res[i]
+        self.traps.update_members_post_processing_solutions(self.u)
+        for trap in self.traps.quasi_steady_state_traps:
+            trap.equilibrium_projector.solve_local_rhs(trap.post_processing_solution)
 
         if self.settings.chemical_pot:
             self.mobile.post_processing_solution_to_concentration()
@@ -0,0 +1,662 @@
+import festim
+import numpy as np
+import sympy as sp
+
+
+class HTransportProblem1D:
+    """Hydrogen Transport Problem solved natively in 1D, without FEniCS.
+    Used internally in festim.Simulation when settings.engine is
+    "native_1d".
+
+    The formulation is the same as festim.HTransportProblem (CG1 elements)
+    but the concentrations are stored at the vertices of the mesh and the
+    unknowns are interleaved vertex by vertex (c_m, ct1, ct2... at each
+    vertex). The Jacobian of the Newton iterations is then banded (block
+    tridiagonal): it is assembled analytically with NumPy and solved with
+    scipy.linalg.solve_banded. No form is compiled.
+
+    Supported: festim.MeshFromVertices (and festim.MeshFromRefinements) in
+    cartesian coordinates, festim.Temperature, festim.Trap, festim.Source,
+    festim.DirichletBC, festim.FluxBC, festim.RecombinationFlux,
+    festim.MassFlux, initial conditions given as numbers or sympy
+    expressions, festim.DerivedQuantities and festim.TXTExport. The values
+    (densities, sources, BCs...) must be numbers or sympy expressions of
+    festim.x and festim.t.
+
+    Args:
+        mobile (festim.Mobile): the mobile concentration
+        traps (festim.Traps): the traps
+        T (festim.Temperature): the temperature
+        settings (festim.Settings): the problem settings
+        initial_conditions (list of festim.initial_conditions): the
+            initial conditions of the h transport problem
+
+    Attributes:
+        x (np.ndarray): the vertices of the mesh
+        h (np.ndarray): the sizes of the cells
+        cell_ids (np.ndarray): the subdomain ids of the cells
+        u (np.ndarray): the concentrations at the vertices, of shape
+            (nb_vertices, nb_components) with the components c_m, ct1,
+            ct2...
+        u_n (np.ndarray): the "previous" concentrations
+        T_values (np.ndarray): the temperature at the vertices
+        t (float): the time at which the coefficients are evaluated
+        boundary_conditions (list): the festim.BoundaryCondition of the H
+            transport problem
+    """
+
+    def __init__(self, mobile, traps, T, settings, initial_conditions) -> None:
+        self.mobile = mobile
+        self.traps = traps
+        self.T = T
+        self.settings = settings
+        self.initial_conditions = initial_conditions
+
+        self.boundary_conditions = []
+        self.dt = None
+        self.t = 0
+
+        self.x = None
+        self.h = None
+        self.cell_ids = None
+        self.u = None
+        self.u_n = None
+        self.T_values = None
+
+        self._dirichlet_bcs = []
+        self._fluxes = []
+
+    @property
+    def nb_components(self):
+        return 1 + len(self.traps.traps)
+
+    def initialise(self, mesh, materials, dt=None):
+        """Checks the problem can be solved natively, creates the
+        quadrature, the concentrations arrays and the boundary conditions
+
+        Args:
+            mesh (festim.MeshFromVertices): the mesh
+            materials (festim.Materials): the materials
+            dt (festim.Stepsize, optional): the stepsize, only needed if
+                self.settings.transient is True. Defaults to None.
+        """
+        self.check_compatibility(mesh)
+        self.materials = materials
+        self.dt = dt if self.settings.transient else None
+        self.traps.make_traps_materials(materials)
+
+        self.x = np.unique(np.asarray(mesh.vertices, dtype=float))
+        if materials.materials[0].borders is not None:
+            materials.check_borders(self.x[-1])
+        self.h = np.diff(self.x)
+        self.cell_ids = materials.find_subdomains_from_x_coordinates(
+            (self.x[:-1] + self.x[1:]) / 2
+        )
+        self.create_quadrature()
+        self.create_band_indices()
+        self.create_coefficients_functions()
+
+        print("Defining initial values")
+        self.u = np.zeros((len(self.x), self.nb_components))
+        self.u_n = np.zeros((len(self.x), self.nb_components))
+        self.initialise_concentrations()
+
+        print("Defining boundary conditions")
+        self.create_boundary_conditions()
+        self.update_coefficients(0)
+
+    def check_compatibility(self, mesh):
+        """Checks that the problem can be solved by the native 1D engine
+
+        Args:
+            mesh (festim.Mesh): the mesh
+
+        Raises:
+            NotImplementedError: if a feature of the problem is not
+                supported
+        """
+        unsupported = None
+        if not isinstance(mesh, festim.MeshFromVertices) or mesh.type != "cartesian":
+            unsupported = "meshes other than cartesian festim.MeshFromVertices"
+        elif self.settings.chemical_pot or self.settings.soret:
+            unsupported = "chemical potential and Soret effect"
+        elif type(self.T) is not festim.Temperature:
+            unsupported = "temperatures other than festim.Temperature"
+        elif self.settings.traps_element_type != "CG":
+            unsupported = "traps element types other than CG"
+        elif any(type(trap) is not festim.Trap for trap in self.traps.traps):
+            unsupported = "extrinsic traps"
+        elif self.traps.quasi_steady_state_traps:
+            unsupported = "traps in quasi-steady state"
+        elif any(isinstance(ini.value, str) for ini in self.initial_conditions):
+            unsupported = "initial conditions read from XDMF files"
+        if unsupported is not None:
+            raise NotImplementedError(
+                "{} are not supported by the native 1D engine".format(unsupported)
+            )
+
+    def check_exports(self, exports):
+        """Checks that the exports can be computed by the native 1D engine
+
+        Args:
+            exports (festim.Exports): the exports
+
+        Raises:
+            NotImplementedError: if an export or a derived quantity is not
+                supported
+        """
+        supported_quantities = (
+            festim.SurfaceFlux,
+            festim.TotalVolume,
+            festim.AverageVolume,
+            festim.MaximumVolume,
+            festim.MinimumVolume,
+            festim.TotalSurface,
+            festim.AverageSurface,
+            festim.MaximumSurface,
+            festim.MinimumSurface,
+        )
+        for export in exports.exports:
+            if isinstance(export, festim.DerivedQuantities):
+                for quantity in export.derived_quantities:
+                    if not isinstance(quantity, supported_quantities) or (
+                        isinstance(quantity, festim.SurfaceFlux)
+                        and quantity.field not in [0, "0", "solute"]
+                    ):
+                        raise NotImplementedError(
+                            "{} of {} is not supported by the native 1D engine".format(
+                                type(quantity).__name__, quantity.field
+                            )
+                        )
+            elif not isinstance(export, festim.TXTExport):
+                raise NotImplementedError(
+                    "{} is not supported by the native 1D engine".format(
+                        type(export).__name__
+                    )
+                )
+
+    def create_quadrature(self):
+        """Creates the Gauss-Legendre quadrature of the cells. Its degree is
+        the highest of the quadrature degrees set in the settings (see
+        festim.Settings.get_quadrature_degree), 6 if none is set, capped by
+        settings.max_quadrature_degree
+        """
+        degrees = [
+            self.settings.get_quadrature_degree(term) for term in ["solute", "traps"]
+        ]
+        degrees = [degree for degree in degrees if degree is not None]
+        degree = max(degrees) if degrees else 6
+        if self.settings.max_quadrature_degree is not None:
+            degree = min(degree, self.settings.max_quadrature_degree)
+        points, weights = np.polynomial.legendre.leggauss(degree // 2 + 1)
+        xi = (points + 1) / 2
+        # values of the basis functions of the cells at the quadrature points
+        self._phi = np.array([1 - xi, xi])
+        self._phi_phi = np.einsum("aq,bq->qab", self._phi, self._phi).reshape(-1, 4)
+        # signs of the derivatives of the basis functions (times the size)
+        self._dphi = np.array([-1.0, 1.0])
+        self._w = self.h[:, None] * weights / 2
+        self._x_q = self.x[:-1, None] + self.h[:, None] * xi
+
+    def create_band_indices(self):
+        """Computes the indices of the residual and of the Jacobian entries
+        (in the banded storage of scipy.linalg.solve_banded) of the cells
+        local contributions
+        """
+        m = self.nb_components
+        nb_cells = len(self.h)
+        self.bandwidth = 2 * m - 1
+        self.size = len(self.x) * m
+        # global dof of the component i of the vertex a of each cell
+        dofs = (
+            np.arange(nb_cells)[:, None, None] + np.arange(2)[None, :, None]
+        ) * m + np.arange(m)[None, None, :]
+        self._rows = dofs.ravel()
+        rows = dofs[:, :, :, None, None]
+        cols = dofs[:, None, None, :, :]
+        band = self.bandwidth + rows - cols
+        self._band_indices = (band * self.size + cols).ravel()
+
+    def cells_in(self, ids):
+        """Returns the mask of the cells in the subdomains
+
+        Args:
+            ids (int, list): the subdomain ids
+
+        Returns:
+            np.ndarray: the mask
+        """
+        if not isinstance(ids, list):
+            ids = [ids]
+        return np.isin(self.cell_ids, ids)
+
+    def create_coefficients_functions(self):
+        """Converts the values of the temperature, the trap densities and
+        the sources into vectorised functions of x and t"""
+        self._T_function = lambdify_x_t(self.T.value)
+
+        self._densities = []
+        for trap in self.traps.traps:
+            self._densities.append([lambdify_x_t(n) for n in trap.input_density])
+
+        self._sources = []
+        for i, concentration in enumerate([self.mobile, *self.traps.traps]):
+            for source in concentration.sources:
+                volumes = source.volume
+                mask = self.cells_in(volumes)
+                self._sources.append((i, mask, lambdify_x_t(source.input_value)))
+
+    def initialise_concentrations(self):
+        """Initialises self.u_n based on self.initial_conditions"""
+        field_to_component = {
+            "solute": 0,
+            "0": 0,
+            0: 0,
+        }
+        for i, trap in enumerate(self.traps.traps, 1):
+            field_to_component[trap.id] = i
+            field_to_component[str(trap.id)] = i
+        for ini in self.initial_conditions:
+            component = field_to_component[ini.field]
+            self.u_n[:, component] = lambdify_x_t(ini.value)(self.x, 0)
+
+    def surface_vertex(self, surface):
+        """Returns the index of the vertex of a surface (1 for the left
+        hand side of the domain, 2 for the right hand side)
+
+        Args:
+            surface (int): the surface id
+
+        Raises:
+            ValueError: if the surface doesn't exist
+
+        Returns:
+            int: the index of the vertex
+        """
+        if surface == 1:
+            return 0
+        if surface == 2:
+            return len(self.x) - 1
+        raise ValueError("surface {} doesn't exist in 1D".format(surface))
+
+    def create_boundary_conditions(self):
+        """Converts self.boundary_conditions into Dirichlet rows and
+        fluxes on the mobile concentration
+
+        Raises:
+            NotImplementedError: if a boundary condition is not supported
+        """
+        self._dirichlet_bcs = []
+        self._fluxes = []
+        m = self.nb_components
+        for bc in self.boundary_conditions:
+            if type(bc) is festim.DirichletBC:
+                value = lambdify_x_t(bc.value)
+                for surface in bc.surfaces:
+                    vertex = self.surface_vertex(surface)
+                    row = vertex * m + int(bc.field)
+                    self._dirichlet_bcs.append((row, vertex, value))
+            elif isinstance(bc, festim.FluxBC) and bc.field != 0:
+                # only the fluxes on the mobile concentration are applied
+                continue
+            elif type(bc) is festim.FluxBC:
+                functions = {"value": lambdify_x_t(bc.value)}
+            elif type(bc) is festim.RecombinationFlux:
+                functions = {
+                    "Kr_0": lambdify_x_t(bc.Kr_0),
+                    "E_Kr": lambdify_x_t(bc.E_Kr),
+                }
+            elif type(bc) is festim.MassFlux:
+                functions = {
+                    "h_coeff": lambdify_x_t(bc.h_coeff),
+                    "c_ext": lambdify_x_t(bc.c_ext),
+                }
+            else:
+                raise NotImplementedError(
+                    "{} is not supported by the native 1D engine".format(
+                        type(bc).__name__
+                    )
+                )
+            if isinstance(bc, festim.FluxBC):
+                for surface in bc.surfaces:
+                    self._fluxes.append((self.surface_vertex(surface), bc, functions))
+
+    def update_coefficients(self, t):
+        """Evaluates the temperature, the diffusion, trapping and detrapping
+        coefficients, the densities and the sources at time t
+
+        Args:
+            t (float): the time
+        """
+        self.t = t
+        self.T_values = self._T_function(self.x, t)
+        T_q = self.to_quadrature(self.T_values)
+
+        self._D = np.zeros_like(T_q)
+        self._in_materials = np.zeros(len(self.h), dtype=bool)
+        for material in self.materials.materials:
+            mask = self.cells_in(material.id)
+            self._in_materials |= mask
+            self._D[mask] = float(material.D_0) * np.exp(
+                -float(material.E_D) / festim.k_B / T_q[mask]
+            )
+
+        # k, p and density of each trap (zero outside its materials)
+        self._trapping = []
+        for trap, densities in zip(self.traps.traps, self._densities):
+            k, p, n = np.zeros_like(T_q), np.zeros_like(T_q), np.zeros_like(T_q)
+            in_trap = np.zeros(len(self.h), dtype=bool)
+            for i, mat in enumerate(trap.materials):
+                k_0, E_k, p_0, E_p, _ = trap.get_properties(i)
+                density = densities[i] if type(trap.k_0) is list else densities[0]
+                mask = self.cells_in(mat.id)
+                in_trap |= mask
+                k[mask] = float(k_0) * np.exp(-float(E_k) / festim.k_B / T_q[mask])
+                p[mask] = float(p_0) * np.exp(-float(E_p) / festim.k_B / T_q[mask])
+                n[mask] = density(self._x_q[mask], t)
+            # in steady state, c_t = 0 in the materials without the trap
+            outside = (self._in_materials & ~in_trap).astype(float)[:, None]
+            self._trapping.append((k, p, n, outside))
+
+        self._S = np.zeros(T_q.shape + (self.nb_components,))
+        for component, mask, value in self._sources:
+            self._S[mask, :, component] += value(self._x_q[mask], t)
+
+    def to_quadrature(self, values):
+        """Interpolates vertex values at the quadrature points of the cells
+
+        Args:
+            values (np.ndarray): the values at the vertices (first axis)
+
+        Returns:
+            np.ndarray: the values, of shape (nb_cells, nb_points, ...)
+        """
+        phi_0, phi_1 = [
+            p.reshape((1, -1) + (1,) * (values.ndim - 1)) for p in self._phi
+        ]
+        return values[:-1, None] * phi_0 + values[1:, None] * phi_1
+
+    def assemble(self, u):
+        """Assembles the residual of the formulation and its Jacobian
+
+        Args:
+            u (np.ndarray): the concentrations at the vertices, of shape
+                (nb_vertices, nb_components)
+
+        Returns:
+            np.ndarray, np.ndarray: the residual and the Jacobian in the
+            banded storage of scipy.linalg.solve_banded
+        """
+        m = self.nb_components
+        u_q = self.to_quadrature(u)
+        nb_cells, nb_points = u_q.shape[:2]
+
+        # pointwise residual f and Jacobian df/du tested with v
+        f = -self._S.copy()
+        df = np.zeros((nb_cells, nb_points, m, m))
+        if self.dt is not None:
+            dt = float(self.dt.value)
+            rate = (u_q - self.to_quadrature(self.u_n)) / dt
+            mobile_mask = self._in_materials.astype(float)[:, None]
+            f[..., 0] += mobile_mask * rate[..., 0] + rate[..., 1:].sum(axis=-1)
+            df[..., 0, 0] += mobile_mask / dt
+            df[..., 0, 1:] += 1 / dt
+            f[..., 1:] += rate[..., 1:]
+            for i in range(1, m):
+                df[..., i, i] += 1 / dt
+
+        c_m = u_q[..., 0]
+        for i, (k, p, n, outside) in enumerate(self._trapping, 1):
+            c_t = u_q[..., i]
+            f[..., i] += -k * c_m * (n - c_t) + p * c_t
+            df[..., i, 0] += -k * (n - c_t)
+            df[..., i, i] += k * c_m + p
+            if self.dt is None:
+                f[..., i] += outside * c_t
+                df[..., i, i] += outside
+
+        # diffusive flux D grad(c_m) tested with grad(v)
+        grad_c_m = (u[1:, 0] - u[:-1, 0]) / self.h
+        diffusion = (self._w * self._D).sum(axis=1) / self.h
+
+        # local contributions of the cells (the integrals over the
+        # quadrature points are products with the values of the basis
+        # functions)
+        wf = (self._w[:, :, None] * f).transpose(0, 2, 1)
+        residual_local = (wf @ self._phi.T).transpose(0, 2, 1)
+        residual_local[:, :, 0] += (diffusion * grad_c_m)[:, None] * self._dphi
+        wdf = (self._w[:, :, None, None] * df).reshape(nb_cells, nb_points, m * m)
+        jacobian_local = (
+            (wdf.transpose(0, 2, 1) @ self._phi_phi)
+            .reshape(nb_cells, m, m, 2, 2)
+            .transpose(0, 3, 1, 4, 2)
+            .copy()
+        )
+        jacobian_local[:, :, 0, :, 0] += (diffusion / self.h)[:, None, None] * np.outer(
+            self._dphi, self._dphi
+        )
+
+        residual = np.bincount(
+            self._rows, weights=residual_local.ravel(), minlength=self.size
+        )
+        band_size = (2 * self.bandwidth + 1) * self.size
+        jacobian = np.bincount(
+            self._band_indices, weights=jacobian_local.ravel(), minlength=band_size
+        ).reshape(2 * self.bandwidth + 1, self.size)
+
+        # fluxes -D grad(c_m).n = form
+        for vertex, bc, functions in self._fluxes:
+            value, derivative = self.flux(vertex, bc, functions, u[vertex, 0])
+            residual[vertex * m] += value
+            jacobian[self.bandwidth, vertex * m] += derivative
+
+        # Dirichlet rows are replaced by u = value
+        u_flat = u.ravel()
+        for row, value in self._dirichlet_values:
+            columns = row + self.bandwidth - np.arange(2 * self.bandwidth + 1)
+            valid = (columns >= 0) & (columns < self.size)
+            jacobian[np.arange(2 * self.bandwidth + 1)[valid], columns[valid]] = 0
+            jacobian[self.bandwidth, row] = 1
+            residual[row] = u_flat[row] - value
+        return residual, jacobian
+
+    def flux(self, vertex, bc, functions, c_m):
+        """Returns the contribution of a flux boundary condition to the
+        residual of the mobile concentration at a vertex (-form) and its
+        derivative
+
+        Args:
+            vertex (int): the index of the vertex
+            bc (festim.FluxBC): the boundary condition
+            functions (dict): the vectorised functions of the parameters of
+                the boundary condition
+            c_m (float): the mobile concentration at the vertex
+
+        Returns:
+            float, float: the contribution and its derivative with respect
+            to c_m
+        """
+        x, T = self.x[vertex], self.T_values[vertex]
+        values = {
+            key: float(function(x, self.t)) for key, function in functions.items()
+        }
+        if isinstance(bc, festim.RecombinationFlux):
+            Kr = values["Kr_0"] * np.exp(-values["E_Kr"] / festim.k_B / T)
+            return Kr * c_m**bc.order, Kr * bc.order * c_m ** (bc.order - 1)
+        if isinstance(bc, festim.MassFlux):
+            return values["h_coeff"] * (c_m - values["c_ext"]), values["h_coeff"]
+        return -values["value"], 0.0
+
+    @property
+    def _dirichlet_values(self):
+        return [
+            (row, float(value(self.x[vertex], self.t)))
+            for row, vertex, value in self._dirichlet_bcs
+        ]
+
+    def compute_jacobian(self):
+        """Nothing to do: the Jacobian is assembled analytically at each
+        Newton iteration (settings.update_jacobian is ignored)"""
+
+    def update(self, t, dt):
+        """Updates the H transport problem.
+
+        Args:
+            t (float): the current time (s)
+            dt (festim.Stepsize): the stepsize
+        """
+        self.update_coefficients(t)
+
+        converged = False
+        u_ = self.u.copy()
+        while converged is False:
+            self.u = u_.copy()
+            nb_it, converged = self.solve_once()
+            if dt.adaptive_stepsize is not None or dt.all_milestones:
+                dt.adapt(t, nb_it, converged)
+
+        # Update previous solutions
+        self.u_n = self.u.copy()
+
+    def solve_once(self):
+        """Solves non linear problem with Newton iterations (same
+        convergence criterion as the fenics Newton solver: absolute or
+        relative norm of the residual)
+
+        Returns:
+            int, bool: number of iterations for reaching convergence, True if
+                converged else False
+        """
+        try:
+            from scipy.linalg import solve_banded
+        except ImportError:
+            raise ImportError("scipy is required by the native 1D engine")
+
+        for row, value in self._dirichlet_values:
+            self.u.flat[row] = value
+
+        residual, jacobian = self.assemble(self.u)
+        residual_0 = np.linalg.norm(residual)
+        nb_it = 0
+        converged = residual_0 < self.settings.absolute_tolerance
+        while not converged and nb_it < self.settings.maximum_iterations:
+            du = solve_banded((self.bandwidth, self.bandwidth), jacobian, residual)
+            self.u = self.u - du.reshape(self.u.shape)
+            nb_it += 1
+            residual, jacobian = self.assemble(self.u)
+            norm = np.linalg.norm(residual)
+            if not np.isfinite(norm):
+                break
+            converged = (
+                norm < self.settings.absolute_tolerance
+                or norm / residual_0 < self.settings.relative_tolerance
+            )
+        return nb_it, converged
+
+    def get_field(self, field):
+        """Returns the values of a field at the vertices
+
+        Args:
+            field (str, int): the field ("solute", 0, 1, "T", "retention")
+
+        Raises:
+            ValueError: if the field doesn't exist
+
+        Returns:
+            np.ndarray: the values
+        """
+        if field in ["solute", 0, "0"]:
+            return self.u[:, 0]
+        if field == "T":
+            return self.T_values
+        if field == "retention":
+            return self.u.sum(axis=1)
+        for i, trap in enumerate(self.traps.traps, 1):
+            if field in [trap.id, str(trap.id)]:
+                return self.u[:, i]
+        raise ValueError("{} is not a valid field".format(field))
+
+    def get_DG1_field(self, field):
+        """Returns the values of a field ordered as the dofs of a DG1
+        function (two values per cell, from left to right), as exported by
+        festim.TXTExport
+
+        Args:
+            field (str, int): the field ("solute", 0, 1, "T", "retention",
+                or "x" for the coordinates)
+
+        Returns:
+            np.ndarray: the values
+        """
+        values = self.x if field == "x" else self.get_field(field)
+        return np.column_stack([values[:-1], values[1:]]).ravel()
+
+    def compute_derived_quantity(self, quantity):
+        """Computes a derived quantity from the values at the vertices. The
+        integrals are exact for the P1 fields.
+
+        Args:
+            quantity (festim.DerivedQuantity): the derived quantity
+
+        Returns:
+            float: the value of the quantity
+        """
+        values = self.get_field(quantity.field)
+        if isinstance(quantity, festim.SurfaceFlux):
+            vertex = self.surface_vertex(quantity.surface)
+            cell = 0 if vertex == 0 else len(self.h) - 1
+            normal = -1 if vertex == 0 else 1
+            material = self.materials.find_material_from_id(self.cell_ids[cell])
+            D = float(material.D_0) * np.exp(
+                -float(material.E_D) / festim.k_B / self.T_values[vertex]
+            )
+            grad = (values[cell + 1] - values[cell]) / self.h[cell]
+            return D * grad * normal
+        if isinstance(quantity, festim.VolumeQuantity):
+            mask = self.cells_in(quantity.volume)
+            if isinstance(quantity, (festim.MaximumVolume, festim.MinimumVolume)):
+                values = np.concatenate([values[:-1][mask], values[1:][mask]])
+                if isinstance(quantity, festim.MaximumVolume):
+                    return np.max(values, initial=-np.inf)
+                return np.min(values, initial=np.inf)
+            total = np.sum(self.h[mask] * (values[:-1] + values[1:])[mask] / 2)
+            if isinstance(quantity, festim.AverageVolume):
+                return total / np.sum(self.h[mask])
+            return total
+        # surface quantities are point values in 1D
+        return values[self.surface_vertex(quantity.surface)]
+
+
+def lambdify_x_t(value):
+    """Converts a number or a sympy expression of festim.x and festim.t
+    into a vectorised function
+
+    Args:
+        value (float, int, sympy.Expr): the value
+
+    Raises:
+        NotImplementedError: if the value is not a number or a sympy
+            expression of x and t
+
+    Returns:
+        callable: the function f(x, t) returning an np.ndarray of the shape
+        of x
+    """
+    if not isinstance(value, (int, float, sp.Basic)):
+        raise NotImplementedError(
+            "{} values are not supported by the native 1D engine".format(
+                type(value).__name__
+            )
+        )
+    expr = sp.sympify(value)
+    if not expr.free_symbols <= {festim.x, festim.t}:
+        raise NotImplementedError(
+            "only expressions of x and t are supported by the native 1D engine"
+        )
+    function = sp.lambdify([festim.x, festim.t], expr, "numpy")
+
+    def evaluate(x, t):
+        values = np.asarray(function(x, t), dtype=float)
+        return np.array(np.broadcast_to(values, np.shape(x)))
+
+    return evaluate
@@ -1,7 +1,9 @@
 import festim
 import xml.etree.ElementTree as ET
-from fenics import Expression, UserExpression, Constant
+from fenics import Expression, UserExpression, Constant, Function
 import sympy as sp
+import ufl
+from ufl.algorithms import estimate_total_polynomial_degree
 
 
 def update_expressions(expressions, t):
@@ -44,6 +46,65 @@ def as_constant_or_expression(val):
         return Expression(expr_ccode, degree=2, t=0)
 
 
+def is_DG1_function(function):
+    """Checks if a function is a fenics.Function of a scalar DG1 function
+    space (and not a sub-function of a mixed function)
+
+    Args:
+        function (any): the function
+
+    Returns:
+        bool: True if function is a scalar DG1 fenics.Function, else False
+    """
+    if not isinstance(function, Function):
+        return False
+    V = function.function_space()
+    element = V.ufl_element()
+    return (
+        element.family() == "Discontinuous Lagrange"
+        and element.degree() == 1
+        and element.value_shape() == ()
+        and len(V.component()) == 0
+    )
+
+
+def set_quadrature_degree(form, degree=None, max_degree=None):
+    """Sets the quadrature degree of the integrals of a form. Without
+    degree, the degree of each integral is the one estimated by UFL (or the
+    one already given in the metadata of the integral), capped at
+    max_degree. If neither degree nor max_degree is given, the form is
+    returned untouched (the form compiler parameters then apply).
+
+    Args:
+        form (ufl.Form): the form
+        degree (int, optional): the quadrature degree of all the integrals.
+            Defaults to None.
+        max_degree (int, optional): the maximum quadrature degree. Defaults
+            to None.
+
+    Returns:
+        ufl.Form, int, int: the form, the highest estimated degree and the
+        highest degree used
+    """
+    integrals = []
+    highest_estimated, highest_used = 0, 0
+    for integral in form.integrals():
+        estimated = integral.metadata().get("quadrature_degree")
+        if estimated is None:
+            estimated = estimate_total_polynomial_degree(integral.integrand())
+        used = estimated if degree is None else degree
+        if max_degree is not None:
+            used = min(used, max_degree)
+        metadata = dict(integral.metadata())
+        metadata["quadrature_degree"] = used
+        integrals.append(integral.reconstruct(metadata=metadata))
+        highest_estimated = max(highest_estimated, estimated)
+        highest_used = max(highest_used, used)
+    if degree is None and max_degree is None:
+        return form, highest_estimated, highest_used
+    return ufl.Form(integrals), highest_estimated, highest_used
+
+
 def kJmol_to_eV(energy):
     """Converts an energy value given in units kJ mol^{-1} to eV
 
@@ -246,6 +246,45 @@ class Materials:
         # if no subdomain was found, return 0
         return 0
 
+    def find_subdomains_from_x_coordinates(self, x):
+        """Finds the correct subdomains at given x coordinates.
+        Vectorised version of find_subdomain_from_x_coordinate giving
+        identical results.
+
+        Args:
+            x (np.ndarray): the x coordinates
+
+        Returns:
+            np.ndarray: the corresponding subdomain ids (0 if no subdomain
+                was found)
+        """
+        x = np.asarray(x, dtype=float)
+        # list of (start, end, subdomain) in order of priority
+        intervals = []
+        for material in self.materials:
+            # if no borders are provided, assume only one subdomain
+            if material.borders is None:
+                intervals.append((-np.inf, np.inf, material.id))
+                break
+            if isinstance(material.borders[0], list) and len(material.borders) > 1:
+                list_of_borders = material.borders
+            else:
+                list_of_borders = [material.borders]
+            if isinstance(material.id, list):
+                subdomains = material.id
+            else:
+                subdomains = [material.id for _ in range(len(list_of_borders))]
+
+            for borders, subdomain in zip(list_of_borders, subdomains):
+                intervals.append((borders[0], borders[1], subdomain))
+
+        subdomain_ids = np.zeros(x.shape, dtype=np.uintp)
+        # the first matching interval wins so intervals are applied in
+        # reverse order
+        for start, end, subdomain in reversed(intervals):
+            subdomain_ids[(start <= x) & (x <= end)] = subdomain
+        return subdomain_ids
+
     def create_properties(self, vm, T):
         """Creates the properties fields needed for post processing
 
@@ -266,24 +305,28 @@ class Materials:
 
     def solubility_as_function(self, mesh, T):
         """
-        Makes solubility as a fenics.Function and stores it in S attribute
+        Makes solubility as a fenics.Function and stores it in S attribute.
+        The DG1 projection is solved cell by cell with a fenics.LocalSolver.
         """
         V = f.FunctionSpace(mesh.mesh, "DG", 1)
         S = f.Function(V, name="S")
+        S_trial = f.TrialFunction(V)
         vS = f.TestFunction(V)
         dx = mesh.dx
-        F = 0
+        a = S_trial * vS * dx
+        L = 0
         for mat in self.materials:
-            F += -S * vS * dx(mat.id)
-            F += mat.S_0 * f.exp(-mat.E_S / k_B / T) * vS * dx(mat.id)
-        f.solve(F == 0, S, bcs=[])
+            L += mat.S_0 * f.exp(-mat.E_S / k_B / T) * vS * dx(mat.id)
+        solver = f.LocalSolver(a, L, f.LocalSolver.SolverType.Cholesky)
+        solver.solve_local_rhs(S)
 
         self.S = S
 
     def create_solubility_law_markers(self, mesh: festim.Mesh):
         """Creates the attributes henry_marker and sievert_marker
         These fenics.Function are equal to one or zero depending
-        on the material solubility_law
+        on the material solubility_law. The DG0 values are directly
+        assigned cell by cell from the volume markers.
 
         Args:
             mesh (festim.Mesh): the mesh
@@ -292,29 +335,28 @@ class Materials:
         henry = f.Function(V)
         sievert = f.Function(V)
 
-        test_function_henry = f.TestFunction(V)
-        test_function_sievert = f.TestFunction(V)
-
-        # initialise formulations
-        F_henry = -henry * test_function_henry * mesh.dx
-        F_sievert = -sievert * test_function_sievert * mesh.dx
-
-        # build the formulation depending on the
+        henry_ids, sievert_ids = [], []
         for mat in self.materials:
             # make sure mat_ids is a list
             mat_ids = mat.id
             if not isinstance(mat.id, list):
                 mat_ids = [mat.id]
 
-            for mat_id in mat_ids:  # iterate through the subdomains
-                if mat.solubility_law == "henry":
-                    F_henry += 1 * test_function_henry * mesh.dx(mat_id)
-                elif mat.solubility_law == "sievert":
-                    F_sievert += 1 * test_function_sievert * mesh.dx(mat_id)
-
-        # solve the problems
-        f.solve(F_henry == 0, henry, [])
-        f.solve(F_sievert == 0, sievert, [])
+            if mat.solubility_law == "henry":
+                henry_ids += mat_ids
+            elif mat.solubility_law == "sievert":
+                sievert_ids += mat_ids
+
+        # one dof per cell
+        cell_dofs = V.dofmap().entity_dofs(mesh.mesh, mesh.mesh.topology().dim())
+        cell_markers = mesh.volume_markers.array()
+        nb_owned_dofs = henry.vector().local_size()
+        owned = cell_dofs < nb_owned_dofs
+        for function, ids in [(henry, henry_ids), (sievert, sievert_ids)]:
+            values = np.zeros(nb_owned_dofs)
+            values[cell_dofs[owned]] = np.isin(cell_markers, ids)[owned]
+            function.vector().set_local(values)
+            function.vector().apply("insert")
 
         self.henry_marker = henry
         self.sievert_marker = sievert
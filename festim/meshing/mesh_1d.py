@@ -1,4 +1,5 @@
 import fenics as f
+import numpy as np
 from festim import Mesh
 
 
@@ -38,16 +39,12 @@ class Mesh1D(Mesh):
         surface_markers = f.MeshFunction(
             "size_t", self.mesh, self.mesh.topology().dim() - 1, 0
         )
-        surface_markers.set_all(0)
-        i = 0
-        for facet in f.facets(self.mesh):
-            i += 1
-            x0 = facet.midpoint()
-            surface_markers[facet] = 0
-            if f.near(x0.x(), self.start):
-                surface_markers[facet] = 1
-            if f.near(x0.x(), self.size):
-                surface_markers[facet] = 2
+        # in 1D, facets are the vertices of the mesh
+        x = self.mesh.coordinates()[:, 0]
+        markers = np.zeros(len(x), dtype=np.uintp)
+        markers[np.abs(x - self.start) < f.DOLFIN_EPS] = 1
+        markers[np.abs(x - self.size) < f.DOLFIN_EPS] = 2
+        surface_markers.array()[:] = markers
         return surface_markers
 
     def define_volume_markers(self, materials):
@@ -63,11 +60,11 @@ class Mesh1D(Mesh):
         volume_markers = f.MeshFunction(
             "size_t", self.mesh, self.mesh.topology().dim(), 0
         )
-        # iterate through the cells of the mesh and mark them
-        for cell in f.cells(self.mesh):
-            x = cell.midpoint().x()
-            subdomain_id = materials.find_subdomain_from_x_coordinate(x)
-            volume_markers[cell] = subdomain_id
+        # compute all the cells midpoints at once and mark them
+        midpoints = self.mesh.coordinates()[self.mesh.cells()].mean(axis=1)[:, 0]
+        volume_markers.array()[:] = materials.find_subdomains_from_x_coordinates(
+            midpoints
+        )
 
         return volume_markers
 
@@ -1,8 +1,8 @@
-import fenics as f
-from festim import Mesh1D
+import numpy as np
+from festim import MeshFromVertices
 
 
-class MeshFromRefinements(Mesh1D):
+class MeshFromRefinements(MeshFromVertices):
     """
     1D mesh with iterative refinements (on the left hand side of the domain)
 
@@ -12,7 +12,11 @@ class MeshFromRefinements(Mesh1D):
         size (float): total size of the 1D mesh
         refinements (list, optional): list of dicts
             {"x": ..., "cells": ...}. For each refinement, the mesh will
-            have at least ["cells"] in [0, "x"]. Defaults to [].
+            have at least ["cells"] in [0, "x"]. If the optional key
+            "ratio" is given ({"x": ..., "cells": ..., "ratio": ...}),
+            [0, "x"] is meshed with exactly ["cells"] cells geometrically
+            graded from the left hand side, each cell being "ratio" times
+            bigger than the previous one. Defaults to [].
         start (float, optional): the starting point of the mesh. Defaults to
             0.
 
@@ -26,40 +30,82 @@ class MeshFromRefinements(Mesh1D):
     def __init__(
         self, initial_number_of_cells, size, refinements=[], start=0.0, **kwargs
     ) -> None:
-        super().__init__(**kwargs)
         self.initial_number_of_cells = initial_number_of_cells
-        self.size = size
-        self.start = start
         self.refinements = refinements
-        self.mesh_and_refine()
+        print("Meshing ...")
+        super().__init__(vertices=self.compute_vertices(start, size), **kwargs)
 
     def mesh_and_refine(self):
-        """Mesh and refine iteratively until meeting the refinement
-        conditions.
+        """Mesh and refine until meeting the refinement conditions.
+        The final vertices are computed directly and the mesh is built in one
+        go.
         """
-
         print("Meshing ...")
-        initial_number_of_cells = self.initial_number_of_cells
-        size = self.size
-        mesh = f.IntervalMesh(initial_number_of_cells, self.start, size)
+        self.vertices = self.compute_vertices(self.start, self.size)
+        self.generate_mesh_from_vertices()
+
+    def compute_vertices(self, start, size):
+        """Computes the vertices of the refined mesh. Refinements without a
+        "ratio" key bisect all the cells left of "x" until the mesh has
+        gained "cells" cells (same as successive calls to fenics.refine).
+
+        Args:
+            start (float): the starting point of the mesh
+            size (float): the end point of the mesh
+
+        Raises:
+            ValueError: if the initial number of cells is too small to reach
+                the refinement point
+
+        Returns:
+            np.ndarray: the sorted vertices
+        """
+        vertices = np.linspace(start, size, num=self.initial_number_of_cells + 1)
         for refinement in self.refinements:
             nb_cells_ref = refinement["cells"]
             refinement_point = refinement["x"]
-            print("Mesh size before local refinement is " + str(len(mesh.cells())))
-            coarse_mesh = True
-            while len(mesh.cells()) < initial_number_of_cells + nb_cells_ref:
-                cell_markers = f.MeshFunction("bool", mesh, mesh.topology().dim())
-                cell_markers.set_all(False)
-                for cell in f.cells(mesh):
-                    if cell.midpoint().x() < refinement_point:
-                        cell_markers[cell] = True
-                        coarse_mesh = False
-                mesh = f.refine(mesh, cell_markers)
-                if coarse_mesh:
-                    msg = (
-                        "Infinite loop: Initial number " + "of cells might be too small"
-                    )
-                    raise ValueError(msg)
-            print("Mesh size after local refinement is " + str(len(mesh.cells())))
-            initial_number_of_cells = len(mesh.cells())
-        self.mesh = mesh
+            print("Mesh size before local refinement is " + str(len(vertices) - 1))
+            if "ratio" in refinement:
+                kept = (vertices > refinement_point) & ~np.isclose(
+                    vertices, refinement_point
+                )
+                vertices = np.concatenate(
+                    [
+                        graded_vertices(
+                            start, refinement_point, nb_cells_ref, refinement["ratio"]
+                        ),
+                        vertices[kept],
+                    ]
+                )
+            else:
+                nb_cells = len(vertices) - 1
+                while len(vertices) - 1 < nb_cells + nb_cells_ref:
+                    midpoints = (vertices[:-1] + vertices[1:]) / 2
+                    refined = midpoints < refinement_point
+                    if not refined.any():
+                        msg = (
+                            "Infinite loop: Initial number "
+                            + "of cells might be too small"
+                        )
+                        raise ValueError(msg)
+                    vertices = np.sort(np.concatenate([vertices, midpoints[refined]]))
+            print("Mesh size after local refinement is " + str(len(vertices) - 1))
+        return vertices
+
+
+def graded_vertices(start, end, nb_cells, ratio):
+    """Computes the vertices of a geometrically graded 1D mesh
+
+    Args:
+        start (float): the starting point
+        end (float): the end point
+        nb_cells (int): the number of cells
+        ratio (float): the ratio between the sizes of two consecutive cells
+
+    Returns:
+        np.ndarray: the vertices (from start to end)
+    """
+    if ratio == 1:
+        return np.linspace(start, end, num=nb_cells + 1)
+    k = np.arange(nb_cells + 1)
+    return start + (end - start) * (ratio**k - 1) / (ratio**nb_cells - 1)
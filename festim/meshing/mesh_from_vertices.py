@@ -23,22 +23,16 @@ class MeshFromVertices(Mesh1D):
         self.generate_mesh_from_vertices()
 
     def generate_mesh_from_vertices(self):
-        """Generates a 1D mesh"""
-        mesh = f.Mesh()
-        # the following is needed to avoid breaking in parrallel
-        # see issue 497
-        if f.MPI.comm_world.rank == 0:
-            vertices = sorted(np.unique(self.vertices))
-            nb_points = len(vertices)
-            nb_cells = nb_points - 1
-            editor = f.MeshEditor()
-            editor.open(mesh, "interval", 1, 1)  # top. and geom. dimension are both 1
-            editor.init_vertices(nb_points)  # number of vertices
-            editor.init_cells(nb_cells)  # number of cells
-            for i in range(0, nb_points):
-                editor.add_vertex(i, np.array([vertices[i]]))
-            for j in range(0, nb_cells):
-                editor.add_cell(j, np.array([j, j + 1]))
-            editor.close()
-        f.MeshPartitioning.build_distributed_mesh(mesh)
+        """Generates a 1D mesh.
+        An interval mesh with the right number of cells is created (and
+        distributed in parallel) and its coordinates are then set in bulk
+        from the vertices array.
+        """
+        vertices = np.unique(self.vertices)
+        nb_cells = len(vertices) - 1
+        mesh = f.IntervalMesh(f.MPI.comm_world, nb_cells, 0, 1)
+        # the global index of a vertex of an IntervalMesh is its position
+        # from the left hand side of the domain
+        global_indices = mesh.topology().global_indices(0)
+        mesh.coordinates()[:, 0] = vertices[global_indices]
         self.mesh = mesh
@@ -1,4 +1,6 @@
 import fenics as f
+import hashlib
+import os
 from festim import Mesh
 
 
@@ -9,23 +11,51 @@ class MeshFromXDMF(Mesh):
     Args:
         volume_file (str): path to the volume file
         boundary_file (str): path the boundary file
+        cache_file (str, optional): path to a HDF5 file (must end with
+            ".h5") where the mesh, the markers and the partitioning are
+            cached. If the cache exists and has been created from the same
+            volume and boundary files, the mesh and markers are read from
+            it in one pass. Else, they are read from the XDMF files and the
+            cache is (re)written. If None, no cache is used. Defaults to
+            None.
 
     Attributes:
         volume_file (str): name of the volume file
         boundary_file (str): name of the boundary file
+        cache_file (str): name of the cache file
         mesh (fenics.Mesh): the mesh
     """
 
-    def __init__(self, volume_file, boundary_file, **kwargs) -> None:
+    def __init__(self, volume_file, boundary_file, cache_file=None, **kwargs) -> None:
         super().__init__(**kwargs)
 
         self.volume_file = volume_file
         self.boundary_file = boundary_file
+        self.cache_file = cache_file
 
-        self.mesh = f.Mesh()
-        f.XDMFFile(self.volume_file).read(self.mesh)
+        if self.cache_file is not None and self.is_cache_valid():
+            self.read_cache()
+        else:
+            self.mesh = f.Mesh()
+            f.XDMFFile(self.volume_file).read(self.mesh)
 
-        self.define_markers()
+            self.define_markers()
+
+            if self.cache_file is not None:
+                self.write_cache()
+
+    @property
+    def cache_file(self):
+        return self._cache_file
+
+    @cache_file.setter
+    def cache_file(self, value):
+        if value is not None:
+            if not isinstance(value, str):
+                raise TypeError("cache_file must be a string")
+            if not value.endswith(".h5"):
+                raise ValueError("cache_file must end with .h5")
+        self._cache_file = value
 
     def define_markers(self):
         """Reads volume and surface entities from XDMF files"""
@@ -46,3 +76,72 @@ class MeshFromXDMF(Mesh):
         print("Succesfully load mesh with " + str(len(volume_markers)) + " cells")
         self.volume_markers = volume_markers
         self.surface_markers = surface_markers
+
+    def source_hash(self):
+        """Computes the hash of the volume and boundary files (and of their
+        HDF5 heavy data files if they exist)
+
+        Returns:
+            str: the hash
+        """
+        comm = f.MPI.comm_world
+        source_hash = None
+        if comm.rank == 0:
+            hasher = hashlib.sha256()
+            for xdmf_file in [self.volume_file, self.boundary_file]:
+                h5_file = os.path.splitext(xdmf_file)[0] + ".h5"
+                for filename in [xdmf_file, h5_file]:
+                    if os.path.exists(filename):
+                        with open(filename, "rb") as file:
+                            for chunk in iter(lambda: file.read(2**20), b""):
+                                hasher.update(chunk)
+            source_hash = hasher.hexdigest()
+        return comm.bcast(source_hash, root=0)
+
+    def is_cache_valid(self):
+        """Checks if the cache file exists and has been created from the
+        current volume and boundary files
+
+        Returns:
+            bool: True if the cache can be used, else False
+        """
+        if not os.path.exists(self.cache_file):
+            return False
+        cache = f.HDF5File(f.MPI.comm_world, self.cache_file, "r")
+        valid = False
+        if cache.has_dataset("/mesh"):
+            attributes = cache.attributes("/mesh")
+            if "source_hash" in attributes.list_attributes():
+                valid = attributes["source_hash"] == self.source_hash()
+        cache.close()
+        return valid
+
+    def read_cache(self):
+        """Reads the mesh, volume and surface markers from the cache file"""
+        cache = f.HDF5File(f.MPI.comm_world, self.cache_file, "r")
+        mesh = f.Mesh()
+        # use the cached partitioning if the number of processes matches
+        cache.read(mesh, "/mesh", True)
+        volume_markers = f.MeshFunction("size_t", mesh, mesh.topology().dim())
+        cache.read(volume_markers, "/volume_markers")
+        surface_markers = f.MeshFunction("size_t", mesh, mesh.topology().dim() - 1)
+        cache.read(surface_markers, "/surface_markers")
+        cache.close()
+
+        print("Succesfully load mesh with " + str(len(volume_markers)) + " cells")
+        self.mesh = mesh
+        self.volume_markers = volume_markers
+        self.surface_markers = surface_markers
+
+    def write_cache(self):
+        """Writes the mesh, volume and surface markers to the cache file"""
+        dirname = os.path.dirname(self.cache_file)
+        if dirname and not os.path.exists(dirname):
+            os.makedirs(dirname, exist_ok=True)
+
+        cache = f.HDF5File(f.MPI.comm_world, self.cache_file, "w")
+        cache.write(self.mesh, "/mesh")
+        cache.write(self.volume_markers, "/volume_markers")
+        cache.write(self.surface_markers, "/surface_markers")
+        cache.attributes("/mesh")["source_hash"] = self.source_hash()
+        cache.close()
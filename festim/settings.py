@@ -25,6 +25,32 @@ class Settings:
             options can be veiwed by print(list_linear_solver_methods()).
             More information can be found at: https://fenicsproject.org/pub/tutorial/html/._ftut1017.html.
             Defaults to None, for the newton solver this is: "umfpack".
+        quadrature_degree (int or dict, optional): the quadrature degree of
+            the H transport forms. Can be a dict with the keys "solute",
+            "traps" and "densities" (monolithic extrinsic trap densities)
+            to set the degree per term. If None (or for the missing keys),
+            the degrees estimated by UFL are used. Defaults to None.
+        max_quadrature_degree (int, optional): the maximum quadrature
+            degree of the H transport forms. A warning is raised when an
+            estimated degree is capped. Defaults to None.
+        equilibrium_traps (bool, optional): If True, all the traps are
+            assumed in local equilibrium with the mobile concentration
+            (Oriani): only the mobile concentration is solved for and the
+            trapped concentrations are computed in post-processing. Only
+            valid if trapping and detrapping are fast compared to diffusion.
+            Individual traps can be set in equilibrium with
+            festim.Trap(quasi_steady_state=True). Defaults to False.
+        suggest_quasi_steady_state (bool, optional): If True, a warning
+            is raised in transient simulations for the kinetic traps that
+            detrap much faster than the initial stepsize and could be set
+            in quasi-steady state (see
+            festim.Traps.suggest_quasi_steady_state). Defaults to False.
+        engine (str, optional): the engine solving the H transport problem.
+            "fenics" or "native_1d". The native 1D engine solves 1D
+            problems (festim.MeshFromVertices) with NumPy and SciPy banded
+            solvers, without compiling any form (see
+            festim.HTransportProblem1D for the supported features).
+            Defaults to "fenics".
 
     Attributes:
         transient (bool): transient or steady state sim
@@ -40,6 +66,14 @@ class Settings:
         traps_element_type (str): Finite element used for traps.
         update_jacobian (bool):
         linear_solver (str): linear solver method for the newton solver
+        quadrature_degree (int or dict): the quadrature degree of the H
+            transport forms
+        max_quadrature_degree (int): the maximum quadrature degree
+        equilibrium_traps (bool): traps in equilibrium with the mobile
+            concentration
+        suggest_quasi_steady_state (bool): suggest quasi-steady state for
+            the fast kinetic traps
+        engine (str): the engine solving the H transport problem
     """
 
     def __init__(
@@ -54,6 +88,11 @@ class Settings:
         traps_element_type="CG",
         update_jacobian=True,
         linear_solver=None,
+        quadrature_degree=None,
+        max_quadrature_degree=None,
+        equilibrium_traps=False,
+        suggest_quasi_steady_state=False,
+        engine="fenics",
     ):
         # TODO maybe transient and final_time are redundant
         self.transient = transient
@@ -68,3 +107,45 @@ class Settings:
         self.traps_element_type = traps_element_type
         self.update_jacobian = update_jacobian
         self.linear_solver = linear_solver
+        self.quadrature_degree = quadrature_degree
+        self.max_quadrature_degree = max_quadrature_degree
+        self.equilibrium_traps = equilibrium_traps
+        self.suggest_quasi_steady_state = suggest_quasi_steady_state
+        self.engine = engine
+
+    @property
+    def quadrature_degree(self):
+        return self._quadrature_degree
+
+    @quadrature_degree.setter
+    def quadrature_degree(self, value):
+        if isinstance(value, dict):
+            for key in value:
+                if key not in ["solute", "traps", "densities"]:
+                    raise ValueError(
+                        "{} is not a valid key for quadrature_degree".format(key)
+                    )
+        self._quadrature_degree = value
+
+    @property
+    def engine(self):
+        return self._engine
+
+    @engine.setter
+    def engine(self, value):
+        if value not in ["fenics", "native_1d"]:
+            raise ValueError("engine must be 'fenics' or 'native_1d'")
+        self._engine = value
+
+    def get_quadrature_degree(self, term):
+        """Returns the quadrature degree of a term of the H transport forms
+
+        Args:
+            term (str): "solute", "traps" or "densities"
+
+        Returns:
+            int: the quadrature degree, None if not set
+        """
+        if isinstance(self.quadrature_degree, dict):
+            return self.quadrature_degree.get(term)
+        return self.quadrature_degree
@@ -15,7 +15,10 @@ class Source:
 
     Attributes:
         value (fenics.Expression, fenics.UserExpression, fenics.Constant): the
-            value of the volumetric source term
+            value of the volumetric source term. Created from input_value
+            when first accessed
+        input_value (sympy.Expr, float, int, fenics.Expression...): the
+            value as given, used by the native 1D engine
         volume (int): the volume in which the source is applied
         field (str): the field on which the source is applied ("0", "solute",
             "1", "T")
@@ -24,10 +27,23 @@ class Source:
     def __init__(self, value, volume, field) -> None:
         self.volume = volume
         self.field = field
+        self.input_value = value
+        self._value = None
 
-        if isinstance(value, (float, int)):
-            self.value = Constant(value)
-        elif isinstance(value, sp.Expr):
-            self.value = Expression(sp.printing.ccode(value), t=0, degree=2)
-        elif isinstance(value, (Expression, UserExpression, Function)):
-            self.value = value
+    @property
+    def value(self):
+        # the fenics Expression is only compiled when the value is needed
+        # (never with the native 1D engine)
+        if self._value is None:
+            value = self.input_value
+            if isinstance(value, (float, int)):
+                self._value = Constant(value)
+            elif isinstance(value, sp.Expr):
+                self._value = Expression(sp.printing.ccode(value), t=0, degree=2)
+            elif isinstance(value, (Expression, UserExpression, Function)):
+                self._value = value
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
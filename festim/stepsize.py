@@ -17,13 +17,23 @@ class Stepsize:
         dt_min (float, optional): Minimum stepsize below which an error is
             raised. Defaults to None.
         milestones (list, optional): list of times by which the simulation must
-            pass. Defaults to None.
+            pass. The stepsize is reduced to hit them and restored
+            afterwards. Defaults to None.
+        hit_export_times (bool, optional): if True, the times of the
+            exports (XDMFExport, TXTExport and DerivedQuantities with times)
+            given by festim.Simulation are hit like milestones. Defaults to
+            True.
 
     Attributes:
         adaptive_stepsize (dict): contains the parameters for adaptive stepsize
         value (fenics.Constant): value of dt
         milestones (list): list of times by which the simulation must
             pass.
+        hit_export_times (bool): the export times are hit or not
+        export_times (list): the times of the exports of the simulation
+            (set by festim.Simulation)
+        all_milestones (list): the milestones and, if hit_export_times is
+            True, the export times
     """
 
     def __init__(
@@ -34,6 +44,7 @@ class Stepsize:
         stepsize_stop_max=None,
         dt_min=None,
         milestones=None,
+        hit_export_times=True,
     ) -> None:
         self.adaptive_stepsize = None
         if stepsize_change_ratio is not None:
@@ -46,6 +57,9 @@ class Stepsize:
         self.initial_value = initial_value
         self.value = None
         self.milestones = milestones
+        self.hit_export_times = hit_export_times
+        self.export_times = []
+        self._value_before_milestone = None
         self.initialise_value()
 
     @property
@@ -59,10 +73,25 @@ class Stepsize:
         else:
             self._milestones = value
 
+    @property
+    def all_milestones(self):
+        times = list(self.milestones or [])
+        if self.hit_export_times:
+            times += list(self.export_times)
+        return sorted(set(times))
+
     def initialise_value(self):
         """Creates a fenics.Constant object initialised with self.initial_value
-        and stores it in self.value"""
+        (or with the first milestone if it is smaller) and stores it in
+        self.value"""
         self.value = f.Constant(self.initial_value, name="dt")
+        self._value_before_milestone = None
+
+        # the first milestone must be hit
+        first_milestone = self.next_milestone(0)
+        if first_milestone is not None and self.initial_value > first_milestone:
+            self._value_before_milestone = self.initial_value
+            self.value.assign(first_milestone)
 
     def adapt(self, t, nb_it, converged):
         """Changes the stepsize based on convergence.
@@ -72,6 +101,12 @@ class Stepsize:
             nb_it (int): number of iterations the solver required to converge.
             converged (bool): True if the solver converged, else False.
         """
+        # restore the stepsize reduced to hit the previous milestone after a
+        # successful step (a failed step is retried with a smaller stepsize)
+        if converged and self._value_before_milestone is not None:
+            self.value.assign(self._value_before_milestone)
+            self._value_before_milestone = None
+
         if self.adaptive_stepsize:
             change_ratio = self.adaptive_stepsize["stepsize_change_ratio"]
             dt_min = self.adaptive_stepsize["dt_min"]
@@ -97,6 +132,8 @@ class Stepsize:
             if t + float(self.value) > next_milestone and not np.isclose(
                 t, next_milestone
             ):
+                if self._value_before_milestone is None:
+                    self._value_before_milestone = float(self.value)
                 self.value.assign((next_milestone - t))
 
     def next_milestone(self, current_time: float):
@@ -109,9 +146,7 @@ class Stepsize:
         Returns:
             float: next milestone.
         """
-        if self.milestones is None:
-            return None
-        for milestone in self.milestones:
+        for milestone in self.all_milestones:
             if current_time < milestone:
                 return milestone
         return None
@@ -1,6 +1,8 @@
 from festim.temperature.temperature import Temperature
-from festim.helpers import extract_xdmf_labels
+from festim.helpers import extract_xdmf_labels, extract_xdmf_times
+import bisect
 import fenics as f
+import numpy as np
 
 
 class TemperatureFromXDMF(Temperature):
@@ -10,17 +12,27 @@ class TemperatureFromXDMF(Temperature):
     Args:
         filename (str): The temperature file. Must end in ".xdmf"
         label (str): How the checkpoints have been labelled
+        transient (bool, optional): If True, all the checkpoints of the file
+            are indexed and the temperature is linearly interpolated in time
+            between the two checkpoints bracketing the current time. Else,
+            only the last checkpoint is read. Defaults to False.
 
     Attributes:
         filename (str): name of the temperature file
         label (str): How the checkpoints have been labelled
+        transient (bool): transient temperature or not
+        times (list): the times of the checkpoints in the file
     """
 
-    def __init__(self, filename, label) -> None:
+    def __init__(self, filename, label, transient=False) -> None:
         super().__init__()
 
         self.filename = filename
         self.label = label
+        self.transient = transient
+        self.times = None
+
+        self._snapshots = {}
 
         # check labels match
         if self.label not in extract_xdmf_labels(self.filename):
@@ -36,13 +48,99 @@ class TemperatureFromXDMF(Temperature):
         V = f.FunctionSpace(mesh.mesh, "CG", 1)
         self.T = f.Function(V, name="T")
 
-        f.XDMFFile(self.filename).read_checkpoint(self.T, self.label, -1)
+        if self.transient:
+            self.times = extract_xdmf_times(self.filename)
+            if any(np.diff(self.times) <= 0):
+                raise ValueError(
+                    "Times in {} must be strictly increasing".format(self.filename)
+                )
+            self._snapshots = {}
+            self.interpolate_in_time(0)
+        else:
+            f.XDMFFile(self.filename).read_checkpoint(self.T, self.label, -1)
 
         self.T_n = f.Function(V, name="T_n")
         self.T_n.assign(self.T)
 
     def update(self, t):
-        """Allows for the use of this class in transient h transport cases,
-        refer to issue #499
+        """Updates T_n and T with respect to time. If not transient, nothing
+        is updated (allows for the use of this class in transient h transport
+        cases, refer to issue #499)
+
+        Args:
+            t (float): the time
+        """
+        if self.transient:
+            self.T_n.assign(self.T)
+            self.interpolate_in_time(t)
+
+    def interpolate_in_time(self, t):
+        """Linearly interpolates the temperature at time t between the two
+        checkpoints bracketing t and assigns it to self.T.
+        Before the first (resp. after the last) checkpoint, the first
+        (resp. last) checkpoint is used.
+
+        Args:
+            t (float): the time
+        """
+        i, j = self.find_bracketing_checkpoints(t)
+        T_i = self.get_checkpoint(i)
+        if i == j:
+            self.T.assign(T_i)
+        else:
+            T_j = self.get_checkpoint(j)
+            weight = (t - self.times[i]) / (self.times[j] - self.times[i])
+            self.T.assign((1 - weight) * T_i + weight * T_j)
+
+        # forget the checkpoints that won't be needed anymore
+        for index in list(self._snapshots.keys()):
+            if index < i:
+                del self._snapshots[index]
+
+    def find_bracketing_checkpoints(self, t):
+        """Finds the indices of the checkpoints bracketing t
+
+        Args:
+            t (float): the time
+
+        Returns:
+            int, int: the indices of the previous and next checkpoints
+        """
+        if t <= self.times[0] or np.isclose(t, self.times[0]):
+            return 0, 0
+        if t >= self.times[-1] or np.isclose(t, self.times[-1]):
+            last = len(self.times) - 1
+            return last, last
+        j = bisect.bisect_right(self.times, t)
+        return j - 1, j
+
+    def get_checkpoint(self, index):
+        """Returns the checkpoint of a given index. The checkpoint is read
+        only if it hasn't been read yet.
+
+        Args:
+            index (int): the index of the checkpoint
+
+        Returns:
+            fenics.Function: the temperature at the checkpoint
         """
-        pass
+        if index not in self._snapshots:
+            self._snapshots[index] = self.read_checkpoint(index)
+        return self._snapshots[index]
+
+    def read_checkpoint(self, index):
+        """Reads the checkpoint of a given index in the XDMF file
+
+        Args:
+            index (int): the index of the checkpoint
+
+        Returns:
+            fenics.Function: the temperature at the checkpoint
+        """
+        T = f.Function(self.T.function_space())
+        with f.XDMFFile(self.filename) as file:
+            file.read_checkpoint(T, self.label, index)
+        return T
+
+    def is_steady_state(self):
+        return not self.transient
@@ -1,5 +1,6 @@
 import festim
 import fenics as f
+import numpy as np
 import sympy as sp
 
 
@@ -21,6 +22,17 @@ class HeatTransferProblem(festim.Temperature):
             If None, the default fenics linear solver will be used ("umfpack").
             More information can be found at: https://fenicsproject.org/pub/tutorial/html/._ftut1017.html.
             Defaults to None.
+        stepsize (festim.Stepsize, optional): the stepsize of the heat
+            transfer problem. If provided, the heat transfer problem is
+            integrated on its own time grid (larger steps or subcycling)
+            and the temperature is linearly interpolated at the hydrogen
+            transport times. If None, the hydrogen transport stepsize is
+            used. Only needed if transient is True. Defaults to None.
+        steady_state_tolerance (float, optional): if provided, the
+            temperature is frozen (and no longer solved for) as soon as its
+            relative change between two thermal steps is below this value.
+            Should only be used when sources and boundary conditions are
+            constant after the thermal transient. Defaults to None.
 
     Attributes:
         F (fenics.Form): the variational form of the heat transfer problem
@@ -31,6 +43,15 @@ class HeatTransferProblem(festim.Temperature):
         sources (list): contains festim.Source objects for volumetric heat
             sources
         boundary_conditions (list): contains festim.BoundaryConditions
+        T_thermal (fenics.Function): the temperature at the current thermal
+            time. Same as T if the heat transfer problem is not multirate.
+        T_thermal_n (fenics.Function): the temperature at the previous
+            thermal time. Same as T_n if the heat transfer problem is not
+            multirate.
+        dt (festim.Stepsize): the stepsize used for the thermal time grid
+        t (float): the current thermal time
+        t_n (float): the previous thermal time
+        frozen (bool): True if the thermal steady state has been reached
     """
 
     def __init__(
@@ -41,6 +62,8 @@ class HeatTransferProblem(festim.Temperature):
         relative_tolerance=1e-10,
         maximum_iterations=30,
         linear_solver=None,
+        stepsize=None,
+        steady_state_tolerance=None,
     ) -> None:
         super().__init__()
         self.transient = transient
@@ -49,6 +72,8 @@ class HeatTransferProblem(festim.Temperature):
         self.relative_tolerance = relative_tolerance
         self.maximum_iterations = maximum_iterations
         self.linear_solver = linear_solver
+        self.stepsize = stepsize
+        self.steady_state_tolerance = steady_state_tolerance
 
         self.F = 0
         self.v_T = None
@@ -56,6 +81,21 @@ class HeatTransferProblem(festim.Temperature):
         self.boundary_conditions = []
         self.sub_expressions = []
 
+        self.T_thermal = None
+        self.T_thermal_n = None
+        self.t = 0
+        self.t_n = 0
+        self.frozen = False
+        self.dt = None
+
+    @property
+    def multirate(self):
+        """True if the heat transfer problem is integrated on its own time
+        grid, independently of the hydrogen transport problem"""
+        return self.transient and (
+            self.stepsize is not None or self.steady_state_tolerance is not None
+        )
+
     # TODO rename initialise?
     def create_functions(self, materials, mesh, dt=None):
         """Creates functions self.T, self.T_n and test function self.v_T.
@@ -74,10 +114,35 @@ class HeatTransferProblem(festim.Temperature):
         self.T_n = f.Function(V, name="T_n")
         self.v_T = f.TestFunction(V)
 
+        self.t = 0
+        self.t_n = 0
+        self.frozen = False
+        if self.multirate:
+            self.T_thermal = f.Function(V, name="T_thermal")
+            self.T_thermal_n = f.Function(V, name="T_thermal_n")
+            # the thermal problem is integrated with its own stepsize
+            if self.stepsize is not None:
+                self.stepsize.initialise_value()
+                dt = self.stepsize
+            # a zero stepsize would never reach the hydrogen transport times
+            if dt is None or float(dt.value) <= 0:
+                raise ValueError(
+                    "the stepsize of the heat transfer problem must be "
+                    + "strictly positive"
+                )
+            self.dt = dt
+        else:
+            self.T_thermal = self.T
+            self.T_thermal_n = self.T_n
+
         if self.transient:
             ccode_T_ini = sp.printing.ccode(self.initial_value)
             self.initial_value = f.Expression(ccode_T_ini, degree=2, t=0)
             self.T_n.assign(f.interpolate(self.initial_value, V))
+            if self.multirate:
+                self.T.assign(self.T_n)
+                self.T_thermal.assign(self.T_n)
+                self.T_thermal_n.assign(self.T_n)
 
         self.define_variational_problem(materials, mesh, dt)
         self.create_dirichlet_bcs(mesh.surface_markers)
@@ -109,7 +174,7 @@ class HeatTransferProblem(festim.Temperature):
         """
 
         print("Defining variational problem heat transfers")
-        T, T_n = self.T, self.T_n
+        T, T_n = self.T_thermal, self.T_thermal_n
         v_T = self.v_T
 
         self.F = 0
@@ -166,7 +231,7 @@ class HeatTransferProblem(festim.Temperature):
         # Boundary conditions
         for bc in self.boundary_conditions:
             if isinstance(bc, festim.FluxBC):
-                bc.create_form(self.T, solute=None)
+                bc.create_form(T, solute=None)
 
                 # TODO: maybe that's not necessary
                 self.sub_expressions += bc.sub_expressions
@@ -186,7 +251,7 @@ class HeatTransferProblem(festim.Temperature):
         self.dirichlet_bcs = []
         for bc in self.boundary_conditions:
             if isinstance(bc, festim.DirichletBC) and bc.field == "T":
-                bc.create_expression(self.T)
+                bc.create_expression(self.T_thermal)
                 for surf in bc.surfaces:
                     bci = f.DirichletBC(V, bc.expression, surface_markers, surf)
                     self.dirichlet_bcs.append(bci)
@@ -201,21 +266,75 @@ class HeatTransferProblem(festim.Temperature):
             t (float): the time
         """
         if self.transient:
-            festim.update_expressions(self.sub_expressions, t)
-            # Solve heat transfers
-            dT = f.TrialFunction(self.T.function_space())
-            JT = f.derivative(self.F, self.T, dT)  # Define the Jacobian
-            problem = f.NonlinearVariationalProblem(
-                self.F, self.T, self.dirichlet_bcs, JT
-            )
-            solver = f.NonlinearVariationalSolver(problem)
-            newton_solver_prm = solver.parameters["newton_solver"]
-            newton_solver_prm["absolute_tolerance"] = self.absolute_tolerance
-            newton_solver_prm["relative_tolerance"] = self.relative_tolerance
-            newton_solver_prm["maximum_iterations"] = self.maximum_iterations
-            newton_solver_prm["linear_solver"] = self.linear_solver
-            solver.solve()
-            self.T_n.assign(self.T)
+            if self.multirate:
+                self.T_n.assign(self.T)
+                # advance the thermal problem until it reaches t
+                while self.t < t and not np.isclose(self.t, t) and not self.frozen:
+                    self.advance()
+                self.interpolate_in_time(t)
+            else:
+                festim.update_expressions(self.sub_expressions, t)
+                self.solve_once()
+                self.T_n.assign(self.T)
+
+    def advance(self):
+        """Advances the heat transfer problem of one thermal stepsize on its
+        own time grid. Freezes the temperature if the thermal steady state is
+        reached.
+        """
+        self.T_thermal_n.assign(self.T_thermal)
+        self.t_n = self.t
+        self.t += float(self.dt.value)
+
+        festim.update_expressions(self.sub_expressions, self.t)
+        nb_it, converged = self.solve_once()
+
+        if self.steady_state_tolerance is not None:
+            change = (self.T_thermal.vector() - self.T_thermal_n.vector()).norm("l2")
+            norm = self.T_thermal.vector().norm("l2")
+            if norm == 0 or change / norm < self.steady_state_tolerance:
+                print("Thermal steady state reached at t = {:.2e} s".format(self.t))
+                self.frozen = True
+
+        # the hydrogen transport stepsize is adapted by HTransportProblem
+        if self.stepsize is not None:
+            if (
+                self.stepsize.adaptive_stepsize is not None
+                or self.stepsize.all_milestones
+            ):
+                self.stepsize.adapt(self.t, nb_it, converged)
+
+    def interpolate_in_time(self, t):
+        """Linearly interpolates the temperature at time t between the two
+        last thermal times and assigns it to T
+
+        Args:
+            t (float): the time
+        """
+        if self.frozen or np.isclose(self.t, self.t_n) or t >= self.t:
+            self.T.assign(self.T_thermal)
+        else:
+            weight = max(t - self.t_n, 0) / (self.t - self.t_n)
+            self.T.assign((1 - weight) * self.T_thermal_n + weight * self.T_thermal)
+
+    def solve_once(self):
+        """Solves the non linear heat transfer problem
+
+        Returns:
+            int, bool: number of iterations for reaching convergence, True if
+                converged else False
+        """
+        T = self.T_thermal
+        dT = f.TrialFunction(T.function_space())
+        JT = f.derivative(self.F, T, dT)  # Define the Jacobian
+        problem = f.NonlinearVariationalProblem(self.F, T, self.dirichlet_bcs, JT)
+        solver = f.NonlinearVariationalSolver(problem)
+        newton_solver_prm = solver.parameters["newton_solver"]
+        newton_solver_prm["absolute_tolerance"] = self.absolute_tolerance
+        newton_solver_prm["relative_tolerance"] = self.relative_tolerance
+        newton_solver_prm["maximum_iterations"] = self.maximum_iterations
+        newton_solver_prm["linear_solver"] = self.linear_solver
+        return solver.solve()
 
     def is_steady_state(self):
         return not self.transient
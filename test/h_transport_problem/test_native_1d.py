@@ -0,0 +1,101 @@
+import festim
+import numpy as np
+import pytest
+
+
+def make_problem(traps=[], T=500, sources=[], transient=False):
+    my_settings = festim.Settings(
+        absolute_tolerance=1e-12,
+        relative_tolerance=1e-12,
+        transient=transient,
+        engine="native_1d",
+    )
+    mobile = festim.Mobile()
+    mobile.sources = sources
+    return festim.HTransportProblem1D(
+        mobile, festim.Traps(traps), festim.Temperature(T), my_settings, []
+    )
+
+
+def test_steady_diffusion_with_source():
+    """Checks that the native engine gives the exact nodal values of the
+    steady state diffusion with a uniform source (-D c'' = S)"""
+    vertices = np.linspace(0, 1, 51)
+    materials = festim.Materials([festim.Material(id=1, D_0=2, E_D=0)])
+    my_problem = make_problem(sources=[festim.Source(4, volume=1, field=0)])
+    my_problem.boundary_conditions = [
+        festim.DirichletBC(surfaces=[1, 2], value=0, field=0)
+    ]
+    my_problem.initialise(festim.MeshFromVertices(vertices), materials)
+
+    nb_it, converged = my_problem.solve_once()
+
+    assert converged
+    expected = vertices * (1 - vertices)
+    assert np.allclose(my_problem.get_field("solute"), expected, atol=1e-12)
+    total = my_problem.compute_derived_quantity(festim.TotalVolume("solute", 1))
+    # the P1 integral of the nodal values
+    assert total == pytest.approx(
+        np.sum(np.diff(vertices) * (expected[:-1] + expected[1:]) / 2)
+    )
+
+
+def test_fluxes_balance_source():
+    """Checks that the recombination and mass fluxes balance the source at
+    steady state with a trap"""
+    vertices = np.linspace(0, 1, 31)
+    materials = festim.Materials([festim.Material(id=1, D_0=2, E_D=0, name="mat")])
+    trap = festim.Trap(
+        k_0=1e-3, E_k=0.1, p_0=1e3, E_p=0.5, density=1 + festim.x, materials="mat"
+    )
+    my_problem = make_problem(
+        traps=[trap],
+        T=500 + 100 * festim.x,
+        sources=[festim.Source(1e3 * festim.x, volume=1, field=0)],
+    )
+    my_problem.boundary_conditions = [
+        festim.RecombinationFlux(Kr_0=1, E_Kr=0.1, order=2, surfaces=1),
+        festim.MassFlux(h_coeff=2, c_ext=0.5, surfaces=2),
+    ]
+    my_problem.initialise(festim.MeshFromVertices(vertices), materials)
+
+    nb_it, converged = my_problem.solve_once()
+
+    assert converged
+    c = my_problem.get_field("solute")
+    Kr = np.exp(-0.1 / festim.k_B / 500)
+    assert Kr * c[0] ** 2 + 2 * (c[-1] - 0.5) == pytest.approx(500)
+    assert my_problem.get_field("retention") == pytest.approx(
+        c + my_problem.get_field(1)
+    )
+    # no fenics Expression has been compiled
+    assert trap._density is None
+    assert my_problem.mobile.sources[0]._value is None
+
+
+def test_DG1_field_layout():
+    """Checks that the values are ordered as the dofs of a DG1 function"""
+    vertices = [0, 1, 3]
+    materials = festim.Materials([festim.Material(id=1, D_0=1, E_D=0)])
+    my_problem = make_problem()
+    my_problem.initialise(festim.MeshFromVertices(vertices), materials)
+
+    assert list(my_problem.get_DG1_field("x")) == [0, 1, 1, 3]
+
+
+def test_unsupported_features_raise_error():
+    """Checks that a NotImplementedError is raised for the features not
+    supported by the native engine"""
+    materials = festim.Materials([festim.Material(id=1, D_0=1, E_D=0)])
+    my_mesh = festim.MeshFromVertices([0, 1, 2], type="cylindrical")
+    with pytest.raises(NotImplementedError, match="meshes"):
+        make_problem().initialise(my_mesh, materials)
+
+    exports = festim.Exports([festim.XDMFExport("solute")])
+    with pytest.raises(NotImplementedError, match="XDMFExport"):
+        make_problem().check_exports(exports)
+
+
+def test_wrong_engine():
+    with pytest.raises(ValueError, match="engine"):
+        festim.Settings(absolute_tolerance=1, relative_tolerance=1, engine="foo")
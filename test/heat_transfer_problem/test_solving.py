@@ -29,3 +29,82 @@ def test_create_functions_linear_solver_mumps():
     my_problem.create_functions(materials=materials, mesh=mesh)
 
     assert my_problem.T(0.05) == pytest.approx(1)
+
+
+def test_multirate_temperature_is_interpolated():
+    """Checks that a heat transfer problem with its own (larger) stepsize is
+    solved on its own time grid and that the temperature is linearly
+    interpolated at the hydrogen transport time"""
+    mesh = festim.MeshFromRefinements(10, size=1)
+    materials = festim.Materials(
+        [festim.Material(id=1, D_0=1, E_D=0, thermal_cond=1, rho=1, heat_capacity=1)]
+    )
+    mesh.define_measures(materials)
+
+    my_problem = festim.HeatTransferProblem(
+        initial_value=300, stepsize=festim.Stepsize(4)
+    )
+    # the exact solution is T = 300 + 10*t
+    my_problem.boundary_conditions = [
+        festim.DirichletBC(surfaces=[1, 2], value=300 + 10 * festim.t, field="T")
+    ]
+    my_problem.sources = [festim.Source(10, volume=1, field="T")]
+    my_problem.create_functions(materials=materials, mesh=mesh, dt=festim.Stepsize(1))
+
+    my_problem.update(1)
+
+    assert my_problem.t == pytest.approx(4)
+    assert my_problem.T_thermal(0.5) == pytest.approx(340)
+    assert my_problem.T(0.5) == pytest.approx(310)
+    assert my_problem.T_n(0.5) == pytest.approx(300)
+
+    # no thermal solve is needed until t = 4
+    my_problem.update(2)
+    assert my_problem.t == pytest.approx(4)
+    assert my_problem.T(0.5) == pytest.approx(320)
+
+
+def test_multirate_temperature_frozen_at_steady_state():
+    """Checks that the heat transfer problem is no longer solved once the
+    thermal steady state is reached"""
+    mesh = festim.MeshFromRefinements(10, size=1)
+    materials = festim.Materials(
+        [festim.Material(id=1, D_0=1, E_D=0, thermal_cond=1, rho=1, heat_capacity=1)]
+    )
+    mesh.define_measures(materials)
+
+    my_problem = festim.HeatTransferProblem(
+        initial_value=300, steady_state_tolerance=1e-6
+    )
+    my_problem.boundary_conditions = [
+        festim.DirichletBC(surfaces=[1, 2], value=300, field="T")
+    ]
+    my_problem.create_functions(materials=materials, mesh=mesh, dt=festim.Stepsize(1))
+
+    my_problem.update(1)
+    assert my_problem.frozen
+    assert my_problem.t == pytest.approx(1)
+
+    my_problem.update(2)
+    assert my_problem.t == pytest.approx(1)
+    assert my_problem.T(0.5) == pytest.approx(300)
+
+
+def test_multirate_zero_stepsize_raises_error():
+    """Checks that an error is raised at initialisation if the stepsize of
+    the heat transfer problem is zero (the thermal problem would never reach
+    the hydrogen transport times)"""
+    mesh = festim.MeshFromRefinements(10, size=1)
+    materials = festim.Materials(
+        [festim.Material(id=1, D_0=1, E_D=0, thermal_cond=1, rho=1, heat_capacity=1)]
+    )
+    mesh.define_measures(materials)
+
+    my_problem = festim.HeatTransferProblem(
+        initial_value=300, stepsize=festim.Stepsize()
+    )
+
+    with pytest.raises(ValueError, match="strictly positive"):
+        my_problem.create_functions(
+            materials=materials, mesh=mesh, dt=festim.Stepsize(1)
+        )
@@ -227,3 +227,29 @@ class TestPostProcessing:
             times = festim.extract_xdmf_times(filename)
             assert len(times) == 1
             assert pytest.approx(float(times[0])) == my_sim.t
+
+    def test_txt_exports_share_projection(self, my_sim, tmpdir):
+        """Checks that the fields of TXTExports are only projected at the
+        export times and that exports of the same field share the projection
+        """
+        d = tmpdir.mkdir("test_folder")
+
+        my_sim.exports.exports = [
+            festim.TXTExport("retention", "retention_1", str(Path(d)), times=[1]),
+            festim.TXTExport("retention", "retention_2", str(Path(d)), times=[1]),
+        ]
+        my_sim.exports.V_DG1 = my_sim.V_DG1
+        my_sim.exports.final_time = 10
+
+        my_sim.t = 0.5
+        my_sim.run_post_processing()
+        for export in my_sim.exports.exports:
+            assert export.function is None
+
+        my_sim.t = 1
+        my_sim.run_post_processing()
+        export_1, export_2 = my_sim.exports.exports
+        assert festim.is_DG1_function(export_1.function)
+        assert export_1.function is export_2.function
+        for export in my_sim.exports.exports:
+            assert path.exists(export.filename)
@@ -1,4 +1,6 @@
 import festim as F
+import fenics as f
+import pytest
 
 
 def test_extrinsic_trap():
@@ -66,3 +68,51 @@ def test_neutron_induced_trap():
     # run simulation
     my_sim.initialise()
     my_sim.run()
+
+
+def test_monolithic_extrinsic_trap():
+    """Checks that the density of a monolithic neutron induced trap (solved
+    in the mixed function space) matches the one solved separately and that
+    the trapped concentrations are close"""
+
+    def run(monolithic):
+        my_sim = F.Simulation()
+        my_sim.mesh = F.MeshFromVertices([0, 1, 2, 3, 4])
+        my_sim.materials = F.Materials([F.Material(1, 1, 0, name="mat")])
+        trap = F.NeutronInducedTrap(
+            1,
+            0,
+            1,
+            0,
+            materials=["mat"],
+            phi=1 + F.x,
+            K=1,
+            n_max=10,
+            A_0=0,
+            E_A=0,
+            monolithic=monolithic,
+        )
+        my_sim.traps = F.Traps([trap])
+        my_sim.boundary_conditions = [
+            F.DirichletBC(surfaces=[1, 2], value=1, field="solute")
+        ]
+        my_sim.T = F.Temperature(100)
+        my_sim.settings = F.Settings(1e-10, 1e-10, final_time=10)
+        my_sim.dt = F.Stepsize(1)
+        my_sim.initialise()
+        my_sim.run()
+
+        components = my_sim.h_transport_problem.u.split()
+        if monolithic:
+            assert len(components) == 3
+            density = components[2]
+        else:
+            assert len(components) == 2
+            density = trap.density[0]
+        return f.assemble(density * f.dx), f.assemble(components[1] * f.dx)
+
+    density_monolithic, trapped_monolithic = run(monolithic=True)
+    density_split, trapped_split = run(monolithic=False)
+
+    assert density_monolithic == pytest.approx(density_split)
+    assert trapped_monolithic == pytest.approx(trapped_split, rel=1e-1)
@@ -252,3 +252,127 @@ def test_derived_quantities_exported_last_timestep_with_small_stepsize(tmp_path)
     my_model.run()
 
     assert os.path.exists(f"{tmp_path}/out.csv")
+
+
+def test_export_times_are_hit(tmp_path):
+    """Checks that the times of the exports are added to the milestones so
+    that the quantities are computed exactly at these times"""
+    my_model = F.Simulation()
+
+    my_model.mesh = F.MeshFromVertices(np.linspace(0, 1))
+    my_model.materials = F.Material(1, 1, 0)
+    my_model.settings = F.Settings(1e-10, 1e-10, final_time=1)
+    my_model.T = F.Temperature(500)
+    my_model.dt = F.Stepsize(0.3, stepsize_change_ratio=1.1, dt_min=1e-5)
+
+    times = [0.25, 0.5, 0.7]
+    derived_quantities = F.DerivedQuantities([F.TotalVolume("solute", 1)], times=times)
+    xdmf_export = F.XDMFExport(
+        "solute", folder=str(tmp_path), checkpoint=False, times=[0.4]
+    )
+    my_model.exports = [derived_quantities, xdmf_export]
+
+    my_model.initialise()
+    my_model.run()
+
+    assert derived_quantities.t == pytest.approx(times)
+    assert my_model.dt.all_milestones == [0.25, 0.4, 0.5, 0.7]
+    # the milestones given by the user are left untouched
+    assert my_model.dt.milestones is None
+    assert len(F.extract_xdmf_times(str(tmp_path / "mobile_concentration.xdmf"))) == 1
+
+
+def test_export_times_not_hit(tmp_path):
+    """Checks that the times of the exports are not added to the milestones
+    when hit_export_times is False"""
+    my_model = F.Simulation()
+
+    my_model.mesh = F.MeshFromVertices(np.linspace(0, 1))
+    my_model.materials = F.Material(1, 1, 0)
+    my_model.settings = F.Settings(1e-10, 1e-10, final_time=1)
+    my_model.T = F.Temperature(500)
+    my_model.dt = F.Stepsize(0.3, hit_export_times=False)
+    my_model.exports = [
+        F.TXTExport("solute", label="mobile", folder=str(tmp_path), times=[0.5])
+    ]
+
+    my_model.initialise()
+    my_model.run()
+
+    assert my_model.dt.all_milestones == []
+    assert my_model.t == pytest.approx(1)
+
+
+@pytest.mark.parametrize("transient", [True, False])
+def test_native_1d_engine_matches_fenics(transient, tmp_path):
+    """Checks that the native 1D engine gives the same derived quantities and
+    TXT exports as fenics for a two-materials problem with traps"""
+
+    def run(engine):
+        sim = F.Simulation()
+        sim.mesh = F.MeshFromRefinements(
+            200, size=1, refinements=[{"x": 0.1, "cells": 100}]
+        )
+        sim.materials = F.Materials(
+            [
+                F.Material(1, D_0=1, E_D=0.1, borders=[0, 0.5]),
+                F.Material(2, D_0=2, E_D=0.2, borders=[0.5, 1]),
+            ]
+        )
+        sim.traps = [
+            F.Trap(
+                k_0=[1, 2],
+                E_k=[0.1, 0.2],
+                p_0=[1e3, 1e3],
+                E_p=[0.5, 0.6],
+                density=[2, 1 + F.x],
+                materials=[sim.materials.materials[0], sim.materials.materials[1]],
+            ),
+        ]
+        sim.T = F.Temperature(500 + 100 * F.x)
+        sim.sources = [F.Source(1e2 * (F.x < 0.1), volume=1, field=0)]
+        sim.boundary_conditions = [
+            F.DirichletBC(surfaces=1, value=1, field=0),
+            F.RecombinationFlux(Kr_0=1, E_Kr=0, order=2, surfaces=2),
+        ]
+        derived_quantities = F.DerivedQuantities(
+            [
+                F.TotalVolume("retention", 1),
+                F.TotalVolume(1, 2),
+                F.AverageVolume("solute", 2),
+                F.MaximumVolume("solute", 1),
+                F.SurfaceFlux("solute", 1),
+                F.TotalSurface("solute", 2),
+            ]
+        )
+        txt_export = F.TXTExport(
+            "retention",
+            label=engine,
+            folder=str(tmp_path),
+            times=[10] if transient else None,
+        )
+        sim.exports = [derived_quantities, txt_export]
+        sim.settings = F.Settings(
+            absolute_tolerance=1e-10,
+            relative_tolerance=1e-10,
+            transient=transient,
+            final_time=10 if transient else None,
+            engine=engine,
+        )
+        if transient:
+            sim.dt = F.Stepsize(0.5)
+        sim.initialise()
+        sim.run()
+        return derived_quantities.data, np.genfromtxt(
+            txt_export.filename, delimiter=",", names=True
+        )
+
+    fenics_data, fenics_txt = run("fenics")
+    native_data, native_txt = run("native_1d")
+
+    assert native_data[0] == fenics_data[0]
+    assert np.array(native_data[1:]) == pytest.approx(
+        np.array(fenics_data[1:]), rel=1e-3
+    )
+    for name in fenics_txt.dtype.names:
+        assert native_txt[name] == pytest.approx(fenics_txt[name], rel=1e-3)
@@ -892,6 +892,215 @@ def test_steady_state_traps_not_everywhere():
     assert not np.isnan(my_sim.h_transport_problem.u.split()[1](0.5))
 
 
+@pytest.mark.parametrize("traps_element_type", ["CG", "DG"])
+def test_conglomerated_traps(traps_element_type):
+    """Checks that conglomerating traps in disjoint materials doesn't change
+    the trapped concentrations of each trap"""
+
+    def run(conglomerate):
+        my_materials = festim.Materials(
+            [
+                festim.Material(name="mat_1", id=1, D_0=1, E_D=0, borders=[0, 0.25]),
+                festim.Material(name="mat_2", id=2, D_0=1, E_D=0, borders=[0.25, 0.5]),
+                festim.Material(name="mat_3", id=3, D_0=1, E_D=0, borders=[0.5, 1]),
+            ]
+        )
+        traps = festim.Traps(
+            [
+                festim.Trap(1, 0, 1, 0, ["mat_1"], 1),
+                festim.Trap(2, 0, 1, 0, ["mat_3"], 2),
+            ],
+            conglomerate=conglomerate,
+        )
+        my_sim = festim.Simulation(
+            mesh=festim.MeshFromRefinements(20, 1),
+            materials=my_materials,
+            traps=traps,
+            temperature=festim.Temperature(1),
+            settings=festim.Settings(
+                absolute_tolerance=1e-10,
+                relative_tolerance=1e-9,
+                traps_element_type=traps_element_type,
+                final_time=5,
+            ),
+            dt=festim.Stepsize(1),
+            boundary_conditions=[festim.DirichletBC([1, 2], value=1, field=0)],
+        )
+        my_sim.initialise()
+        my_sim.run()
+        return my_sim, [
+            fenics.assemble(trap.post_processing_solution * my_sim.mesh.dx)
+            for trap in traps.traps
+        ]
+
+    sim_conglomerated, inventories_conglomerated = run(conglomerate=True)
+    _, inventories = run(conglomerate=False)
+
+    assert len(sim_conglomerated.h_transport_problem.u.split()) == 2
+    assert inventories_conglomerated == pytest.approx(inventories)
+    merged = sim_conglomerated.traps.fields[0]
+    assert merged.id == 3
+    for trap in sim_conglomerated.traps.traps:
+        assert trap.solution is merged.solution
+
+
+def test_max_quadrature_degree():
+    """Checks that the quadrature degrees of the H transport forms are capped
+    with a warning and reported"""
+    my_sim = festim.Simulation(
+        mesh=festim.MeshFromRefinements(10, 1),
+        materials=festim.Material(id=1, D_0=1, E_D=0.1, name="mat"),
+        traps=festim.Trap(1, 0.1, 1, 0.1, ["mat"], 1 + festim.x**2),
+        temperature=festim.Temperature(300 + 10 * festim.x),
+        settings=festim.Settings(
+            absolute_tolerance=1e-10,
+            relative_tolerance=1e-9,
+            transient=False,
+            quadrature_degree={"solute": 2},
+            max_quadrature_degree=3,
+        ),
+        boundary_conditions=[festim.DirichletBC([1], value=1, field=0)],
+    )
+    with pytest.warns(UserWarning, match="quadrature degree of the traps form"):
+        my_sim.initialise()
+    my_sim.run()
+
+    degrees = my_sim.h_transport_problem.quadrature_degrees
+    assert degrees["solute"]["used"] == 2
+    assert degrees["traps"]["used"] == 3
+    assert degrees["traps"]["estimated"] > 3
+
+
+def test_equilibrium_traps():
+    """Checks that the equilibrium mode gives the same inventories as the
+    kinetic model when trapping and detrapping are fast, with one field"""
+
+    def run(equilibrium):
+        traps = festim.Traps(
+            [
+                festim.Trap(1e4, 0, 1e4, 0, ["mat"], 1),
+                festim.Trap(1e4, 0, 5e3, 0, ["mat"], 2),
+            ]
+        )
+        my_sim = festim.Simulation(
+            mesh=festim.MeshFromRefinements(50, 1),
+            materials=festim.Material(id=1, D_0=1, E_D=0, name="mat"),
+            traps=traps,
+            temperature=festim.Temperature(300),
+            settings=festim.Settings(
+                absolute_tolerance=1e-10,
+                relative_tolerance=1e-9,
+                final_time=0.5,
+                equilibrium_traps=equilibrium,
+            ),
+            dt=festim.Stepsize(0.01),
+            boundary_conditions=[festim.DirichletBC([1], value=1, field=0)],
+        )
+        my_sim.initialise()
+        my_sim.run()
+        dx = my_sim.mesh.dx
+        return my_sim, [
+            fenics.assemble(trap.post_processing_solution * dx) for trap in traps.traps
+        ]
+
+    sim_equilibrium, inventories_equilibrium = run(equilibrium=True)
+    _, inventories = run(equilibrium=False)
+
+    assert sim_equilibrium.h_transport_problem.V.num_sub_spaces() == 0
+    assert inventories_equilibrium == pytest.approx(inventories, rel=1e-2)
+
+
+def test_quasi_steady_state_trap():
+    """Checks that setting a fast trap in quasi-steady state (while the
+    other trap stays kinetic) gives the same inventories as the kinetic
+    model"""
+
+    def run(quasi_steady_state):
+        traps = festim.Traps(
+            [
+                festim.Trap(
+                    1e4,
+                    0,
+                    1e4,
+                    0,
+                    ["mat"],
+                    1,
+                    quasi_steady_state=quasi_steady_state,
+                ),
+                festim.Trap(1, 0, 0.1, 0, ["mat"], 2),
+            ]
+        )
+        my_sim = festim.Simulation(
+            mesh=festim.MeshFromRefinements(50, 1),
+            materials=festim.Material(id=1, D_0=1, E_D=0, name="mat"),
+            traps=traps,
+            temperature=festim.Temperature(300),
+            settings=festim.Settings(
+                absolute_tolerance=1e-10,
+                relative_tolerance=1e-9,
+                final_time=0.5,
+            ),
+            dt=festim.Stepsize(0.01),
+            boundary_conditions=[festim.DirichletBC([1], value=1, field=0)],
+        )
+        my_sim.initialise()
+        my_sim.run()
+        dx = my_sim.mesh.dx
+        return my_sim, [
+            fenics.assemble(trap.post_processing_solution * dx) for trap in traps.traps
+        ]
+
+    sim_qss, inventories_qss = run(quasi_steady_state=True)
+    _, inventories = run(quasi_steady_state=False)
+
+    assert sim_qss.h_transport_problem.V.num_sub_spaces() == 2
+    assert inventories_qss == pytest.approx(inventories, rel=1e-2)
+
+
+def test_equilibrium_traps_with_extrinsic_trap():
+    """Checks that an error is raised if an extrinsic trap is assumed in
+    equilibrium"""
+    my_sim = festim.Simulation(
+        mesh=festim.MeshFromRefinements(10, 1),
+        materials=festim.Material(id=1, D_0=1, E_D=0, name="mat"),
+        traps=festim.NeutronInducedTrap(
+            1, 0, 1, 0, ["mat"], phi=1, K=1, n_max=1, A_0=0, E_A=0
+        ),
+        temperature=festim.Temperature(300),
+        settings=festim.Settings(
+            absolute_tolerance=1e-10,
+            relative_tolerance=1e-9,
+            final_time=1,
+            equilibrium_traps=True,
+        ),
+        dt=festim.Stepsize(0.1),
+    )
+    with pytest.raises(
+        ValueError, match="extrinsic traps can't be in quasi-steady state"
+    ):
+        my_sim.initialise()
+
+
+def test_quasi_steady_state_trap_with_source():
+    """Checks that an error is raised if a source is set on a trap in
+    quasi-steady state"""
+    my_sim = festim.Simulation(
+        mesh=festim.MeshFromRefinements(10, 1),
+        materials=festim.Material(id=1, D_0=1, E_D=0, name="mat"),
+        traps=festim.Trap(1, 0, 1, 0, "mat", density=1, quasi_steady_state=True),
+        sources=[festim.Source(1, volume=1, field="1")],
+        temperature=festim.Temperature(300),
+        settings=festim.Settings(
+            absolute_tolerance=1e-10, relative_tolerance=1e-9, final_time=1
+        ),
+        dt=festim.Stepsize(0.1),
+    )
+    with pytest.raises(
+        ValueError, match="sources can't be set on traps in quasi-steady state"
+    ):
+        my_sim.initialise()
+
+
 def test_no_jacobian_update():
     """Runs a transient sim and with the flag "update_jacobian" set to False."""
 
@@ -6,6 +6,8 @@ from festim import (
     TotalVolume,
     MaximumVolume,
     MinimumVolume,
+    MaximumSurface,
+    MinimumSurface,
     Materials,
 )
 import fenics as f
@@ -137,6 +139,8 @@ class TestCompute:
     tot_vol_1 = TotalVolume("trap1", 5)
     min_vol_1 = MinimumVolume("retention", 1)
     max_vol_1 = MaximumVolume("T", 1)
+    min_surf_1 = MinimumSurface("solute", 1)
+    max_surf_1 = MaximumSurface("solute", 2)
 
     mesh = f.UnitIntervalMesh(10)
     V = f.FunctionSpace(mesh, "P", 1)
@@ -180,7 +184,7 @@ class TestCompute:
         self.my_derv_quant.data = []
         self.my_derv_quant.compute(t)
 
-        assert self.my_derv_quant.data[0] == expected_data
+        assert self.my_derv_quant.data[0] == pytest.approx(expected_data)
 
     def test_two_quantities(self):
         self.my_derv_quant.derived_quantities = [
@@ -200,7 +204,7 @@ class TestCompute:
         self.my_derv_quant.data = []
         self.my_derv_quant.compute(t)
 
-        assert self.my_derv_quant.data[0] == expected_data
+        assert self.my_derv_quant.data[0] == pytest.approx(expected_data)
 
     def test_all_quantities(self):
         self.my_derv_quant.derived_quantities = [
@@ -227,7 +231,86 @@ class TestCompute:
         self.my_derv_quant.data = []
         self.my_derv_quant.compute(t)
 
-        assert self.my_derv_quant.data[0] == expected_data
+        assert self.my_derv_quant.data[0] == pytest.approx(expected_data)
+
+    def test_surface_extrema(self):
+        """Checks that the surface markers are given to MinimumSurface and
+        MaximumSurface"""
+        self.my_derv_quant.derived_quantities = [self.min_surf_1, self.max_surf_1]
+        for quantity in self.my_derv_quant.derived_quantities:
+            quantity.function = f.interpolate(
+                f.Expression("1 + x[0]", degree=1), self.V
+            )
+        self.my_derv_quant.assign_properties_to_quantities(self.my_mats)
+        self.my_derv_quant.assign_measures_to_quantities(self.dx, self.ds)
+        t = 2
+
+        self.my_derv_quant.data = []
+        self.my_derv_quant.compute(t)
+
+        assert self.my_derv_quant.data[0] == pytest.approx([t, 1, 2])
+
+    def test_integral_quantities_assembled_together(self):
+        self.my_derv_quant.derived_quantities = [
+            self.surface_flux_1,
+            self.average_vol_1,
+            self.tot_surf_1,
+            self.tot_vol_1,
+            self.min_vol_1,
+        ]
+        for quantity in self.my_derv_quant.derived_quantities:
+            quantity.function = self.label_to_function[quantity.field]
+        self.my_derv_quant.assign_properties_to_quantities(self.my_mats)
+        self.my_derv_quant.assign_measures_to_quantities(self.dx, self.ds)
+
+        values = self.my_derv_quant.assemble_integral_quantities()
+
+        assert self.min_vol_1 not in values
+        for quantity in [
+            self.surface_flux_1,
+            self.average_vol_1,
+            self.tot_surf_1,
+            self.tot_vol_1,
+        ]:
+            assert values[quantity] == pytest.approx(quantity.compute())
+
+    def test_compiled_form_reused_across_steps(self):
+        """Checks that the compiled form is reused as long as the functions
+        are the same objects and that the values follow the functions"""
+        my_derv_quant = DerivedQuantities([TotalVolume("solute", 1)])
+        quantity = my_derv_quant.derived_quantities[0]
+        c = f.Function(self.V)
+        quantity.function = c
+        my_derv_quant.assign_properties_to_quantities(self.my_mats)
+        my_derv_quant.assign_measures_to_quantities(self.dx, self.ds)
+
+        my_derv_quant.compile_forms()
+        form = my_derv_quant._form
+        for value in [1, 2, 3]:
+            c.assign(f.Constant(value))
+            values = my_derv_quant.assemble_integral_quantities()
+            assert values[quantity] == pytest.approx(value)
+            assert my_derv_quant._form is form
+
+        # a new function triggers a new compilation
+        quantity.function = f.interpolate(f.Constant(4), self.V)
+        values = my_derv_quant.assemble_integral_quantities()
+        assert values[quantity] == pytest.approx(4)
+        assert my_derv_quant._form is not form
+
+
+def test_add_row():
+    """Checks that add_row appends the values to the data of
+    DerivedQuantities and of each quantity"""
+    quantities = [TotalVolume("solute", 1), SurfaceFlux("solute", 2)]
+    my_derv_quant = DerivedQuantities(quantities)
+
+    my_derv_quant.add_row(2, [3, 4])
+
+    assert my_derv_quant.data[1] == [2, 3, 4]
+    assert my_derv_quant.t == [2]
+    assert quantities[0].data == [3] and quantities[1].data == [4]
+    assert quantities[0].t == [2] and quantities[1].t == [2]
 
 
 class TestWrite:
@@ -264,6 +347,25 @@ class TestWrite:
 
         assert os.path.exists(filename)
 
+    def test_write_appends_new_rows(self, folder, my_derived_quantities):
+        """Checks that successive calls to write() only append the new rows
+        and that the file is rewritten if data is replaced"""
+        filename = "{}/my_file.csv".format(folder)
+        my_derived_quantities.filename = filename
+        my_derived_quantities.write()
+        my_derived_quantities.data.append([4, 5.5, 1e-20])
+        my_derived_quantities.write()
+
+        with open(filename) as file:
+            assert file.read() == "a,b,c\n1,2,3\n1,2,3\n4,5.5,1e-20\n"
+
+        my_derived_quantities.data = [["d"], [1]]
+        my_derived_quantities.write()
+        my_derived_quantities.close()
+
+        with open(filename) as file:
+            assert file.read() == "d\n1\n"
+
 
 class TestFilter:
     """Tests the filter method of DerivedQUantities"""
@@ -320,6 +422,17 @@ class TestFilter:
         ) == [surf1, surf2]
 
 
+def test_is_compute_with_times():
+    """Checks that when times are given, the quantities are computed at these
+    times regardless of nb_iterations_between_compute"""
+    my_derv_quant = DerivedQuantities(times=[3, 1], nb_iterations_between_compute=2)
+
+    assert my_derv_quant.times == [1, 3]
+    assert my_derv_quant.is_compute(nb_iterations=1, t=1)
+    assert my_derv_quant.is_compute(nb_iterations=5, t=3)
+    assert not my_derv_quant.is_compute(nb_iterations=2, t=2)
+
+
 def test_wrong_type_filename():
     """Checks that an error is raised when filename is not a string"""
     with pytest.raises(TypeError, match="filename must be a string"):
@@ -1,4 +1,5 @@
 from festim import MaximumSurface
+import pytest
 import fenics as f
 import numpy as np
 
@@ -48,3 +49,31 @@ class TestCompute:
 
         produced = self.my_max.compute(self.surface_markers)
         assert produced == expected
+
+
+def test_compute_DG_function():
+    """Checks that the maximum of a DG function on a surface is computed
+    from the dofs of the adjacent cells located on the surface"""
+    mesh = f.UnitIntervalMesh(10)
+    V = f.FunctionSpace(mesh, "DG", 1)
+    c = f.interpolate(f.Expression("x[0]", degree=1), V)
+    surface_markers = f.MeshFunction("size_t", mesh, 0, 0)
+    f.CompiledSubDomain("near(x[0], 0.5)").mark(surface_markers, 1)
+
+    my_max = MaximumSurface("0", 1)
+    my_max.function = c
+
+    assert my_max.compute(surface_markers) == pytest.approx(0.5)
+
+
+def test_compute_no_dofs_raises_error():
+    """Checks that an error is raised when the surface has no dofs"""
+    mesh = f.UnitIntervalMesh(10)
+    V = f.FunctionSpace(mesh, "P", 1)
+    surface_markers = f.MeshFunction("size_t", mesh, 0, 0)
+
+    my_max = MaximumSurface("solute", 1)
+    my_max.function = f.Function(V)
+
+    with pytest.raises(ValueError, match="no dofs"):
+        my_max.compute(surface_markers)
@@ -48,3 +48,23 @@ class TestCompute:
 
         produced = self.my_max.compute(self.volume_markers)
         assert produced == expected
+
+    def test_subdomain_dofs_are_cached(self):
+        self.my_max.compute(self.volume_markers)
+        self.my_max.compute(self.volume_markers)
+        assert len(self.my_max._subdomain_dofs) == 1
+
+
+def test_maximum_volume_on_subspace():
+    """Checks that the maximum is computed on the right component of a
+    mixed function"""
+    mesh = f.UnitIntervalMesh(10)
+    V = f.VectorFunctionSpace(mesh, "P", 1, 2)
+    u = f.interpolate(f.Expression(("x[0]", "2 + x[0]"), degree=1), V)
+    volume_markers = f.MeshFunction("size_t", mesh, 1, 1)
+
+    my_max = MaximumVolume("solute", 1)
+    my_max.function = u.split()[0]
+    assert my_max.compute(volume_markers) == 1
+    my_max.function = u.split()[1]
+    assert my_max.compute(volume_markers) == 3
@@ -0,0 +1,90 @@
+import festim
+import fenics as f
+import numpy as np
+
+
+class TestProjectOnDG1:
+    mesh = f.UnitIntervalMesh(10)
+    V = f.FunctionSpace(mesh, "CG", 1)
+    V_DG1 = f.FunctionSpace(mesh, "DG", 1)
+    c_m = f.interpolate(f.Expression("x[0]*x[0]", degree=2), V)
+    c_t = f.interpolate(f.Expression("1 + x[0]", degree=1), V)
+    label_to_function = {"solute": c_m, "retention": c_m + c_t}
+
+    def make_exports(self):
+        my_exports = festim.Exports([])
+        my_exports.V_DG1 = self.V_DG1
+        my_exports.t = 0
+        return my_exports
+
+    def test_same_as_project(self):
+        my_exports = self.make_exports()
+        projection = my_exports.project_on_DG1("retention", self.label_to_function)
+        expected = f.project(self.label_to_function["retention"], self.V_DG1)
+
+        assert np.allclose(projection.vector()[:], expected.vector()[:])
+
+    def test_projected_once_per_step(self):
+        my_exports = self.make_exports()
+        projection = my_exports.project_on_DG1("retention", self.label_to_function)
+
+        # same time, the cached projection is returned
+        self.c_t.vector()[:] += 1
+        projection_2 = my_exports.project_on_DG1("retention", self.label_to_function)
+        assert projection_2 is projection
+        assert not np.allclose(
+            projection_2.vector()[:],
+            f.project(self.label_to_function["retention"], self.V_DG1).vector()[:],
+        )
+
+        # the cache is invalidated when the time changes
+        my_exports.t = 1
+        projection_3 = my_exports.project_on_DG1("retention", self.label_to_function)
+        assert np.allclose(
+            projection_3.vector()[:],
+            f.project(self.label_to_function["retention"], self.V_DG1).vector()[:],
+        )
+        self.c_t.vector()[:] -= 1
+
+    def test_DG1_function_not_projected(self):
+        my_exports = self.make_exports()
+        u = f.Function(self.V_DG1)
+        assert my_exports.project_on_DG1("T", {"T": u}) is u
+
+
+def test_flush_closes_derived_quantities_file(tmpdir):
+    """Checks that Exports.flush closes the csv files kept open by
+    DerivedQuantities"""
+    derived_quantities = festim.DerivedQuantities(
+        [], filename=str(tmpdir.join("derived_quantities.csv"))
+    )
+    derived_quantities.data = [["t(s)"], [0]]
+    derived_quantities.write()
+    my_exports = festim.Exports([derived_quantities])
+
+    my_exports.flush()
+
+    assert derived_quantities._file is None
+
+
+def test_reset_projections():
+    """Checks that the cached projections are not reused after
+    reset_projections (e.g. when the simulation is initialised again)"""
+    mesh = f.UnitIntervalMesh(10)
+    V = f.FunctionSpace(mesh, "CG", 1)
+    u = f.interpolate(f.Expression("x[0]", degree=1), V)
+    my_exports = festim.Exports([])
+    my_exports.V_DG1 = f.FunctionSpace(mesh, "DG", 1)
+    my_exports.t = 0
+    projection = my_exports.project_on_DG1("retention", {"retention": 2 * u})
+
+    my_exports.V_DG1 = f.FunctionSpace(mesh, "DG", 1)
+    my_exports.reset_projections()
+    new_projection = my_exports.project_on_DG1("retention", {"retention": 3 * u})
+
+    assert new_projection is not projection
+    assert new_projection.function_space() == my_exports.V_DG1
+    assert np.allclose(
+        new_projection.vector()[:],
+        f.project(3 * u, my_exports.V_DG1).vector()[:],
+    )
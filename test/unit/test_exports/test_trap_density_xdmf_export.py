@@ -143,3 +143,27 @@ def test_trap_density_xdmf_export_traps_materials_mixed(tmpdir):
     XDMFFile(str(Path(density_file))).read_checkpoint(density_read, "density1", -1)
     l2_error = errornorm(density_expected, density_read, "L2")
     assert l2_error < 2e-3
+
+
+def test_static_density_written_once(tmpdir):
+    """Checks that a time-independent density is only written once and that
+    a time-dependent one is written at every call"""
+    mesh = UnitIntervalMesh(10)
+    V_vector = VectorFunctionSpace(mesh, "DG", 1, 2)
+    volume_markers = MeshFunction("size_t", mesh, mesh.topology().dim(), 1)
+    dx = Measure("dx", domain=mesh, subdomain_data=volume_markers)
+    mat = festim.Material(1, 1, 1)
+
+    for density, nb_expected_times in [(2 + festim.x, 1), (2 + festim.t, 3)]:
+        trap = festim.Trap(1, 0, 1, 0, materials=mat, density=density)
+        density_file = str(Path(tmpdir.join("density.xdmf")))
+        my_export = festim.TrapDensityXDMF(
+            trap=trap, label="density", filename=density_file
+        )
+        function = Function(V_vector).sub(1)
+        for t in [1, 2, 3]:
+            my_export.function = function
+            my_export.write(t=t, dx=dx)
+            my_export.append = True
+
+        assert len(festim.extract_xdmf_times(density_file)) == nb_expected_times
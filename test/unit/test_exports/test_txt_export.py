@@ -1,5 +1,6 @@
 from festim import TXTExport, Stepsize
 import fenics as f
+import numpy as np
 import os
 import pytest
 from pathlib import Path
@@ -25,7 +26,13 @@ class TestWrite:
     @pytest.fixture
     def my_export(self, tmpdir):
         d = tmpdir.mkdir("test_folder")
-        my_export = TXTExport("solute", "solute_label", str(Path(d)), times=[1, 2, 3])
+        my_export = TXTExport(
+            "solute",
+            "solute_label",
+            str(Path(d)),
+            times=[1, 2, 3],
+            nb_exports_between_writes=1,
+        )
 
         return my_export
 
@@ -59,6 +66,45 @@ class TestWrite:
 
         assert os.path.exists("{}/{}.txt".format(my_export.folder, my_export.label))
 
+    def test_buffered_columns_same_file(self, my_export, function, tmpdir):
+        """Checks that buffering the columns and writing them at the last
+        export time gives the same file as writing at every export"""
+        d = tmpdir.mkdir("test_folder_buffered")
+        buffered_export = TXTExport(
+            "solute", "solute_label", str(Path(d)), times=[1, 2, 3]
+        )
+        for export in [my_export, buffered_export]:
+            export.function = function
+        for current_time in [1, 2, 3]:
+            function.vector()[:] = current_time
+            for export in [my_export, buffered_export]:
+                export.write(current_time=current_time, steady=False)
+            if current_time < 3:
+                assert not os.path.exists(buffered_export.filename)
+
+        with open(my_export.filename) as file:
+            expected = file.read()
+        with open(buffered_export.filename) as file:
+            assert file.read() == expected
+        assert expected.splitlines()[0] == "x,t=1s,t=2s,t=3s"
+
+    def test_write_values_same_file(self, my_export, function, tmpdir):
+        """Checks that writing the values of a field (native 1D engine) gives
+        the same file as writing the field"""
+        d = tmpdir.mkdir("test_folder_values")
+        values_export = TXTExport("solute", "solute_label", str(Path(d)), times=[1])
+        my_export.function = function
+        function.vector()[:] = 2
+        my_export.write(current_time=1, steady=False)
+
+        x = f.interpolate(f.Expression("x[0]", degree=1), my_export.V_DG1)
+        values_export.write_values(1, False, 2 * np.ones(20), x.vector()[:])
+
+        with open(my_export.filename) as file:
+            expected = file.read()
+        with open(values_export.filename) as file:
+            assert file.read() == expected
+
 
 class TestIsItTimeToExport:
     @pytest.fixture
@@ -151,3 +151,14 @@ def test_with_default_label():
         print("produced label : {}".format(produced))
         print("expected label : {}".format(expected))
         assert produced == expected
+
+
+def test_is_export_with_times():
+    """Checks that when times are given, the export is done at these times
+    regardless of mode"""
+    my_xdmf = XDMFExport("solute", "foo", times=[2, 1], mode=1)
+
+    assert my_xdmf.times == [1, 2]
+    assert my_xdmf.is_export(t=1, final_time=3, nb_iterations=5)
+    assert my_xdmf.is_export(t=2, final_time=3, nb_iterations=6)
+    assert not my_xdmf.is_export(t=1.5, final_time=3, nb_iterations=7)
@@ -5,9 +5,21 @@ from festim import (
     as_constant,
     as_expression,
     as_constant_or_expression,
+    set_quadrature_degree,
     t,
 )
-from fenics import Constant, Expression, UserExpression
+from fenics import (
+    Constant,
+    Expression,
+    UserExpression,
+    UnitSquareMesh,
+    FunctionSpace,
+    Function,
+    TestFunction,
+    exp,
+    dx,
+    ds,
+)
 
 
 def test_energy_converter():
@@ -61,3 +73,39 @@ def test_as_constant_or_expression():
             values[0] = x
 
     assert isinstance(as_constant_or_expression(CustomExpr()), UserExpression)
+
+
+class TestSetQuadratureDegree:
+    mesh = UnitSquareMesh(2, 2)
+    V = FunctionSpace(mesh, "CG", 1)
+    u = Function(V)
+    v = TestFunction(V)
+    form = exp(u) * v * dx + u * v * ds
+
+    def degrees(self, form):
+        return [
+            integral.metadata()["quadrature_degree"] for integral in form.integrals()
+        ]
+
+    def test_estimated_degrees(self):
+        form, estimated, used = set_quadrature_degree(self.form)
+        # exp(u) is estimated as a polynomial of degree 1 + 2
+        assert estimated == used == 4
+        # the form is untouched so that the form compiler parameters apply
+        assert form is self.form
+        assert all(
+            "quadrature_degree" not in integral.metadata()
+            for integral in form.integrals()
+        )
+
+    def test_degree(self):
+        form, estimated, used = set_quadrature_degree(self.form, degree=1)
+        assert self.degrees(form) == [1, 1]
+        assert estimated == 4
+        assert used == 1
+
+    def test_max_degree(self):
+        form, estimated, used = set_quadrature_degree(self.form, max_degree=3)
+        assert self.degrees(form) == [3, 2]
+        assert estimated == 4
+        assert used == 3
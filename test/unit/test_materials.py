@@ -2,6 +2,8 @@ from festim import Material, Materials
 import festim as F
 from fenics import *
 import pytest
+import numpy as np
+import time
 
 from festim.temperature.temperature_solver import HeatTransferProblem
 
@@ -300,3 +302,83 @@ def test_error_wrong_solubility_law_string():
         match="Acceptable values for solubility_law are 'henry' and 'sievert'",
     ):
         Material(1, 1, 1, solubility_law="foo")
+
+
+@pytest.mark.parametrize(
+    "materials",
+    [
+        [F.Material(1, 1, 0)],
+        [
+            F.Material(1, 1, 0, borders=[0, 0.5]),
+            F.Material(2, 1, 0, borders=[0.5, 1]),
+        ],
+        [F.Material([1, 2], 1, 0, borders=[[0, 0.25], [0.25, 1]])],
+        [F.Material(1, 1, 0, borders=[[0, 0.5], [0.7, 1]])],
+    ],
+)
+def test_find_subdomains_from_x_coordinates(materials):
+    """Checks that the vectorised find_subdomains_from_x_coordinates gives
+    the same results as find_subdomain_from_x_coordinate"""
+    my_mats = F.Materials(materials)
+    x = np.concatenate([np.linspace(-0.1, 1.1, num=97), [0, 0.25, 0.5, 0.7, 1]])
+
+    expected = [my_mats.find_subdomain_from_x_coordinate(x_) for x_ in x]
+    produced = my_mats.find_subdomains_from_x_coordinates(x)
+
+    assert np.array_equal(produced, expected)
+
+
+def test_find_subdomains_from_x_coordinates_large_array():
+    """Checks that the vectorised find_subdomains_from_x_coordinates gives
+    the same results as find_subdomain_from_x_coordinate on a large array
+    (see benchmarks/benchmark_volume_markers_1d.py for the timings)"""
+    my_mats = F.Materials(
+        [
+            F.Material([1, 2], 1, 0, borders=[[0, 0.3], [0.6, 1]]),
+            F.Material(3, 1, 0, borders=[0.3, 0.6]),
+        ]
+    )
+    x = np.linspace(0, 1, num=200000)
+
+    expected = [my_mats.find_subdomain_from_x_coordinate(x_) for x_ in x]
+    produced = my_mats.find_subdomains_from_x_coordinates(x)
+
+    assert np.array_equal(produced, expected)
+
+
+def test_create_solubility_law_markers():
+    """Checks that the henry and sievert markers are equal to one in the
+    cells of the corresponding materials and zero elsewhere"""
+    my_mesh = F.MeshFromVertices(np.linspace(0, 3, num=31))
+    materials = Materials(
+        [
+            Material(1, 1, 0, solubility_law="henry"),
+            Material([2, 3], 1, 0, solubility_law="sievert"),
+        ]
+    )
+    my_mesh.volume_markers = MeshFunction("size_t", my_mesh.mesh, 1, 0)
+    my_mesh.volume_markers.array()[:] = [1] * 10 + [2] * 10 + [3] * 10
+
+    materials.create_solubility_law_markers(my_mesh)
+
+    for x, henry, sievert in [(0.55, 1, 0), (1.55, 0, 1), (2.55, 0, 1)]:
+        assert materials.henry_marker(x) == pytest.approx(henry)
+        assert materials.sievert_marker(x) == pytest.approx(sievert)
+
+
+def test_solubility_as_function():
+    """Checks that solubility_as_function gives the solubility of each
+    material"""
+    my_mesh = F.MeshFromVertices(np.linspace(0, 2, num=21))
+    materials = Materials(
+        [
+            Material(1, 1, 0, S_0=2, E_S=0, borders=[0, 1]),
+            Material(2, 1, 0, S_0=3, E_S=0, borders=[1, 2]),
+        ]
+    )
+    my_mesh.define_measures(materials)
+
+    materials.solubility_as_function(my_mesh, Constant(300))
+
+    assert materials.S(0.55) == pytest.approx(2)
+    assert materials.S(1.55) == pytest.approx(3)
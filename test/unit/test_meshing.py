@@ -3,6 +3,7 @@ from festim import Materials, Material
 from festim import Mesh, Mesh1D, MeshFromRefinements, MeshFromVertices, MeshFromXDMF
 import fenics
 import pytest
+import os
 from pathlib import Path
 import numpy as np
 
@@ -306,3 +307,130 @@ def test_mesh_refinement_course_mesh():
         match="Infinite loop: Initial number " + "of cells might be too small",
     ):
         MeshFromRefinements(**mesh_parameters)
+
+
+def test_vectorised_markers_match_cell_by_cell_markers():
+    """Checks that Mesh1D markers are the same as the ones obtained by
+    iterating through the cells and facets"""
+    my_mesh = MeshFromRefinements(
+        initial_number_of_cells=50, size=1, refinements=[{"cells": 300, "x": 0.1}]
+    )
+    my_mats = Materials(
+        [
+            Material(id=1, D_0=None, E_D=None, borders=[0, 0.05]),
+            Material(id=2, D_0=None, E_D=None, borders=[0.05, 1]),
+        ]
+    )
+    my_mesh.define_markers(my_mats)
+
+    for cell in fenics.cells(my_mesh.mesh):
+        x = cell.midpoint().x()
+        expected = my_mats.find_subdomain_from_x_coordinate(x)
+        assert my_mesh.volume_markers[cell] == expected
+
+    for facet in fenics.facets(my_mesh.mesh):
+        x = facet.midpoint().x()
+        expected = 0
+        if fenics.near(x, 0):
+            expected = 1
+        if fenics.near(x, 1):
+            expected = 2
+        assert my_mesh.surface_markers[facet] == expected
+
+
+def test_mesh_from_refinements_same_as_fenics_refine():
+    """Checks that the vertices computed by MeshFromRefinements are the same
+    as the ones obtained by refining the mesh with fenics.refine"""
+    refinements = [{"cells": 300, "x": 0.1}, {"cells": 50, "x": 1e-3}]
+    my_mesh = MeshFromRefinements(10, size=1, refinements=refinements)
+
+    mesh = fenics.IntervalMesh(10, 0, 1)
+    nb_cells = 10
+    for refinement in refinements:
+        while len(mesh.cells()) < nb_cells + refinement["cells"]:
+            cell_markers = fenics.MeshFunction("bool", mesh, 1)
+            cell_markers.set_all(False)
+            for cell in fenics.cells(mesh):
+                if cell.midpoint().x() < refinement["x"]:
+                    cell_markers[cell] = True
+            mesh = fenics.refine(mesh, cell_markers)
+        nb_cells = len(mesh.cells())
+
+    assert np.allclose(
+        np.sort(my_mesh.mesh.coordinates()[:, 0]),
+        np.sort(mesh.coordinates()[:, 0]),
+    )
+
+
+def test_mesh_from_refinements_graded():
+    """Checks that a graded refinement gives the expected number of cells
+    and grading in [0, x]"""
+    my_mesh = MeshFromRefinements(
+        10, size=1, refinements=[{"cells": 20, "x": 0.2, "ratio": 1.2}]
+    )
+    vertices = np.sort(my_mesh.mesh.coordinates()[:, 0])
+    graded = vertices[vertices <= 0.2]
+    sizes = np.diff(graded)
+
+    assert len(graded) - 1 == 20
+    assert np.allclose(sizes[1:] / sizes[:-1], 1.2)
+    assert len(vertices) - 1 == 20 + 8
+
+
+def test_mesh_from_refinements_too_coarse():
+    with pytest.raises(ValueError, match="Infinite loop"):
+        MeshFromRefinements(1, size=1, refinements=[{"cells": 2, "x": 0.1}])
+
+
+def test_mesh_from_vertices_non_uniform():
+    """Checks that MeshFromVertices gives a mesh with the correct vertices
+    and that cells connect consecutive vertices"""
+    points = [0, 3, 0.5, 1e-3, 1, 0.5, 2]
+    my_mesh = MeshFromVertices(points)
+    mesh = my_mesh.mesh
+
+    expected_vertices = np.unique(points)
+    assert np.array_equal(np.sort(mesh.coordinates()[:, 0]), expected_vertices)
+
+    cell_sizes = [cell.volume() for cell in fenics.cells(mesh)]
+    assert np.allclose(np.sort(cell_sizes), np.sort(np.diff(expected_vertices)))
+
+
+def test_mesh_from_xdmf_cache(tmpdir):
+    """Checks that MeshFromXDMF writes a cache and that the mesh and
+    markers read from the cache are the same"""
+    mesh = fenics.UnitSquareMesh(10, 10)
+    mf_cells = fenics.MeshFunction("size_t", mesh, mesh.topology().dim(), 1)
+    fenics.CompiledSubDomain("x[0] < 0.5").mark(mf_cells, 2)
+    mf_facets = fenics.MeshFunction("size_t", mesh, mesh.topology().dim() - 1, 0)
+    fenics.CompiledSubDomain("on_boundary").mark(mf_facets, 3)
+
+    volume_file = str(Path(tmpdir.join("cell_file.xdmf")))
+    boundary_file = str(Path(tmpdir.join("facet_file.xdmf")))
+    cache_file = str(Path(tmpdir.join("cache/mesh.h5")))
+    fenics.XDMFFile(volume_file).write(mf_cells)
+    fenics.XDMFFile(boundary_file).write(mf_facets)
+
+    my_mesh = MeshFromXDMF(volume_file, boundary_file, cache_file=cache_file)
+    assert os.path.exists(cache_file)
+    assert my_mesh.is_cache_valid()
+
+    my_cached_mesh = MeshFromXDMF(volume_file, boundary_file, cache_file=cache_file)
+    assert my_cached_mesh.mesh.num_cells() == my_mesh.mesh.num_cells()
+    assert np.array_equal(
+        my_cached_mesh.volume_markers.array(), my_mesh.volume_markers.array()
+    )
+    assert np.array_equal(
+        my_cached_mesh.surface_markers.array(), my_mesh.surface_markers.array()
+    )
+
+    # the cache is invalidated if the source files change
+    fenics.XDMFFile(boundary_file).write(
+        fenics.MeshFunction("size_t", mesh, mesh.topology().dim() - 1, 0)
+    )
+    assert not my_mesh.is_cache_valid()
+
+
+def test_mesh_from_xdmf_cache_wrong_extension():
+    with pytest.raises(ValueError, match="cache_file must end with .h5"):
+        MeshFromXDMF("volume.xdmf", "boundary.xdmf", cache_file="cache.xdmf")
@@ -86,3 +86,56 @@ def test_next_milestone():
             if expected_milestone is not None
             else next_milestone is None
         )
+
+
+def test_stepsize_restored_after_milestone():
+    """Checks that a fixed stepsize reduced to hit a milestone is restored
+    afterwards"""
+    step_size = festim.Stepsize(1.0, milestones=[1.5])
+
+    step_size.adapt(1.0, nb_it=2, converged=True)
+    assert float(step_size.value) == pytest.approx(0.5)
+
+    step_size.adapt(1.5, nb_it=2, converged=True)
+    assert float(step_size.value) == pytest.approx(1.0)
+
+
+def test_initial_value_hits_first_milestone():
+    """Checks that the initial stepsize is reduced to hit the first milestone"""
+    step_size = festim.Stepsize(1.0, milestones=[0.25, 2.0])
+
+    assert float(step_size.value) == pytest.approx(0.25)
+    step_size.adapt(0.25, nb_it=2, converged=True)
+    assert float(step_size.value) == pytest.approx(1.0)
+
+
+def test_stepsize_not_restored_after_failed_step():
+    """Checks that a failed step is retried with a stepsize smaller than the
+    one reduced to hit a milestone (not with the restored one)"""
+    step_size = festim.Stepsize(
+        1.0, stepsize_change_ratio=2, dt_min=1e-5, milestones=[1.5]
+    )
+
+    step_size.adapt(1.0, nb_it=2, converged=True)
+    assert float(step_size.value) == pytest.approx(0.5)
+
+    step_size.adapt(1.0, nb_it=10, converged=False)
+    assert float(step_size.value) == pytest.approx(0.125)
+
+    # the milestone is still hit
+    step_size.adapt(1.125, nb_it=2, converged=True)
+    assert float(step_size.value) == pytest.approx(0.375)
+
+
+def test_export_times_hit_without_changing_milestones():
+    """Checks that the export times are hit without being added to the
+    milestones given by the user, unless hit_export_times is False"""
+    step_size = festim.Stepsize(1.0, milestones=[2.5])
+    step_size.export_times = [0.5, 2.5]
+
+    assert step_size.milestones == [2.5]
+    assert step_size.all_milestones == [0.5, 2.5]
+    assert step_size.next_milestone(0) == 0.5
+
+    step_size.hit_export_times = False
+    assert step_size.next_milestone(0) == 2.5
@@ -166,3 +166,34 @@ def test_temperature_from_xdmf_transient_case(tmpdir):
     my_model.settings.final_time = 10
     my_model.initialise()
     my_model.run()
+
+
+def test_temperature_from_xdmf_transient_interpolation(tmpdir):
+    """Checks that a transient TemperatureFromXDMF is linearly interpolated
+    between the checkpoints bracketing the current time"""
+    mesh = fenics.UnitIntervalMesh(10)
+    V = fenics.FunctionSpace(mesh, "CG", 1)
+    T_file = str(Path(tmpdir.join("T.xdmf")))
+    with fenics.XDMFFile(T_file) as file:
+        for i, (time, value) in enumerate([(0, 300), (1, 310), (3, 350)]):
+            T = fenics.interpolate(fenics.Constant(value), V)
+            file.write_checkpoint(
+                T, "T", time, fenics.XDMFFile.Encoding.HDF5, append=i > 0
+            )
+
+    my_mesh = festim.Mesh(mesh)
+    my_T = festim.TemperatureFromXDMF(filename=T_file, label="T", transient=True)
+    my_T.create_functions(my_mesh)
+    assert my_T.T(0.5) == pytest.approx(300)
+
+    my_T.update(0.5)
+    assert my_T.T(0.5) == pytest.approx(305)
+    assert my_T.T_n(0.5) == pytest.approx(300)
+
+    my_T.update(2)
+    assert my_T.T(0.5) == pytest.approx(330)
+
+    # after the last checkpoint the last value is used
+    my_T.update(10)
+    assert my_T.T(0.5) == pytest.approx(350)
+    assert not my_T.is_steady_state()
@@ -1,5 +1,6 @@
 import festim
 import fenics as f
+import pytest
 
 
 class TestExtrinsicTrap:
@@ -76,3 +77,70 @@ class TestExtrinsicTrap:
         self.my_trap.relative_tolerance = 1
         self.my_trap.maximum_iterations = 1
         self.my_trap.linear_solver = "mumps"
+
+
+def test_nodewise_density():
+    """Checks that the nodewise update of the density is the implicit Euler
+    step of the density ODE at each dof"""
+    mesh = f.UnitIntervalMesh(10)
+    V = f.FunctionSpace(mesh, "P", 1)
+    dt = festim.Stepsize(initial_value=2)
+    trap = festim.ExtrinsicTrap(
+        1,
+        1,
+        1,
+        1,
+        "mat_name",
+        phi_0=1 + festim.x,
+        n_amax=2,
+        n_bmax=3,
+        eta_a=3,
+        eta_b=4,
+        f_a=5,
+        f_b=6,
+        nodewise=True,
+    )
+    trap.density = [f.Function(V)]
+    trap.density_previous_solution = f.interpolate(f.Constant(1), V)
+
+    trap.solve_density(dt)
+
+    x = f.interpolate(f.Expression("x[0]", degree=1), V).vector().get_local()
+    phi_0 = 1 + x
+    expected = (1 + 2 * phi_0 * (3 * 5 + 4 * 6)) / (
+        1 + 2 * phi_0 * (3 * 5 / 2 + 4 * 6 / 3)
+    )
+    assert trap.density[0].vector().get_local() == pytest.approx(expected)
+
+
+def test_nodewise_and_monolithic_raise_error():
+    """Checks that a ValueError is raised if an extrinsic trap is both
+    nodewise and monolithic"""
+    with pytest.raises(ValueError, match="nodewise and monolithic"):
+        festim.ExtrinsicTrap(
+            1,
+            1,
+            1,
+            1,
+            "mat_name",
+            phi_0=1,
+            n_amax=2,
+            n_bmax=3,
+            eta_a=3,
+            eta_b=4,
+            f_a=5,
+            f_b=6,
+            nodewise=True,
+            monolithic=True,
+        )
+
+
+def test_nodewise_without_closed_form_raises_error():
+    """Checks that a ValueError is raised at construction if a nodewise
+    extrinsic trap has no closed-form density update"""
+
+    class CustomTrap(festim.ExtrinsicTrapBase):
+        pass
+
+    with pytest.raises(ValueError, match="no closed-form density update"):
+        CustomTrap(1, 1, 1, 1, "mat_name", nodewise=True)
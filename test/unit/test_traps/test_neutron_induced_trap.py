@@ -1,5 +1,6 @@
 import festim
 import fenics as f
+import pytest
 
 
 class TestNeutronInducedTrap:
@@ -169,3 +170,40 @@ class TestNeutronInducedTrapSolverParameters:
         self.my_trap.absolute_tolerance = 3.6
 
         assert self.my_trap.absolute_tolerance == expected_tolerance
+
+
+def test_nodewise_density_same_as_variational():
+    """Checks that the nodewise update of the density gives the same
+    densities as the variational problem when the coefficients are uniform
+    (neutron damage with annealing over several time steps)"""
+    mesh = f.UnitIntervalMesh(10)
+    V = f.FunctionSpace(mesh, "P", 1)
+    T = festim.Temperature(value=800)
+    T.T = f.interpolate(f.Constant(800), V)
+    dt = festim.Stepsize(initial_value=1e4)
+
+    densities = []
+    for nodewise in [False, True]:
+        trap = festim.NeutronInducedTrap(
+            1,
+            1,
+            1,
+            1,
+            "mat_name",
+            phi=9.64e-7,
+            K=3.5e28,
+            n_max=1e40,
+            A_0=6.18e-3,
+            E_A=0.24,
+            nodewise=nodewise,
+        )
+        trap.density = [f.Function(V)]
+        trap.density_previous_solution = f.Function(V)
+        trap.density_test_function = f.TestFunction(V)
+        trap.create_form_density(f.dx, dt, T)
+        for i in range(20):
+            trap.solve_density(dt, T)
+            trap.density_previous_solution.assign(trap.density[0])
+        densities.append(trap.density[0].vector().get_local())
+
+    assert densities[1] == pytest.approx(densities[0], rel=1e-8)
@@ -617,3 +617,36 @@ class TestCreateForm:
         print(my_trap.F)
         print(expected_form)
         assert my_trap.F.equals(expected_form)
+
+
+def test_density_is_time_dependent():
+    """Checks that the time dependency of the density is detected"""
+    mat = festim.Material(1, 1, 1)
+    assert not festim.Trap(1, 1, 1, 1, mat, density=1).density_is_time_dependent
+    assert not festim.Trap(
+        1, 1, 1, 1, mat, density=1 + festim.x
+    ).density_is_time_dependent
+    assert festim.Trap(1, 1, 1, 1, mat, density=1 + festim.t).density_is_time_dependent
+
+
+def test_equilibrium_concentration():
+    """Checks that the equilibrium trapped concentration balances trapping
+    and detrapping"""
+    trap = festim.Trap(
+        k_0=[2, 3],
+        E_k=[0.1, 0.2],
+        p_0=[4, 5],
+        E_p=[0.3, 0.4],
+        materials=["a", "b"],
+        density=[2, 3],
+    )
+    T, c_0 = 500, 1.5
+    for i in range(2):
+        k = trap.k_0[i] * f.exp(-trap.E_k[i] / festim.k_B / T)
+        p = trap.p_0[i] * f.exp(-trap.E_p[i] / festim.k_B / T)
+        n = [2, 3][i]
+        c_t = f.assemble(
+            trap.equilibrium_concentration(f.Constant(c_0), f.Constant(T), i)
+            * f.dx(domain=f.UnitIntervalMesh(2))
+        )
+        assert k * c_0 * (n - c_t) == pytest.approx(p * c_t)
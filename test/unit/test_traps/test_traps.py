@@ -128,3 +128,110 @@ class TestGetTrap:
         id = -2
         with pytest.raises(ValueError, match="Couldn't find trap {}".format(id)):
             self.my_traps.get_trap(id=id)
+
+
+class TestConglomerateTraps:
+    mesh = f.UnitIntervalMesh(6)
+    volume_markers = f.MeshFunction("size_t", mesh, 1, 1)
+    volume_markers.array()[2:4] = 2
+    volume_markers.array()[4:] = 3
+    my_mesh = festim.Mesh(mesh=mesh, volume_markers=volume_markers)
+    mat1 = festim.Material(1, 1, 0)
+    mat2 = festim.Material(2, 1, 0)
+    mat3 = festim.Material(3, 1, 0)
+
+    def make_traps(self, conglomerate=True):
+        trap1 = festim.Trap(1, 1, 1, 1, self.mat1, density=1)
+        trap2 = festim.Trap(2, 2, 2, 2, self.mat2, density=2)
+        trap3 = festim.Trap(3, 3, 3, 3, self.mat3, density=3)
+        trap4 = festim.Trap(4, 4, 4, 4, self.mat1, density=4)
+        return festim.Traps([trap1, trap2, trap3, trap4], conglomerate=conglomerate)
+
+    def test_dg_traps_are_merged(self):
+        """Checks that traps in disjoint materials share a field with DG
+        elements"""
+        my_traps = self.make_traps()
+        my_traps.conglomerate_traps(self.my_mesh, "DG")
+
+        assert len(my_traps.fields) == 2
+        merged, trap4 = my_traps.fields
+        assert trap4 is my_traps.traps[3]
+        assert merged.materials == [self.mat1, self.mat2, self.mat3]
+        assert merged.k_0 == [1, 2, 3]
+        assert merged.density == [trap.density[0] for trap in my_traps.traps[:3]]
+
+    def test_cg_traps_in_adjacent_materials_are_not_merged(self):
+        """Checks that with CG elements only the traps whose materials don't
+        share vertices are merged"""
+        my_traps = self.make_traps()
+        my_traps.conglomerate_traps(self.my_mesh, "CG")
+
+        assert len(my_traps.fields) == 3
+        merged, trap2, trap4 = my_traps.fields
+        assert merged.materials == [self.mat1, self.mat3]
+        assert trap2 is my_traps.traps[1]
+        assert trap4 is my_traps.traps[3]
+
+    def test_excluded_traps_are_not_merged(self):
+        my_traps = self.make_traps()
+        my_traps.conglomerate_traps(self.my_mesh, "DG", excluded=[my_traps.traps[0]])
+
+        assert len(my_traps.fields) == 2
+        assert my_traps.fields[0] is my_traps.traps[0]
+        assert my_traps.fields[1].materials == [self.mat2, self.mat3]
+
+    def test_no_conglomeration(self):
+        my_traps = self.make_traps(conglomerate=False)
+        my_traps.conglomerate_traps(self.my_mesh, "DG")
+
+        assert my_traps.fields == my_traps.traps
+
+    def test_no_conglomeration_by_default(self):
+        assert not festim.Traps([]).conglomerate
+
+    def test_merged_traps_have_new_ids(self):
+        """Checks that the conglomerates are given ids that don't clash with
+        the ids of the traps"""
+        my_traps = self.make_traps()
+        my_traps.conglomerate_traps(self.my_mesh, "CG")
+
+        assert my_traps.fields[0].id == 5
+        assert [field.id for field in my_traps.fields[1:]] == [2, 4]
+
+
+def test_suggest_quasi_steady_state():
+    """Checks that only the kinetic traps detrapping much faster than the
+    stepsize are suggested for quasi-steady state"""
+    mat = festim.Material(1, 1, 0)
+    fast_trap = festim.Trap(1, 0, 1e13, 0.1, mat, 1)
+    slow_trap = festim.Trap(1, 0, 1e13, 2, mat, 1)
+    qss_trap = festim.Trap(1, 0, 1e13, 0.1, mat, 1, quasi_steady_state=True)
+    my_traps = festim.Traps([fast_trap, slow_trap, qss_trap])
+
+    my_temp = festim.Temperature(300)
+    my_temp.create_functions(festim.MeshFromVertices([0, 1, 2]))
+    dt = festim.Stepsize(1)
+
+    with pytest.warns(UserWarning, match="Trap 1 detraps in"):
+        suggested = my_traps.suggest_quasi_steady_state(my_temp, dt)
+    assert suggested == [fast_trap]
+    assert my_traps.fields == [fast_trap, slow_trap]
+    assert my_traps.quasi_steady_state_traps == [qss_trap]
+
+
+def test_suggest_quasi_steady_state_non_constant_properties():
+    """Checks that the traps whose p_0 or E_p aren't scalar constants are
+    not considered for quasi-steady state"""
+    mat = festim.Material(1, 1, 0)
+    sympy_trap = festim.Trap(1, 0, 1e13 * (1 + festim.t), 0.1, mat, 1)
+    expression_trap = festim.Trap(1, 0, 1e13, f.Expression("0.1", degree=0), mat, 1)
+    constant_trap = festim.Trap(1, 0, f.Constant(1e13), 0.1, mat, 1)
+    my_traps = festim.Traps([sympy_trap, expression_trap, constant_trap])
+
+    my_temp = festim.Temperature(300)
+    my_temp.create_functions(festim.MeshFromVertices([0, 1, 2]))
+    dt = festim.Stepsize(1)
+
+    with pytest.warns(UserWarning, match="Trap 3 detraps in"):
+        suggested = my_traps.suggest_quasi_steady_state(my_temp, dt)
+    assert suggested == [constant_trap]